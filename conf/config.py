@@ -1,26 +1,37 @@
 
 import os
+import tempfile
 
 # 获取项目根目录路径
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # 如果是放在 conf 目录下，获取项目根目录可能需要调整，比如：
 # PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 测试数据根目录
+TEST_DATA_DIR = os.path.join(PROJECT_ROOT, 'tests', 'data')
+
+# 上传文件大小上限（门户限制 10 MB）
+UPLOAD_SIZE_LIMIT = 10 * 1024 * 1024
+# 按需生成的指定大小测试文件缓存目录
+SIZED_FILE_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'wyf_sized_files')
+
 # 定义数据文件路径常量
+# 注：large.png / 10M.jpg 不随仓库提交，大小边界用例请使用 tests.utils.sized_file_factory.sized_file 生成
 LARGE_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'large.png')
 EXACTLY_10M_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', '10M.jpg')
-HTML_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.html')
-JPEG_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.jpeg')
-JPEG_FIRE_SAFETY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.jpeg')
-JPEG_PUBLIC_SECURITY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.jpeg')
-JPG_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.jpg')
-PDF_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.pdf')
-PHP_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.php')
-PNG_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.png')
-PY_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.py')
-SVG_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.svg')
-TXT_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.txt')
-ZIP_PROPERTY_CERTIFICATE = os.path.join(PROJECT_ROOT, 'tests', 'data', 'evidence_files', 'lease.zip')
+# 证明材料按属性描述，上传前由 tests.utils.fixture_catalog.fixture_path 在 tests/data 索引中查找
+HTML_PROPERTY_CERTIFICATE = {"category": "evidence_files", "extension": ".html"}
+JPEG_PROPERTY_CERTIFICATE = {"category": "evidence_files", "mime": "image/jpeg", "valid": True}
+JPEG_FIRE_SAFETY_CERTIFICATE = {"category": "evidence_files", "mime": "image/jpeg", "valid": True}
+JPEG_PUBLIC_SECURITY_CERTIFICATE = {"category": "evidence_files", "mime": "image/jpeg", "valid": True}
+JPG_PROPERTY_CERTIFICATE = {"category": "evidence_files", "extension": ".jpg"}
+PDF_PROPERTY_CERTIFICATE = {"category": "evidence_files", "extension": ".pdf"}
+PHP_PROPERTY_CERTIFICATE = {"category": "evidence_files", "extension": ".php"}
+PNG_PROPERTY_CERTIFICATE = {"category": "evidence_files", "extension": ".png"}
+PY_PROPERTY_CERTIFICATE = {"category": "evidence_files", "extension": ".py"}
+SVG_PROPERTY_CERTIFICATE = {"category": "evidence_files", "extension": ".svg"}
+TXT_PROPERTY_CERTIFICATE = {"category": "evidence_files", "extension": ".txt"}
+ZIP_PROPERTY_CERTIFICATE = {"category": "evidence_files", "extension": ".zip"}
 
 # 证件文件
 LARGE_ID_CARD =  os.path.join(PROJECT_ROOT, 'tests', 'data', 'id_card_files', 'large.png')
@@ -90,3 +101,141 @@ COMMON_minsu_PARAMS = {
     "back_image": JPG_ID_CARD
 }
 
+
+# 网络拦截配置：按测试标记选择拦截方案，表单校验类用例无需加载图片、字体、地图瓦片和统计脚本
+# abort_resource_types: 直接中止的资源类型（Playwright request.resource_type）
+# abort_url_patterns / stub_url_patterns: URL 正则，stub 返回空响应以免页面脚本报错
+NETWORK_PROFILES = {
+    "validation": {
+        "abort_resource_types": ["image", "font", "media"],
+        "abort_url_patterns": [
+            r"\.(png|jpe?g|gif|webp|svg|ico|woff2?|ttf|eot|otf)(\?|$)",
+            r"//(webrd|webst|wprd)\d*\.is\.autonavi\.com/",
+            r"//api\.map\.baidu\.com/.*(tile|images)",
+        ],
+        "stub_url_patterns": [
+            r"//hm\.baidu\.com/",
+            r"//(www\.)?google-analytics\.com/",
+            r"//(www\.)?googletagmanager\.com/",
+            r"//s\d*\.cnzz\.com/",
+        ],
+    },
+}
+
+# 测试标记与拦截方案的对应关系，未列出的标记不做拦截
+MARKER_NETWORK_PROFILES = {
+    "room": "validation",
+    "register": "validation",
+    "login": "validation",
+}
+
+# 静态资源本地缓存：各 BrowserContext / 并发进程共享，按内容哈希存储
+ASSET_CACHE_DIR = os.path.join(PROJECT_ROOT, '.cache', 'assets')
+# 参与缓存的资源类型与 URL 规则（只缓存与页面同源的门户自身 JS/CSS 打包文件，第三方资源不缓存）
+ASSET_CACHE_RESOURCE_TYPES = ["script", "stylesheet"]
+ASSET_CACHE_URL_PATTERNS = [
+    r"/static/.+\.(js|css)(\?|$)",
+    r"/(js|css)/.+\.(js|css)(\?|$)",
+]
+
+# HAR 录制/回放：每个用例一个 HAR 文件，回放时不依赖门户与数据库
+HAR_DIR = os.path.join(PROJECT_ROOT, 'tests', 'data', 'har')
+# 匹配请求时忽略取值的易变字段（时间戳、随机数、令牌等），录制后统一替换为占位值
+HAR_VOLATILE_QUERY_PARAMS = ["_", "_t", "t", "timestamp", "nonce", "random"]
+HAR_VOLATILE_BODY_FIELDS = ["timestamp", "nonce", "uuid", "token", "requestId"]
+HAR_VOLATILE_PLACEHOLDER = "__volatile__"
+
+# 短信验证码获取方式：ssh_tail（实时 tail 日志）、incremental（增量读取日志）、stub（本地拦截，固定验证码）
+SMS_CODE_PROVIDER = os.environ.get("SMS_CODE_PROVIDER", "ssh_tail")
+# 房东端 tomcat 所在服务器，短信验证码写入其 catalina.out
+SMS_LOG_SSH = {
+    "hostname": "192.168.40.61",
+    "username": "root",
+    "password": "dell_123456",
+    "port": 22,
+}
+SMS_LOG_PATH = "/opt/tomcat8.5.84-wyf-fd-3333/logs/catalina.out"
+SMS_CODE_TIMEOUT = 70
+# stub 方式拦截的发送验证码接口与返回的固定验证码
+SMS_SEND_CODE_URL_PATTERN = r"/(sendSms|sendCode|sms/send|captchaSms)\b"
+SMS_STUB_CODE = "123456"
+
+# 测试数据库连接（房东端、公安端两个库结构相同）
+DB_CONFIG = {
+    "host": "192.168.40.60",
+    "port": 3307,
+    "user": "root",
+    "password": "Cjzx_123456",
+    "charset": "utf8mb4",
+}
+DB_NAMES = ["us_wyfjgpt_fd", "us_wyfjgpt_ga"]
+
+# 场景检查点：前置场景的数据行与登录态在会话内只构造一次，之后按检查点复制或还原
+SCENARIO_CHECKPOINT_DIR = os.path.join(PROJECT_ROOT, '.cache', 'checkpoints')
+# 场景涉及的表，父表在前：根表按名称列查找，子表按外键关联父表主键；
+# unique_columns 为有唯一约束的业务列，clone 时重新生成
+SCENARIO_CHECKPOINT_TABLES = [
+    {"table": "t_fwgl_minsu", "key": "id", "name_column": "msmc", "unique_columns": ["ba_bh"]},
+    {"table": "t_fwgl_fjgl", "key": "id", "name_column": "fjmc", "parent": "t_fwgl_minsu", "parent_column": "ms_id"},
+]
+
+# 测试身份数据分配（手机号、用户名、身份证号），多进程共享同一 SQLite 文件
+IDENTITY_DB_PATH = os.path.join(PROJECT_ROOT, '.cache', 'identity.sqlite3')
+IDENTITY_PHONE_START = 13810135777
+# 发送验证码后同一手机号的冷却时间（秒）
+SMS_SEND_COOLDOWN = 70
+
+# 性能测试：报告目录与报告中输出的延迟分位数
+PERF_REPORT_DIR = os.path.join(PROJECT_ROOT, 'reports', 'perf')
+PERF_PERCENTILES = (50, 90, 95, 99)
+# 查询接口基准测试：录制的请求（含登录凭据）保存目录，以及表示每页条数的参数名
+SEARCH_CAPTURE_DIR = os.path.join(PROJECT_ROOT, '.cache', 'search_captures')
+SEARCH_PAGE_SIZE_PARAMS = ["pageSize", "page_size", "size", "limit", "rows"]
+
+# 前端性能指标：每次导航的指标追加到历史文件，与最近若干次的中位数比较
+PERF_METRICS_HISTORY = os.path.join(PROJECT_ROOT, '.cache', 'perf_metrics', 'navigation_history.jsonl')
+PERF_METRICS_BASELINE_RUNS = 10
+# 超过基线的倍数且绝对差值超过阈值（毫秒）才判定为变慢，避免小数值抖动误报
+PERF_METRICS_REGRESSION_RATIO = 1.5
+PERF_METRICS_REGRESSION_MIN_MS = 300
+# 整页导航后等待 load 事件的最长时间（毫秒）；单页内跳转不等待，耗时由性能条目计算
+PERF_METRICS_SETTLE_TIMEOUT = 3000
+
+# 上传耗时分析：文件大小档位（字节）与各上传控件的文件类型
+UPLOAD_PROFILE_SIZES = [100 * 1024, 500 * 1024, 1024 * 1024, 2 * 1024 * 1024, 5 * 1024 * 1024, UPLOAD_SIZE_LIMIT]
+UPLOAD_PROFILE_CERTIFICATE_FORMATS = ["png", "jpeg", "pdf"]
+UPLOAD_PROFILE_IMAGE_FORMATS = ["png", "jpeg"]
+
+# 用例收集耗时预算（秒）与超出预算时列出的最慢模块数量
+COLLECTION_TIME_BUDGET = 3.0
+COLLECTION_SLOWEST_MODULES = 5
+
+# 常驻浏览器服务：状态文件目录（记录 ws 地址与进程号）、启动超时（秒）与连接超时（毫秒）
+BROWSER_SERVER_DIR = os.path.join(PROJECT_ROOT, '.cache', 'browser_server')
+BROWSER_SERVER_START_TIMEOUT = 60
+BROWSER_SERVER_CONNECT_TIMEOUT = 5000
+# 本地启动浏览器（包括连接常驻服务失败时的回退）是否无头
+BROWSER_HEADLESS = True
+
+# 页面直达路由：逻辑页面 -> SPA 路径、菜单路径与就绪标志（页面加载完成后出现的按钮名称）
+# 键与导航指标标签一致。path 只填写已确认的地址栏路径；为 None 时首次 open() 依次点击 menu 中的菜单项
+# （房东端为 el-menu 的 menuitem，公安端首页为文字链接，两种都可），
+# 把跳转后的实际路径记入 PAGE_ROUTE_CACHE，之后直接打开。门户路由调整时删除缓存文件即可重新记录
+PAGE_ROUTES = {
+    # 首页"备案民宿"按钮跳转到该地址（见 HomePage.tip_without_registed_room_dialog_option）
+    "fd:民宿管理": {"path": "/fangwu_fangdong/minsu", "menu": ["房屋管理", "民宿管理"], "ready_button": "新增民宿"},
+    # 点击"房屋管理"菜单后默认进入民宿列表（见 HomePage.navigate_to_house_manage_page）
+    "fd:房屋管理": {"path": None, "menu": ["房屋管理"], "ready_button": "新增民宿"},
+    "fd:房间管理": {"path": None, "menu": ["房屋管理", "房间管理"], "ready_button": "备案房间"},
+    "fd:楼宇管理": {"path": None, "menu": ["房屋管理", "楼宇管理"], "ready_button": "新增楼宇"},
+    # 公安端首页的"备案管理"链接（见 GAHomePage.navigate_to_other_page）
+    "ga:备案管理": {"path": None, "menu": ["备案管理"], "ready_button": "搜索"},
+}
+PAGE_ROUTE_CACHE = os.path.join(PROJECT_ROOT, '.cache', 'page_routes.json')
+# 直达页面后等待就绪标志出现的最长时间（毫秒）
+ROUTE_READY_TIMEOUT = 15000
+
+# 预热页面池（每个 xdist 进程一个）：页面总数上限、单个页面复用次数上限、借出超过多少秒视为泄漏
+PAGE_POOL_CAPACITY = 4
+PAGE_POOL_MAX_USES = 50
+PAGE_POOL_LEAK_TIMEOUT = 300
@@ -0,0 +1,11 @@
+# 项目级 pytest 插件注册
+pytest_plugins = [
+    "tests.plugins.network_profile",
+    "tests.plugins.asset_cache",
+    "tests.plugins.har_replay",
+    "tests.plugins.scenario_checkpoint",
+    "tests.plugins.perf_metrics",
+    "tests.plugins.collection_budget",
+    "tests.plugins.browser_server",
+    "tests.plugins.page_pool",
+]
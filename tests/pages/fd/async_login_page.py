@@ -0,0 +1,57 @@
+from playwright.async_api import Page
+
+from tests.utils.async_page_utils import check_alert_text, fill_textbox, get_element_corresponding_error_tip
+
+_ERROR_XPATH = '../following-sibling::div[contains(@class, "el-form-item__error")]'
+
+
+class AsyncLoginPage:
+    """LoginPage 的 asyncio 版本，方法与 LoginPage 一一对应"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.username = page.get_by_role("textbox", name="账号")
+        self.password = page.get_by_role("textbox", name="密码")
+        self.login_button = page.get_by_role("button", name="登 录")
+        self.error_elements = self.page.locator('[class*="el-form-item__error"]')
+
+    async def navigate(self, fd_base_url: str):
+        await self.page.goto(f"{fd_base_url}/login")
+
+    async def fill_username(self, login_username: str, test_fields: str = None):
+        await fill_textbox(self.page, "账号", login_username)
+        if test_fields == "login_username":
+            await self.username.blur()
+
+    async def fill_password(self, login_password: str, test_fields: str = None):
+        await fill_textbox(self.page, "密码", login_password)
+        if test_fields == "login_password":
+            await self.password.blur()
+
+    async def fill_credentials(self, login_username: str, login_password: str, test_fields: str = None):
+        await fill_textbox(self.page, "账号", login_username)
+        await fill_textbox(self.page, "密码", login_password)
+        if test_fields == "login_password":
+            await self.password.blur()
+
+    async def click_login_button(self):
+        await self.login_button.click()
+
+    async def login(self, fd_base_url: str, login_username: str, login_password: str):
+        """打开登录页、填写账号密码并登录，等待跳转完成"""
+        await self.navigate(fd_base_url)
+        await self.fill_credentials(login_username, login_password)
+        await self.click_login_button()
+        await self.page.wait_for_load_state("networkidle")
+
+    async def login_username_error(self, message: str) -> bool:
+        """检查账号输入框是否显示指定的错误提示"""
+        return await get_element_corresponding_error_tip(self.username, _ERROR_XPATH, message)
+
+    async def login_password_error(self, message: str) -> bool:
+        """检查密码输入框是否显示指定的错误提示"""
+        return await get_element_corresponding_error_tip(self.password, _ERROR_XPATH, message)
+
+    async def login_error(self, message: str) -> bool:
+        is_matched, actual_text = await check_alert_text(self.page, message)
+        return is_matched
@@ -0,0 +1,227 @@
+import asyncio
+import re
+
+from playwright.async_api import Page
+
+from conf.config import ROUTE_READY_TIMEOUT
+from conf.logging_config import logger
+from tests.utils.async_page_utils import (
+    check_alert_text,
+    checkTipDialog,
+    get_label_corresponding_input,
+    get_table_cell_or_button,
+    operation_alert_error,
+    query_target_name_index,
+    query_target_name_tr,
+)
+from tests.utils.lifecycle_model import MINSU_LIFECYCLE, minsu_state
+from tests.utils.routes import route_url
+
+
+class AsyncMinsuManagementPage:
+    """MinsuManagementPage 的 asyncio 版本，表格列与操作流程与同步版本一致"""
+
+    ROOM_NUMBER_COLUMN = 7
+    FILING_STATUS_COLUMN = 8
+    OPERATION_COLUMN = 9
+
+    def __init__(self, page: Page):
+        self.page = page
+
+        self.minsu_name_search_input = self.page.get_by_role("textbox", name="请输入民宿名称")
+        self.search_button = self.page.get_by_role("button", name="搜索")
+        self.reset_button = self.page.get_by_role("button", name="重置")
+        self.add_minsu_button = self.page.get_by_role("button", name=" 新增民宿")
+
+    async def open(self, fd_base_url: str):
+        """直接打开民宿管理页面（地址见 PAGE_ROUTES["fd:民宿管理"]），等待"新增民宿"按钮出现"""
+        await self.page.goto(route_url("fd:民宿管理", fd_base_url))
+        await self.page.get_by_role("button", name="新增民宿").first.wait_for(timeout=ROUTE_READY_TIMEOUT)
+        return self
+
+    async def query_minsu(self, minsu_name: str) -> int | None:
+        """查询民宿所在行的位置（从1开始），未找到返回 None"""
+        if not minsu_name:
+            return None
+        return await query_target_name_index(self.page, "民宿", minsu_name)
+
+    async def go_to_room_list(self):
+        """点击第一行的房间数量，进入房间列表页面"""
+        try:
+            room_num_cell = await get_table_cell_or_button(self.page, 0, self.ROOM_NUMBER_COLUMN)
+            await room_num_cell.locator("//span").click(timeout=3000)
+            await self.page.wait_for_load_state("networkidle", timeout=30000)
+            logger.info("✅ 已成功导航到房间列表页面")
+        except Exception as e:
+            logger.error(f"❌ 导航到房间列表页面失败：{str(e)}")
+
+    async def get_room_number(self) -> int:
+        """获取第一行民宿的房间数量，获取失败返回0"""
+        try:
+            cell = await get_table_cell_or_button(self.page, 0, self.ROOM_NUMBER_COLUMN)
+            match = re.search(r'\d+', (await cell.text_content()).strip())
+            return int(match.group()) if match else 0
+        except Exception as e:
+            logger.error(f"获取房间数量失败: {str(e)}")
+            return 0
+
+    async def check_room_number(self, expected_number: int) -> bool:
+        actual_number = await self.get_room_number()
+        if actual_number == expected_number:
+            logger.info(f"✅ 房间数量校验通过：实际「{actual_number}」= 预期「{expected_number}」")
+            return True
+        logger.error(f"❌ 房间数量校验失败：实际「{actual_number}」≠ 预期「{expected_number}」")
+        return False
+
+    async def get_filing_status(self, row_index: int = 0) -> str:
+        """获取指定行民宿的备案状态，获取失败返回空字符串"""
+        try:
+            status_cell = await get_table_cell_or_button(self.page, row_index, self.FILING_STATUS_COLUMN)
+            return ((await status_cell.text_content(timeout=2000)) or "").strip()
+        except Exception as e:
+            logger.error(f"获取备案状态发生错误：{str(e)}")
+            return ""
+
+    async def check_filing_status(self, expected_status: str, row_index: int = 0) -> bool:
+        actual_status = await self.get_filing_status(row_index)
+        if actual_status == expected_status:
+            logger.info(f"✅ 备案状态校验通过：实际「{actual_status}」= 预期「{expected_status}」")
+            return True
+        logger.error(f"❌ 备案状态校验失败：实际「{actual_status}」≠ 预期「{expected_status}」")
+        return False
+
+    async def wait_for_filing_status(self, minsu_name: str, expected_status: str,
+                                     timeout: float = 60, interval: float = 3) -> bool:
+        """
+        反复查询民宿直到备案状态变为预期值，用于等待另一门户（公安端）的操作生效
+
+        等待期间让出事件循环，同一进程中的其他页面流程可以继续执行。
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            row = await self.query_minsu(minsu_name)
+            if row is not None and await self.get_filing_status(row - 1) == expected_status:
+                logger.info(f"✅ 民宿[{minsu_name}]备案状态已变为「{expected_status}」")
+                return True
+            if asyncio.get_running_loop().time() >= deadline:
+                logger.error(f"❌ 等待民宿[{minsu_name}]备案状态变为「{expected_status}」超时")
+                return False
+            await asyncio.sleep(interval)
+
+    async def minsu_operation(self, operation: str, minsu_name: str = None) -> bool:
+        """点击第一行民宿的操作按钮；备案房间操作会校验表单中带出的民宿名称"""
+        try:
+            operation_button = await get_table_cell_or_button(self.page, 0, self.OPERATION_COLUMN, operation)
+            await operation_button.click()
+            await asyncio.sleep(2)
+            if operation == "备案房间":
+                if not minsu_name:
+                    logger.error("❌ 执行备案房间操作时，必须提供minsu_name参数")
+                    return False
+                minsu_input = get_label_corresponding_input(self.page, "民宿名称")
+                if not await minsu_input.is_visible():
+                    logger.error("❌ 未找到民宿名称输入框")
+                    return False
+                current_name = await minsu_input.input_value()
+                if current_name != minsu_name:
+                    logger.error(f"⚠️ 民宿名称不匹配，预期: {minsu_name}, 实际: {current_name}")
+                    return False
+                logger.info(f"✅ 民宿名称验证通过: {minsu_name}")
+            return True
+        except Exception as e:
+            logger.error(f"民宿{operation}发生错误：{str(e)}")
+            return False
+
+    async def minsu_submit(self, minsu_name: str) -> bool:
+        searched_tr = await query_target_name_tr(self.page, "民宿", minsu_name)
+        if not searched_tr:
+            logger.info(f" 未找到名为'{minsu_name}'的民宿行元素")
+            return False
+        try:
+            operation_button = searched_tr.locator("xpath=.//td[10]//button[span[text()='提交']]")
+            await operation_button.wait_for(state="visible", timeout=5000)
+            await operation_button.click()
+            confirm_btn = await checkTipDialog(
+                page=self.page,
+                expected_text=f'"{minsu_name}"提交后不能修改民宿备案及相关房间，确定要提交备案吗？',
+                confirm_text="确定",
+                cancel_text="取消",
+                operation="confirm"
+            )
+            if confirm_btn is None:
+                return False
+            await confirm_btn.click()
+            logger.info(f"成功点击'{minsu_name}'行的提交按钮")
+            await asyncio.sleep(1)
+            return True
+        except Exception as e:
+            logger.error(f"点击'{minsu_name}'行的'提交'按钮失败: {str(e)}")
+            return False
+
+    async def minsu_delete(self, minsu_name: str) -> bool:
+        try:
+            minsu_row_index = await self.query_minsu(minsu_name)
+            if minsu_row_index is None:
+                logger.error(f"待删除的民宿[{minsu_name}]不存在，终止删除操作")
+                return False
+
+            delete_button = await get_table_cell_or_button(
+                self.page, minsu_row_index - 1, self.OPERATION_COLUMN, "删除"
+            )
+            await delete_button.click()
+            await asyncio.sleep(2)
+
+            confirm_btn = await checkTipDialog(
+                self.page, f'是否确认删除民宿名称为"{minsu_name}"的数据项？', "确定", "取消", "confirm"
+            )
+            if not confirm_btn:
+                logger.error("未找到删除确认对话框中的'确定'按钮")
+                return False
+            await confirm_btn.click()
+
+            if await operation_alert_error(self.page, "删除成功"):
+                logger.info(f"✅ 民宿[{minsu_name}]删除成功")
+                return True
+            logger.error(f"❌ 民宿[{minsu_name}]删除失败，未捕获到'删除成功'提示")
+            return False
+        except Exception as e:
+            logger.error(f"❌ 民宿[{minsu_name}]删除发生错误：{str(e)}", exc_info=True)
+            return False
+
+    def get_room_expected_operations(self, room_number: int, filing_status: str) -> tuple[list[str], list[str]]:
+        """根据房间数量和备案状态返回 (操作集合, 禁用的操作)，不涉及页面交互"""
+        state = minsu_state(room_number, filing_status)
+        return MINSU_LIFECYCLE.operations(state), MINSU_LIFECYCLE.disabled_operations(state)
+
+    async def check_minsu_operations(self, operations: list, disabled_operations: list = None) -> bool:
+        """校验第一行民宿的操作按钮是否存在、禁用状态是否符合预期"""
+        disabled_operations = disabled_operations or []
+        try:
+            container = await get_table_cell_or_button(self.page, 0, self.OPERATION_COLUMN)
+            operation_status = {}
+            for button in await container.locator("button.el-button").all():
+                op_text = (await button.text_content()).strip()
+                if op_text:
+                    operation_status[op_text] = await button.get_attribute("disabled") is not None
+
+            missing_operations = [op for op in operations if op not in operation_status]
+            if missing_operations:
+                logger.error(f"❌ 缺少预期操作: {missing_operations}，实际存在的操作: {list(operation_status)}")
+                return False
+            invalid_disabled = [op for op in disabled_operations if not operation_status.get(op)]
+            if invalid_disabled:
+                logger.error(f"❌ 以下操作未按预期禁用: {invalid_disabled}")
+                return False
+            logger.info(f"✅ 所有预期操作都存在: {operations}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ 操作检查过程中发生错误: {str(e)}")
+            return False
+
+    async def delete_alert_error(self, expected_text):
+        is_matched, actual_text = await check_alert_text(self.page, expected_text)
+        return is_matched
+
+    async def submit_alert_error(self, expected_text):
+        is_matched, actual_text = await check_alert_text(self.page, expected_text)
+        return is_matched
@@ -1,9 +1,11 @@
 
 from tests.utils.file_utils import get_image_files
+from tests.utils.fixture_catalog import fixture_path
 from tests.utils.page_utils import *
 from tests.utils.validator import *
 from playwright.sync_api import Page, sync_playwright
 from tests.utils.form_validation_utils import FormValidationUtils
+from tests.utils.form_schema import ROOM_FORM_SCHEMA, FormBinding, bind_error_methods
 
 import re
 import os
@@ -24,30 +26,20 @@ class FilingRoomPage:
             page (Page): Playwright的Page对象，用于操作浏览器页面
         """
         self.page = page
-        self.room_name = get_label_corresponding_input(self.page, "房间名称")
-        self.ms_name = get_label_corresponding_input(self.page, "民宿名称")
-        self.ly_name = get_label_corresponding_input(self.page, "楼宇")
-        self.floor = get_label_corresponding_input(self.page, "楼层")
-        self.room_type = get_label_corresponding_input(self.page, "房间类型")
-
-        elements_input = get_label_corresponding_elements(
-            self.page, "房间户型", "following-sibling::div//input"
-        )
-
-        if len(elements_input) >= 4:
-            (
-                self.bedroom_number,
-                self.living_room_number,
-                self.kitchen_number,
-                self.bathroom_number,
-            ) = elements_input[:4]
-        else:
-            # 或者抛出异常
-            raise ValueError("获取的房间户型元素数量不足")
-
-        self.area = get_label_corresponding_input(self.page, "房型面积(㎡)")
-        self.bed_number = get_label_corresponding_input(self.page, "床数量")
-        self.max_occupancy = get_label_corresponding_input(self.page, "最大住人数")
+        # 字段句柄由表单描述统一解析并缓存，属性保留供直接操作元素
+        self.form = FormBinding(page, ROOM_FORM_SCHEMA)
+        self.room_name = self.form.handle("room_name")
+        self.ms_name = self.form.handle("ms_name")
+        self.ly_name = self.form.handle("ly_name")
+        self.floor = self.form.handle("floor")
+        self.room_type = self.form.handle("room_type")
+        self.bedroom_number = self.form.handle("bedroom_number")
+        self.living_room_number = self.form.handle("living_room_number")
+        self.kitchen_number = self.form.handle("kitchen_number")
+        self.bathroom_number = self.form.handle("bathroom_number")
+        self.area = self.form.handle("area")
+        self.bed_number = self.form.handle("bed_number")
+        self.max_occupancy = self.form.handle("max_occupancy")
 
     def upload_files_to_inputs(
         self, bedroom_files, livingroom_files, kitchen_files, bathroom_files
@@ -224,8 +216,8 @@ class FilingRoomPage:
             area (str): 房型面积
             bed_number (str): 床数量
             max_occupancy (str): 最大住人数
-            property_certificate (str): 证明文件路径
-            fire_safety_certificate (str): 消防证明文件路径
+            property_certificate (str | dict): 证明文件路径或 conf 中的文件属性描述
+            fire_safety_certificate (str | dict): 消防证明文件路径或 conf 中的文件属性描述
             bedroom_files (str): 卧室图片文件目录
             living_room_files (str): 客厅图片文件目录
             kitchen_files (str): 厨房图片文件目录
@@ -357,70 +349,6 @@ class FilingRoomPage:
         Returns:
             bool: 如果所有字段都成功填写，返回True；如果test_fields中存在某个字段且值为空，返回False
         """
-        # 字段配置字典
-        field_config = {
-            # 基本信息字段
-            "room_name": (lambda: self.room_name, lambda v: self.room_name.fill(v)),
-            "property_type": (None, lambda v: select_radio(self.page, "产权类型", v)),
-            "ms_name": (None, lambda v: select_option_by_input_element(self.page, self.ms_name, v)),
-            "ly_name": (None, lambda v: select_option_by_input_element(self.page, self.ly_name, v)),
-            "floor": (None, lambda v: select_option_by_input_element(self.page, self.floor, v)),
-            "room_type": (None, lambda v: select_option_by_input_element(self.page, self.room_type, v)),
-            "bedroom_number": (
-                lambda: self.bedroom_number,
-                lambda v: (self.bedroom_number.fill(v), simulate_blur(self.bedroom_number))[0],
-            ),
-            "living_room_number": (
-                lambda: self.living_room_number,
-                lambda v: (self.living_room_number.fill(v), simulate_blur(self.living_room_number))[0],
-            ),
-            "kitchen_number": (
-                lambda: self.kitchen_number,
-                lambda v: (self.kitchen_number.fill(v), simulate_blur(self.kitchen_number))[0],
-            ),
-            "bathroom_number": (
-                lambda: self.bathroom_number,
-                lambda v: (self.bathroom_number.fill(v), simulate_blur(self.bathroom_number))[0],
-            ),
-            "area": (
-                lambda: self.area,
-                lambda v: set_selector_input_by_input_element(
-                    self.area,
-                    "../../*[contains(@class, 'increase')]",
-                    v,
-                ),
-            ),
-            "bed_number": (
-                lambda: self.bed_number,
-                lambda v: set_selector_input_by_input_element(
-                    self.bed_number,
-                    "../../*[contains(@class, 'increase')]",
-                    v,
-                ),
-            ),
-            "max_occupancy": (
-                lambda: self.max_occupancy,
-                lambda v: set_selector_input_by_input_element(
-                    self.max_occupancy,
-                    "../../*[contains(@class, 'increase')]",
-                    v,
-                ),
-            ),
-            # 设施字段
-            "parking": (None, lambda v: select_radio(self.page, "是否有车位", v)),
-            "balcony": (None, lambda v: select_radio(self.page, "是否有阳台", v)),
-            "window": (None, lambda v: select_radio(self.page, "是否有窗户", v)),
-            "tv": (None, lambda v: select_radio(self.page, "电视机", v)),
-            "projector": (None, lambda v: select_radio(self.page, "投影仪", v)),
-            "washing_machine": (None, lambda v: select_radio(self.page, "洗衣机", v)),
-            "clothes_steamer": (None, lambda v: select_radio(self.page, "挂烫机", v)),
-            "water_heater": (None, lambda v: select_radio(self.page, "热水器", v)),
-            "hair_dryer": (None, lambda v: select_radio(self.page, "吹风机", v)),
-            "fridge": (None, lambda v: select_radio(self.page, "冰箱", v)),
-            "stove": (None, lambda v: select_radio(self.page, "炉灶", v)),
-            "toilet": (None, lambda v: select_radio(self.page, "便器", v)),
-        }
-
         # 获取所有字段的默认值
         all_fields = locals()
         # 移除self和test_fields，因为它们不是表单字段
@@ -430,10 +358,8 @@ class FilingRoomPage:
         # 处理每个字段
         if all_fields is not None:
             for field_name, value in list(all_fields.items()):
-                # 检查字段是否在配置中
-                if field_name in field_config:
-                    element_getter, setter = field_config[field_name]
-
+                # 检查字段是否在表单描述中
+                if field_name in ROOM_FORM_SCHEMA:
                     # 独立判断每个字段是否需要处理
                     if test_fields is not None :
                         if value or field_name in test_fields:
@@ -442,20 +368,33 @@ class FilingRoomPage:
                                 if value is None or value == "":
                                     return False
 
-                        # 执行设置操作.
-                        setter(value)
+                        # 执行设置操作
+                        self.form.fill(field_name, value)
 
         return True
 
+    def read_room_info(self, fields=None) -> dict:
+        """
+        回读表单当前填写的值
+
+        Args:
+            fields (list, optional): 需要回读的字段键，默认全部字段
+
+        Returns:
+            dict: {字段键: 当前值}，单选项返回选中的选项文本
+        """
+        return self.form.read_all(fields)
+
     def upload_property_certificate(self, property_type, property_certificate, test_fields=None):
         """
         上传房产证明文件
 
         Args:
             property_type (str): 房产类型
-            property_certificate (str): 房产证明文件路径
+            property_certificate (str | dict): 房产证明文件路径，或 conf 中的文件属性描述
             test_fields (str): 测试字段，用逗号分隔
         """
+        property_certificate = fixture_path(property_certificate)
         # 确定房产证明类型
         if property_type == "租赁":
             proof_type = "租赁证明"
@@ -505,10 +444,11 @@ class FilingRoomPage:
         上传消防合格证明文件
 
         Args:
-            fire_safety_certificate (str): 消防合格证明文件路径
+            fire_safety_certificate (str | dict): 消防合格证明文件路径，或 conf 中的文件属性描述
             test_fields (str): 测试字段，用逗号分隔
         """
         test_fields = test_fields.split(",") if test_fields else []
+        fire_safety_certificate = fixture_path(fire_safety_certificate)
 
         # 处理消防合格证明文件
         if fire_safety_certificate:  # 修改点：检查文件路径是否存在（非空字符串和非None）
@@ -538,10 +478,11 @@ class FilingRoomPage:
         网约房治安管理登记表
 
         Args:
-            public_security_registration_form (str): 消防合格证明文件路径
+            public_security_registration_form (str | dict): 消防合格证明文件路径，或 conf 中的文件属性描述
             test_fields (str): 测试字段，用逗号分隔
         """
         test_fields = test_fields.split(",") if test_fields else []
+        public_security_registration_form = fixture_path(public_security_registration_form)
 
         # 处理消防合格证明文件
         if public_security_registration_form:  # 修改点：检查文件路径是否存在（非空字符串和非None）
@@ -603,6 +544,18 @@ class FilingRoomPage:
         time.sleep(1)
         self.page.get_by_role("button", name="确 定").click()
 
+    def submit_and_harvest_errors(self) -> dict:
+        """
+        提交表单并一次性收集所有字段的错误提示
+
+        Returns:
+            dict: {字段键: 错误文本}，字段键与 FormValidationUtils.ROOM_FIELD_MAPPING 一致
+        """
+        self.submit_form()
+        self.page.locator(".el-form-item__error").first.wait_for(state="visible", timeout=5000)
+        harvested = harvest_form_errors(self.page)
+        return FormValidationUtils.map_harvested_errors("room", harvested)
+
     def get_property_type(self):
         # 获取所有产权类型标签元素
         label_elements = get_label_corresponding_elements(self.page, "产权类型", 'following-sibling::div//label')
@@ -614,12 +567,6 @@ class FilingRoomPage:
                 logger.info(f"选中的标签是: {selected_label}")
                 return selected_label
 
-    def room_name_error(self, message: str) -> bool:
-        """检查房间名称输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.room_name, '../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
     def property_type_check(self, property_type):
         """
         根据产权类型检查页面上是否存在对应的文本
@@ -650,145 +597,6 @@ class FilingRoomPage:
 
         return is_visible
 
-    def ms_name_error(self, message: str) -> bool:
-        """检查民宿名称输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.ms_name, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def ly_name_error(self, message: str) -> bool:
-        """检查楼宇名称输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.ly_name, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def floor_error(self, message: str) -> bool:
-        """检查楼层输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.floor, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def room_type_error(self, message: str) -> bool:
-        """检查房间类型输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.room_type, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def bedroom_number_error(self, message: str) -> bool:
-        """检查卧室数量输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.bedroom_number, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def living_room_number_error(self, message: str) -> bool:
-        """检查客厅数量输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.living_room_number, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def kitchen_number_error(self, message: str) -> bool:
-        """检查厨房数量输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.kitchen_number, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def bathroom_number_error(self, message: str) -> bool:
-        """检查浴室数量输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.bathroom_number, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def area_error(self, message: str) -> bool:
-        """检查房型面积输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.area, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def bed_number_error(self, message: str) -> bool:
-        """检查床数量输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.bed_number, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def max_occupancy_error(self, message: str) -> bool:
-        """检查最大住人数输入框是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.max_occupancy, '../../following-sibling::div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def parking_error(self, message: str) -> bool:
-        """检查车位选项是否显示指定的错误提示"""
-        # 假设车位选项为单选框，错误提示位置与普通输入框一致
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("是否有车位", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def balcony_error(self, message: str) -> bool:
-        """检查阳台选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("是否有阳台", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def window_error(self, message: str) -> bool:
-        """检查窗户选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("是否有窗户", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def tv_error(self, message: str) -> bool:
-        """检查电视机选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("电视机", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def projector_error(self, message: str) -> bool:
-        """检查投影仪选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("投影仪", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def washing_machine_error(self, message: str) -> bool:
-        """检查洗衣机选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("洗衣机", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def clothes_steamer_error(self, message: str) -> bool:
-        """检查挂烫机选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("挂烫机", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def water_heater_error(self, message: str) -> bool:
-        """检查热水器选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("热水器", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def hair_dryer_error(self, message: str) -> bool:
-        """检查吹风机选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("吹风机", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def fridge_error(self, message: str) -> bool:
-        """检查冰箱选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("冰箱", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def stove_error(self, message: str) -> bool:
-        """检查炉灶选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("炉灶", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
-    def toilet_error(self, message: str) -> bool:
-        """检查便器选项是否显示指定的错误提示"""
-        return get_element_corresponding_error_tip(
-            self.page.get_by_text("便器", exact=True), '../..//div[contains(@class, "el-form-item__error")]', message
-        )
-
     def property_type_error(self, message: str) -> bool:
         """检查房产类型选项是否显示指定的错误提示"""
         return get_element_corresponding_error_tip(
@@ -868,6 +676,10 @@ class FilingRoomPage:
     #         "property_type": "自有"
     #     }
 
+# 由表单描述生成 room_name_error、parking_error 等字段错误检查方法
+bind_error_methods(FilingRoomPage, ROOM_FORM_SCHEMA)
+
+
 # def run(playwright: Playwright) -> None:
 #     browser = playwright.chromium.launch(headless=False)
 #     context = browser.new_context()
@@ -1,4 +1,6 @@
 from tests.utils.page_utils import *
+from tests.utils.perf_metrics import record_navigation
+from tests.utils.routes import open_route
 from  tests.utils.validator import *
 from playwright.sync_api import Page
 
@@ -31,6 +33,13 @@ class FTManagePage:
         # self.cancel_button = self.page.get_by_role("button", name="取消")
         # self.error_messages = self.page.locator('[class*="error"]')
 
+    @record_navigation("fd:房屋管理(直达)")
+    def open(self, fd_base_url: str):
+        """不经过菜单点击，直接打开房屋管理页面并等待加载完成"""
+        open_route(self.page, "fd:房屋管理", fd_base_url)
+        return self
+
+    @record_navigation("fd:{target_page_name}")
     def navigate_to_other_manage_page(self, target_page_name: str):
         try:
             self.page.get_by_role("menuitem", name=target_page_name).click()
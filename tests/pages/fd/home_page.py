@@ -1,6 +1,7 @@
 import logging
 
 from tests.utils.page_utils import *
+from tests.utils.perf_metrics import record_navigation
 from  tests.utils.validator import *
 from playwright.sync_api import Page
 
@@ -33,6 +34,7 @@ class HomePage:
         # self.cancel_button = self.page.get_by_role("button", name="取消")
         # self.error_messages = self.page.locator('[class*="error"]')
 
+    @record_navigation("fd:房屋管理")
     def navigate_to_house_manage_page(self):
         try:
             self.page.get_by_role("menuitem", name="房屋管理").click()
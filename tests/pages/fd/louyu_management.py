@@ -10,6 +10,8 @@ from playwright.async_api import Playwright
 from conf.logging_config import logger
 from tests.utils.page_utils import *
 from tests.utils.validator import *
+from tests.utils.perf_metrics import record_navigation
+from tests.utils.routes import open_route
 from playwright.sync_api import Page, sync_playwright
 
 import re
@@ -36,6 +38,11 @@ class louYuManagementPage:
         self.reset_button = self.page.get_by_role("button", name="重置")
         self.ly_list = self.page.locator("tbody")
 
+    @record_navigation("fd:楼宇管理(直达)")
+    def open(self, fd_base_url: str):
+        """不经过菜单点击，直接打开楼宇管理页面并等待加载完成"""
+        open_route(self.page, "fd:楼宇管理", fd_base_url)
+        return self
 
     def add_louyu(self, louyu_name: str):
 
@@ -2,6 +2,9 @@ import time
 
 from playwright.sync_api import Page, expect
 from tests.utils.page_utils import *
+from tests.utils.lifecycle_model import MINSU_LIFECYCLE, minsu_state
+from tests.utils.perf_metrics import record_navigation
+from tests.utils.routes import open_route
 from tests.pages.fd.add_new_minsu import AddNewMinsuPage
 from playwright.sync_api import Page, expect, Playwright, sync_playwright
 
@@ -23,6 +26,12 @@ class MinsuManagementPage:
         # 功能按钮
         self.add_minsu_button = self.page.get_by_role("button", name=" 新增民宿")
 
+    @record_navigation("fd:民宿管理(直达)")
+    def open(self, fd_base_url: str):
+        """不经过菜单点击，直接打开民宿管理页面并等待加载完成"""
+        open_route(self.page, "fd:民宿管理", fd_base_url)
+        return self
+
     def query_minsu(self, minsu_name: str) -> int or None:
         """
         查询民宿所在行的索引（下标）
@@ -382,35 +391,8 @@ class MinsuManagementPage:
         Raises:
             ValueError: 当房间数量为负数或备案状态无效时抛出
         """
-        operations = []
-        disabled = []
-
-        if room_number < 0:
-            raise ValueError(f"房间数量不能为负数: {room_number}")
-
-        if room_number == 0:
-            if filing_status == "未提交":
-                operations = ["备案房间", "提交", "修改", "详情", "删除"]
-                disabled = ["提交"]
-            else:
-                raise ValueError(f"房间数量为0时，备案状态必须为'未提交'，实际为'{filing_status}'")
-
-        elif room_number > 0:
-            if filing_status == "待确认":
-                operations = ["详情"]
-                disabled = []
-            elif filing_status == "已确认":
-                operations = ["备案房间","详情", "删除"]
-                disabled = []
-            elif filing_status == "未提交":
-                operations = ["备案房间", "提交", "修改", "详情", "删除"]  # 根据需求调整操作集合
-                disabled = []
-            else:
-                raise ValueError(
-                    f"房间数量大于0时，备案状态必须为'待确认'、'已确认'或'未提交'，实际为'{filing_status}'"
-                )
-
-        return operations, disabled
+        state = minsu_state(room_number, filing_status)
+        return MINSU_LIFECYCLE.operations(state), MINSU_LIFECYCLE.disabled_operations(state)
 
     def check_minsu_operations(self, operations: list,
                                disabled_operations: list = None) -> bool:
@@ -2,10 +2,17 @@ from tests.utils.page_utils import *
 from  tests.utils.validator import *
 from playwright.sync_api import Page
 from conf.logging_config import logger
+from tests.utils.identity_allocator import IdentityAllocator
+from tests.utils.sms_code_provider import VerificationCodeProvider, create_code_provider
 
 class RegisterPage:
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, code_provider: VerificationCodeProvider | None = None,
+                 identity_allocator: IdentityAllocator | None = None):
         self.page = page
+        # 验证码获取方式，默认按 conf.SMS_CODE_PROVIDER 选择
+        self.code_provider = code_provider or create_code_provider()
+        # 记录发送过验证码的手机号，冷却期内不再分配给其他用例；未提供时在首次发送验证码时创建
+        self.identity_allocator = identity_allocator
 
         prefix = "法定"
         # 页面元素定位
@@ -97,16 +104,13 @@ class RegisterPage:
 
             # 情况4: 手机号不为空且测试字段集合为空
             if stripped_phone and send_verification_code:
+                self.code_provider.prepare(self.page, stripped_phone)
                 self.verify_code_button.click()
-                # 如果未提供验证码，则从日志中提取
-                verify_code = extract_verification_code_live(
-                    "192.168.40.61",
-                    "root",
-                    "dell_123456",
-                    "22",
-                    "/opt/tomcat8.5.84-wyf-fd-3333/logs/catalina.out",
-                    stripped_phone
-                )
+                if self.identity_allocator is None:
+                    self.identity_allocator = IdentityAllocator(check_database=False)
+                self.identity_allocator.mark_code_sent(stripped_phone)
+                # 如果未提供验证码，则由验证码获取方式提供
+                verify_code = self.code_provider.get_code(stripped_phone)
 
                 result, actual_text = check_alert_text(self.page, "验证码发送成功")
                 if not result:
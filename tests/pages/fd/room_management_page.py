@@ -3,6 +3,9 @@ from playwright.sync_api import Page, expect
 
 from tests.pages.fd.filing_room_page import FilingRoomPage
 from tests.utils.page_utils import *
+from tests.utils.lifecycle_model import ROOM_LIFECYCLE
+from tests.utils.perf_metrics import record_navigation
+from tests.utils.routes import open_route
 from tests.pages.fd.add_new_minsu import AddNewMinsuPage
 from playwright.sync_api import Page, expect, Playwright, sync_playwright
 
@@ -24,6 +27,12 @@ class RoomManagementPage:
         # 功能按钮
         self.add_minsu_button = self.page.get_by_role("button", name="备案房间")
 
+    @record_navigation("fd:房间管理(直达)")
+    def open(self, fd_base_url: str):
+        """不经过菜单点击，直接打开房间管理页面并等待加载完成"""
+        open_route(self.page, "fd:房间管理", fd_base_url)
+        return self
+
     def query_room(self, room_name: str) -> bool:
 
         result = False
@@ -54,6 +63,17 @@ class RoomManagementPage:
                 self.page.go_back()
             raise e
 
+    def reopen_filling_room_page(self, timeout: float = 5000):
+        """
+        不重新加载页面，在单页应用内重新进入备案房间表单：
+        当前在表单页时先返回房间列表，再点击"备案房间"，表单组件随之重建，上传列表一并清空
+        """
+        if not self.add_minsu_button.is_visible():
+            self.page.go_back()
+        self.add_minsu_button.click(timeout=timeout)
+        self.page.locator(".el-form").first.wait_for(state="visible", timeout=timeout)
+        return FilingRoomPage(self.page)
+
     def get_room_status(self, row_index: int = 0) -> str:
         """
         获取指定行房间的备案状态
@@ -87,15 +107,7 @@ class RoomManagementPage:
         Returns:
             str: 操作后的预期状态文本，如果操作不支持则返回空字符串
         """
-        # 定义操作与预期状态的映射关系
-        operation_status_map = {
-            "禁用": "禁用",
-            "恢复": "正常",
-            "注销": "注销"
-        }
-
-        # 返回与操作对应的状态，如果操作不在映射表中则返回空字符串
-        return operation_status_map.get(operation, "")
+        return ROOM_LIFECYCLE.target_of(operation)
 
     def check_room_status(self, expect_status: str) -> bool:
         """
@@ -196,7 +208,7 @@ class RoomManagementPage:
                 checkTipDialog(self.page, confirm_message, "确定", "取消", "confirm").click()
                 logger.info(f"已确认 '{operation}' 操作。")
 
-                return operation_alert_error(f"{operation}成功")
+                return operation_alert_error(self.page, f"{operation}成功")
 
         except Exception as e:
             logger.error(f"房间{operation}发生错误：{str(e)}")
@@ -212,13 +224,7 @@ class RoomManagementPage:
         Returns:
             list: 该状态对应的所有操作集合
         """
-        operations_map = {
-            "注销": ["详情"],
-            "正常": ["修改", "禁用", "注销", "详情"],
-            "禁用": ["修改", "恢复", "注销", "详情"]
-        }
-        # 返回对应的操作集合，如果状态不存在则返回空列表
-        return operations_map.get(room_status, [])
+        return ROOM_LIFECYCLE.operations(room_status)
 
     def check_room_operations(self, expected_operations: list) -> bool:
         """
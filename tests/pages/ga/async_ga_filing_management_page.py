@@ -0,0 +1,81 @@
+import asyncio
+
+from playwright.async_api import Page
+
+from conf.config import ROUTE_READY_TIMEOUT
+from conf.logging_config import logger
+from tests.utils.async_page_utils import (
+    check_alert_text,
+    get_label_corresponding_input,
+    get_table_cell_or_button,
+    query_target_name_index,
+    query_target_name_tr,
+    select_radio_button,
+)
+from tests.utils.routes import route_url
+
+
+class AsyncGAFilingManagementPage:
+    """GAFilingManagementPage 的 asyncio 版本"""
+
+    OPERATION_COLUMN = 8
+
+    def __init__(self, page: Page):
+        self.page = page
+
+        self.minsu_name_search_input = self.page.get_by_role("textbox", name="请输入民宿名称")
+        self.search_button = self.page.get_by_role("button", name="搜索")
+        self.reset_button = self.page.get_by_role("button", name="重置")
+
+    async def open(self, ga_base_url: str):
+        """
+        打开备案管理页面并等待查询区域出现：已记录路径（PAGE_ROUTES / PAGE_ROUTE_CACHE）时直达，
+        否则从公安端首页点击"备案管理"链接进入（同 GAHomePage.navigate_to_other_page）
+        """
+        url = route_url("ga:备案管理", ga_base_url)
+        if url is not None:
+            await self.page.goto(url)
+        else:
+            await self.page.locator('//a[text()="备案管理"]').click()
+        await self.page.get_by_role("button", name="搜索").first.wait_for(timeout=ROUTE_READY_TIMEOUT)
+        return self
+
+    async def query_minsu_tr(self, minsu_name: str) -> bool:
+        if minsu_name is None:
+            return False
+        return await query_target_name_tr(self.page, "民宿", minsu_name) is not None
+
+    async def filing_operation(self, operation: str, confirming_person_name: str = None,
+                               approval: bool = True, minsu_name: str = None) -> bool:
+        """
+        对民宿执行备案操作（确认等），填写确认人并选择确认结果后提交
+
+        Args:
+            minsu_name: 先按名称查询，只在完全匹配的行上操作，未查询到时不操作；不提供时操作第一行
+
+        Returns:
+            bool: 操作成功 True；失败 False
+        """
+        try:
+            row = 0
+            if minsu_name is not None:
+                row_number = await query_target_name_index(self.page, "民宿", minsu_name)
+                if row_number is None:
+                    logger.error(f"未查询到民宿 {minsu_name}，不执行{operation}")
+                    return False
+                row = row_number - 1
+            operation_button = await get_table_cell_or_button(self.page, row, self.OPERATION_COLUMN, operation)
+            await operation_button.click()
+            await asyncio.sleep(2)
+
+            await get_label_corresponding_input(self.page, "确认人姓名").fill(confirming_person_name)
+            await select_radio_button(self.page, "确认结果", "通过" if approval else "不通过")
+            await self.page.get_by_role("button", name="提 交").click()
+            return True
+        except Exception as e:
+            logger.error(f"民宿{operation}发生错误：{str(e)}")
+            return False
+
+    async def filling_alert_error(self, expected_text):
+        is_matched, actual_text = await check_alert_text(self.page, expected_text)
+        return is_matched
@@ -2,6 +2,8 @@ import time
 
 from playwright.sync_api import Page, expect
 from tests.utils.page_utils import *
+from tests.utils.perf_metrics import record_navigation
+from tests.utils.routes import open_route
 from tests.pages.fd.add_new_minsu import AddNewMinsuPage
 from playwright.sync_api import Page, expect, Playwright, sync_playwright
 
@@ -20,6 +22,12 @@ class GAFilingManagementPage:
         self.search_button = self.page.get_by_role("button", name="搜索")
         self.reset_button = self.page.get_by_role("button", name="重置")
 
+    @record_navigation("ga:备案管理(直达)")
+    def open(self, ga_base_url: str):
+        """不经过菜单点击，直接打开备案管理页面并等待加载完成"""
+        open_route(self.page, "ga:备案管理", ga_base_url)
+        return self
+
     def query_minsu_tr(self, minsu_name: str) -> bool:
 
         result = False
@@ -28,21 +36,30 @@ class GAFilingManagementPage:
             # 检查结果是否为None，非None则返回True，否则返回False
         return result is not None
 
-    def filing_operation(self,  operation: str, confirming_person_name: str=None, approval:bool=True) -> bool:
+    def filing_operation(self,  operation: str, confirming_person_name: str=None, approval:bool=True,
+                         minsu_name: str=None) -> bool:
         """
         校验目标民宿的备案状态是否与预期一致
         （注：默认通过 get_table_cell_or_button(0,8) 获取单元格，需确保该函数返回第1行第9列的备案状态单元格）
 
         Args:
             operation: 民宿备案操作，确认详情等
+            minsu_name: 先按名称查询，只在完全匹配的行上操作，未查询到时不操作；不提供时操作第一行
 
         Returns:
             bool: 操作成功 True；获取失败 False
         """
         status_text = None  # 初始化状态文本变量，避免未定义报错
         try:
-            # 1. 尝试获取备案状态对应的表格单元格（第1行第9列：索引0行、8列）
-            operation_button = get_table_cell_or_button(self.page, 0, 8, operation)
+            # 1. 尝试获取备案状态对应的表格单元格（目标行第9列：列索引8）
+            row = 0
+            if minsu_name is not None:
+                row_number = query_target_name_index(self.page, "民宿", minsu_name)
+                if row_number is None:
+                    logger.error(f"未查询到民宿 {minsu_name}，不执行{operation}")
+                    return False
+                row = row_number - 1
+            operation_button = get_table_cell_or_button(self.page, row, 8, operation)
 
             # 2. 校验单元格是否获取成功
             if operation_button is None:
@@ -1,4 +1,5 @@
 from tests.utils.page_utils import *
+from tests.utils.perf_metrics import record_navigation
 from  tests.utils.validator import *
 from playwright.sync_api import Page
 
@@ -31,6 +32,7 @@ class GAFWManagementPage:
         # self.cancel_button = self.page.get_by_role("button", name="取消")
         # self.error_messages = self.page.locator('[class*="error"]')
 
+    @record_navigation("ga:{target_page_name}")
     def navigate_to_other_management_page(self, target_page_name: str):
         try:
             self.page.get_by_role("menuitem", name=target_page_name).click()
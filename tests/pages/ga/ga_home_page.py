@@ -1,6 +1,7 @@
 import logging
 
 from tests.utils.page_utils import *
+from tests.utils.perf_metrics import record_navigation
 from  tests.utils.validator import *
 from playwright.sync_api import Page
 
@@ -8,6 +9,7 @@ class GAHomePage:
     def __init__(self, page: Page):
         self.page = page
 
+    @record_navigation("ga:{target_page_name}")
     def navigate_to_other_page(self, target_page_name: str):
         try:
             self.page.locator(f'//a[text()="{target_page_name}"]').click()
@@ -1,5 +1,6 @@
 from playwright.sync_api import Page
 from tests.utils.page_utils import *
+from tests.utils.perf_metrics import record_navigation
 
 from playwright.sync_api import sync_playwright, Page
 from tests.utils.page_utils import *
@@ -13,6 +14,7 @@ class GALoginPage:
         self.login_button = page.get_by_role("button", name="登 录")
         self.error_elements = self.page.locator('[class*="el-form-item__error"]')
 
+    @record_navigation("ga:登录页")
     def navigate(self, ga_base_url: str):
         self.page.goto(f"{ga_base_url}/login")
 
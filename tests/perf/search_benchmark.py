@@ -0,0 +1,343 @@
+"""
+列表查询接口吞吐量基准测试
+
+query_target_name_tr 通过界面完成"自定义查询"，只能反映单用户的端到端体验。
+本工具先通过界面执行一次查询并录制浏览器发出的查询请求（含登录凭据），然后用连接池
+按指定并发直接重放该请求，轮换关键词与每页条数，输出各并发档位的 p50/p95/p99 延迟与每秒请求数。
+
+    # 1. 录制（只需一次，录制结果保存在 .cache/search_captures/<对象>.json）
+    python -m tests.perf.search_benchmark capture --fd-base-url http://192.168.40.61:3333 \\
+        --username fenghuang_123 --password '***' --target 民宿 --keyword 测试
+
+    # 2. 重放
+    python -m tests.perf.search_benchmark run --target 民宿 --keywords 测试,民宿,房 \\
+        --page-sizes 10,50,100 --concurrency 1,4,16 --requests 500
+
+    # 离线验证工具本身：使用本地桩服务代替门户
+    python -m tests.perf.search_benchmark run --stub --concurrency 1,8 --requests 200
+
+登录凭据过期后重放会得到 401 或业务错误码，重新录制即可。
+"""
+import argparse
+import itertools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+from conf.config import PERF_REPORT_DIR, SEARCH_CAPTURE_DIR, SEARCH_PAGE_SIZE_PARAMS
+from conf.logging_config import logger
+from tests.utils.http_pool import HTTPConnectionPool
+from tests.utils.perf_stats import PerfStats, write_json
+
+# 录制时不保留的请求头：由 http.client 按实际请求重新生成
+_DROPPED_HEADERS = {"host", "content-length", "connection", "accept-encoding"}
+# 业务成功码，响应 JSON 中 code 不在其中时记为失败
+_SUCCESS_CODES = (0, 200)
+
+
+# ------------------------------
+# 录制
+# ------------------------------
+def _contains_keyword(request, keyword: str) -> bool:
+    if keyword in unquote(request.url):
+        return True
+    body = request.post_data or ""
+    return keyword in body or keyword in unquote(body)
+
+
+def capture_search_request(page, target_part: str, keyword: str) -> dict:
+    """
+    在已登录并打开对应管理页面的 page 上执行一次查询，返回录制的查询请求
+
+    :param target_part: 查询对象（民宿 / 楼宇 / 房间），与 query_target_name_tr 一致
+    :param keyword: 查询关键词，用于从请求中识别查询请求与关键词参数
+    """
+    from tests.utils.page_utils import query_target_name_tr
+
+    requests = []
+    page.on("request", lambda r: requests.append(r) if r.resource_type in ("xhr", "fetch") else None)
+    query_target_name_tr(page, target_part, keyword)
+    matched = [r for r in requests if _contains_keyword(r, keyword)]
+    if not matched:
+        raise RuntimeError(f"未录制到包含关键词 {keyword} 的查询请求，共捕获 {len(requests)} 个接口请求")
+
+    request = matched[-1]
+    headers = {k: v for k, v in request.all_headers().items()
+               if not k.startswith(":") and k.lower() not in _DROPPED_HEADERS}
+    if "cookie" not in {k.lower() for k in headers}:
+        cookies = page.context.cookies(request.url)
+        if cookies:
+            headers["Cookie"] = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+    return {
+        "target": target_part,
+        "method": request.method,
+        "url": request.url,
+        "headers": headers,
+        "body": request.post_data,
+        "keyword": keyword,
+        "captured_at": time.time(),
+    }
+
+
+def capture_path(target_part: str) -> str:
+    return os.path.join(SEARCH_CAPTURE_DIR, f"{target_part}.json")
+
+
+def load_capture(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ------------------------------
+# 请求模板
+# ------------------------------
+def _substitute(value, keyword: str, captured_keyword: str, page_size: int):
+    """递归替换 JSON 中的关键词与每页条数"""
+    if isinstance(value, dict):
+        return {
+            k: page_size if k in SEARCH_PAGE_SIZE_PARAMS and page_size else
+            _substitute(v, keyword, captured_keyword, page_size)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_substitute(v, keyword, captured_keyword, page_size) for v in value]
+    if value == captured_keyword:
+        return keyword
+    return value
+
+
+def _substitute_pairs(pairs: list, keyword: str, captured_keyword: str, page_size: int) -> list:
+    result = []
+    for name, value in pairs:
+        if name in SEARCH_PAGE_SIZE_PARAMS and page_size:
+            value = str(page_size)
+        elif value == captured_keyword:
+            value = keyword
+        result.append((name, value))
+    return result
+
+
+def build_request(capture: dict, keyword: str, page_size: int = None) -> tuple[str, bytes | None, dict]:
+    """
+    由录制的请求生成替换了关键词与每页条数的请求
+
+    :return: (路径与查询串, 请求体, 请求头)
+    """
+    captured_keyword = capture["keyword"]
+    parts = urlsplit(capture["url"])
+    query = urlencode(_substitute_pairs(parse_qsl(parts.query, keep_blank_values=True),
+                                        keyword, captured_keyword, page_size))
+    path = urlunsplit(("", "", parts.path or "/", query, ""))
+
+    body = capture.get("body")
+    headers = dict(capture.get("headers") or {})
+    if body is not None:
+        content_type = next((v for k, v in headers.items() if k.lower() == "content-type"), "")
+        if "json" in content_type:
+            body = json.dumps(_substitute(json.loads(body), keyword, captured_keyword, page_size),
+                              ensure_ascii=False)
+        elif "x-www-form-urlencoded" in content_type:
+            body = urlencode(_substitute_pairs(parse_qsl(body, keep_blank_values=True),
+                                               keyword, captured_keyword, page_size))
+        else:
+            body = body.replace(captured_keyword, keyword)
+        body = body.encode("utf-8")
+    return path, body, headers
+
+
+def _response_error(status: int, data: bytes) -> str | None:
+    """非 2xx 或业务码表示失败时返回失败原因"""
+    if not 200 <= status < 300:
+        return f"HTTP {status}"
+    try:
+        payload = json.loads(data)
+    except ValueError:
+        return None
+    if isinstance(payload, dict) and "code" in payload and payload["code"] not in _SUCCESS_CODES:
+        return f"业务码 {payload['code']}: {payload.get('msg', '')}"
+    return None
+
+
+# ------------------------------
+# 重放
+# ------------------------------
+def run_level(capture: dict, keywords: list[str], page_sizes: list, concurrency: int,
+              requests: int = None, duration: float = None, warmup: int = 0) -> PerfStats:
+    """
+    以固定并发重放查询请求
+
+    :param keywords: 轮换使用的关键词
+    :param page_sizes: 轮换使用的每页条数，[None] 表示保持录制时的值
+    :param requests: 请求总数（不含预热），与 duration 二选一
+    :param duration: 持续秒数
+    :param warmup: 正式计时前每个并发先发送的请求数，用于建立连接
+    :return: 按每页条数分组并含"全部"汇总的 PerfStats
+    """
+    combos = list(itertools.product(keywords, page_sizes))
+    prepared = [(page_size, build_request(capture, keyword, page_size)) for keyword, page_size in combos]
+    method = capture["method"]
+    counter = itertools.count()
+    lock = threading.Lock()
+
+    with HTTPConnectionPool(capture["url"], size=concurrency) as pool:
+        for i in range(warmup * concurrency):
+            _, (path, body, headers) = prepared[i % len(prepared)]
+            pool.request(method, path, body, headers)
+
+        stats = PerfStats()
+        deadline = time.perf_counter() + duration if duration else None
+
+        def worker():
+            while True:
+                with lock:
+                    index = next(counter)
+                if deadline is None and index >= requests:
+                    return
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                page_size, (path, body, headers) = prepared[index % len(prepared)]
+                started = time.time()
+                t0 = time.perf_counter()
+                try:
+                    status, data = pool.request(method, path, body, headers)
+                    error = _response_error(status, data)
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                elapsed = time.perf_counter() - t0
+                label = f"每页{page_size}条" if page_size else "录制参数"
+                stats.record(label, f"c{concurrency}", started, elapsed, error is None, error)
+                stats.record("全部", f"c{concurrency}", started, elapsed, error is None, error)
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="search-bench") as executor:
+            for future in [executor.submit(worker) for _ in range(concurrency)]:
+                future.result()
+        stats.finish()
+        logger.info(f"并发 {concurrency}：新建连接 {pool.created} 个")
+    return stats
+
+
+def run_benchmark(capture: dict, keywords: list[str], page_sizes: list, concurrency_levels: list[int],
+                  requests: int = None, duration: float = None, warmup: int = 1) -> dict:
+    """依次运行各并发档位，返回报告"""
+    levels = []
+    for concurrency in concurrency_levels:
+        stats = run_level(capture, keywords, page_sizes, concurrency, requests, duration, warmup)
+        overall = stats.summary()["steps"].get("全部", {})
+        logger.info(
+            f"并发 {concurrency}: {overall.get('throughput_per_s')} req/s, "
+            f"p50 {overall.get('p50_s')}s, p95 {overall.get('p95_s')}s, p99 {overall.get('p99_s')}s, "
+            f"错误率 {overall.get('error_rate')}\n{stats.format_table()}"
+        )
+        levels.append({"concurrency": concurrency, **stats.summary()})
+    return {
+        "meta": {
+            "target": capture.get("target"),
+            "method": capture["method"],
+            "url": urlsplit(capture["url"])._replace(query="").geturl(),
+            "keywords": keywords,
+            "page_sizes": page_sizes,
+            "requests": requests,
+            "duration_s": duration,
+        },
+        "levels": levels,
+    }
+
+
+# ------------------------------
+# 命令行
+# ------------------------------
+def _capture_command(options):
+    from playwright.sync_api import sync_playwright
+
+    from tests.pages.fd.home_page import HomePage
+    from tests.pages.fd.login_page import LoginPage
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=options.headless)
+        page = browser.new_page()
+        try:
+            login_page = LoginPage(page)
+            login_page.navigate(options.fd_base_url)
+            login_page.fill_credentials(options.username, options.password)
+            login_page.click_login_button()
+            page.wait_for_load_state("networkidle")
+            HomePage(page).navigate_to_house_manage_page()
+            page.get_by_role("menuitem", name=f"{options.target}管理").click()
+            page.wait_for_load_state("networkidle")
+            capture = capture_search_request(page, options.target, options.keyword)
+        finally:
+            browser.close()
+    output = options.output or capture_path(options.target)
+    write_json(output, capture)
+    logger.info(f"已录制 {capture['method']} {capture['url']}，保存到 {output}")
+
+
+def _run_command(options):
+    keywords = [k for k in options.keywords.split(",") if k] if options.keywords else []
+    page_sizes = [int(s) for s in options.page_sizes.split(",") if s] if options.page_sizes else [None]
+    levels = [int(c) for c in options.concurrency.split(",") if c]
+    requests = None if options.duration else options.requests
+
+    if options.stub:
+        from tests.perf.search_stub_server import StubSearchServer
+
+        with StubSearchServer(latency_ms=options.stub_latency_ms) as server:
+            capture = server.capture(options.stub_method)
+            report = run_benchmark(capture, keywords or [capture["keyword"]], page_sizes, levels,
+                                   requests, options.duration, options.warmup)
+            report["meta"]["stub_requests"] = server.request_count
+    else:
+        capture = load_capture(options.capture or capture_path(options.target))
+        report = run_benchmark(capture, keywords or [capture["keyword"]], page_sizes, levels,
+                               requests, options.duration, options.warmup)
+
+    report_path = options.report or os.path.join(
+        PERF_REPORT_DIR, f"search_benchmark_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    write_json(report_path, report)
+    logger.info(f"报告已写入 {report_path}")
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="列表查询接口吞吐量基准测试")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    capture = commands.add_parser("capture", help="通过界面执行一次查询并录制查询请求")
+    capture.add_argument("--fd-base-url", required=True)
+    capture.add_argument("--username", required=True)
+    capture.add_argument("--password", required=True)
+    capture.add_argument("--target", default="民宿", choices=["民宿", "楼宇", "房间"])
+    capture.add_argument("--keyword", required=True, help="用于录制的查询关键词")
+    capture.add_argument("--output", help="录制结果路径，默认 .cache/search_captures/<对象>.json")
+    capture.add_argument("--headed", dest="headless", action="store_false")
+
+    run = commands.add_parser("run", help="按指定并发重放录制的查询请求")
+    run.add_argument("--target", default="民宿", choices=["民宿", "楼宇", "房间"])
+    run.add_argument("--capture", help="录制结果路径，默认按 --target 查找")
+    run.add_argument("--keywords", help="逗号分隔的关键词，默认使用录制时的关键词")
+    run.add_argument("--page-sizes", help="逗号分隔的每页条数，默认保持录制时的值")
+    run.add_argument("--concurrency", default="1,4,16", help="逗号分隔的并发档位")
+    run.add_argument("--requests", type=int, default=200, help="每个并发档位的请求总数")
+    run.add_argument("--duration", type=float, default=0, help="每个并发档位持续的秒数，设置后忽略 --requests")
+    run.add_argument("--warmup", type=int, default=1, help="每个并发正式计时前的预热请求数")
+    run.add_argument("--report", help="报告文件路径，默认写入 reports/perf/")
+    run.add_argument("--stub", action="store_true", help="使用本地桩服务代替门户")
+    run.add_argument("--stub-latency-ms", type=float, default=20)
+    run.add_argument("--stub-method", default="GET", choices=["GET", "POST"])
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    if options.command == "capture":
+        _capture_command(options)
+    else:
+        _run_command(options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+查询接口的本地桩服务
+
+模拟门户列表接口的响应格式（{"code": 200, "total": N, "rows": [...]}），按请求中的关键词与
+每页条数生成数据，并按配置的延迟返回，用于离线验证 search_benchmark 本身：
+
+    with StubSearchServer(latency_ms=20) as server:
+        capture = server.capture()
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from conf.config import SEARCH_PAGE_SIZE_PARAMS
+
+STUB_SEARCH_PATH = "/stub/fwgl/minsu/list"
+_KEYWORD_PARAM = "msmc"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # 响应头与响应体分两次写出，关闭 Nagle 避免与客户端延迟确认叠加产生额外 40ms 延迟
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _params(self) -> dict:
+        params = dict(parse_qsl(urlsplit(self.path).query))
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            raw = self.rfile.read(length)
+            try:
+                body = json.loads(raw)
+            except ValueError:
+                body = dict(parse_qsl(raw.decode("utf-8")))
+            if isinstance(body, dict):
+                params.update(body)
+        return params
+
+    def _handle(self):
+        server = self.server
+        params = self._params()
+        if urlsplit(self.path).path != STUB_SEARCH_PATH:
+            self._send(404, {"code": 404, "msg": "未找到接口"})
+            return
+
+        page_size = next((int(params[p]) for p in SEARCH_PAGE_SIZE_PARAMS if p in params), 10)
+        keyword = str(params.get(_KEYWORD_PARAM, ""))
+        delay = server.latency_ms + random.uniform(0, server.jitter_ms) + server.per_row_ms * page_size
+        time.sleep(delay / 1000)
+        rows = [{"id": i, "msmc": f"{keyword}_{i}", "ba_zt": "未提交"} for i in range(min(page_size, server.total))]
+        with server.lock:
+            server.request_count += 1
+        self._send(200, {"code": 200, "msg": "查询成功", "total": server.total, "rows": rows})
+
+    def _send(self, status: int, payload: dict):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+class StubSearchServer:
+    """
+    本地桩服务，在后台线程中运行
+
+    Args:
+        latency_ms: 每个请求的基础延迟（毫秒）
+        jitter_ms: 在基础延迟上随机增加的最大延迟（毫秒）
+        per_row_ms: 每返回一行增加的延迟（毫秒），用于模拟每页条数对耗时的影响
+        total: 模拟的总记录数
+        port: 监听端口，0 表示随机空闲端口
+    """
+
+    def __init__(self, latency_ms: float = 20, jitter_ms: float = 5, per_row_ms: float = 0.05,
+                 total: int = 1000, port: int = 0):
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.latency_ms = latency_ms
+        self._server.jitter_ms = jitter_ms
+        self._server.per_row_ms = per_row_ms
+        self._server.total = total
+        self._server.request_count = 0
+        self._server.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        return self._server.request_count
+
+    def capture(self, method: str = "GET") -> dict:
+        """生成指向桩服务的录制请求，格式与 search_benchmark.capture_search_request 的结果一致"""
+        if method == "GET":
+            url = f"{self.base_url}{STUB_SEARCH_PATH}?pageNum=1&pageSize=10&{_KEYWORD_PARAM}=stub"
+            body = None
+            headers = {"Accept": "application/json"}
+        else:
+            url = f"{self.base_url}{STUB_SEARCH_PATH}"
+            body = json.dumps({"pageNum": 1, "pageSize": 10, _KEYWORD_PARAM: "stub"})
+            headers = {"Accept": "application/json", "Content-Type": "application/json"}
+        return {"target": "民宿", "method": method, "url": url, "headers": headers, "body": body, "keyword": "stub"}
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-search-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
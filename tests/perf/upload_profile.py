@@ -0,0 +1,184 @@
+"""
+证件上传耗时分析
+
+产权证明、消防合格证明、网约房治安管理登记表与负责人证件照的上传是流程中最慢的交互。
+本工具登录房东端后打开对应表单，用 sized_file 生成的不同类型、不同大小（默认 100KB ~ 10MB）
+的文件逐个上传，每次上传前删除上一次的文件，记录各阶段耗时（见 tests.utils.upload_profiler），
+输出每个上传控件的 大小-耗时 曲线（默认写入 reports/perf/）。
+
+    python -m tests.perf.upload_profile --fd-base-url http://192.168.40.61:3333 \\
+        --username fenghuang_123 --password '***' --minsu-name 测试民宿 --repeat 3
+
+房间表单的控件需要 --minsu-name 指定一个可备案房间的民宿；表单只上传不保存，不会产生数据。
+"""
+import argparse
+import os
+import time
+
+from playwright.sync_api import sync_playwright
+
+from conf.config import (
+    PERF_REPORT_DIR,
+    UPLOAD_PROFILE_CERTIFICATE_FORMATS,
+    UPLOAD_PROFILE_IMAGE_FORMATS,
+    UPLOAD_PROFILE_SIZES,
+)
+from conf.logging_config import logger
+from tests.pages.fd.login_page import LoginPage
+from tests.pages.fd.minsu_management_page import MinsuManagementPage
+from tests.utils.page_utils import get_label_corresponding_element, scroll_to_keywords_view, select_radio_button
+from tests.utils.sized_file_factory import sized_file
+from tests.utils.upload_profiler import UploadProfiler
+
+# 上传控件：标签 -> (所在表单, 文件类型)
+ENDPOINTS = {
+    "产权证明": ("room", UPLOAD_PROFILE_CERTIFICATE_FORMATS),
+    "消防合格证明": ("room", UPLOAD_PROFILE_CERTIFICATE_FORMATS),
+    "网约房治安管理登记表": ("room", UPLOAD_PROFILE_CERTIFICATE_FORMATS),
+    "负责人证件照(正面)": ("minsu", UPLOAD_PROFILE_IMAGE_FORMATS),
+    "负责人证件照(反面)": ("minsu", UPLOAD_PROFILE_IMAGE_FORMATS),
+}
+
+
+def _remove_certificate(page, label: str):
+    """删除房间表单中已上传的证明文件"""
+    delete_link = get_label_corresponding_element(page, label, 'following-sibling::div//a[span[text()="删除"]]')
+    if delete_link.count() > 0:
+        delete_link.first.click()
+        delete_link.first.wait_for(state="detached")
+
+
+def _remove_image(page, label: str):
+    """删除新增民宿表单中已上传的证件照"""
+    delete_icon = get_label_corresponding_element(page, label, 'following-sibling::div//i[@class="el-icon-delete"]')
+    if delete_icon.count() > 0:
+        get_label_corresponding_element(
+            page, label, 'following-sibling::div//span[@class="el-upload-list__item-actions"]'
+        ).hover()
+        delete_icon.click(force=True)
+        delete_icon.wait_for(state="detached")
+
+
+def _open_form(page, form: str, options) -> bool:
+    """打开上传控件所在的表单，房间表单缺少 --minsu-name 或找不到民宿时返回 False"""
+    minsu_management_page = MinsuManagementPage(page).open(options.fd_base_url)
+    if form == "minsu":
+        minsu_management_page.go_to_add_minsu_page()
+        page.wait_for_load_state("networkidle")
+        return True
+
+    if not options.minsu_name:
+        logger.warning("未指定 --minsu-name，跳过房间表单的上传控件")
+        return False
+    if minsu_management_page.query_minsu(options.minsu_name) is None:
+        logger.warning(f"未找到民宿 {options.minsu_name}，跳过房间表单的上传控件")
+        return False
+    if not minsu_management_page.minsu_operation("备案房间", options.minsu_name):
+        return False
+    page.wait_for_load_state("networkidle")
+    # 产权类型为“自有”时显示“产权证明”上传控件
+    select_radio_button(page, "产权类型", "自有")
+    return True
+
+
+def profile_form(page, profiler: UploadProfiler, form: str, labels: list[str], options):
+    """在一个表单上依次分析各上传控件"""
+    if not _open_form(page, form, options):
+        return
+    remove = _remove_image if form == "minsu" else _remove_certificate
+    for label in labels:
+        formats = [f for f in ENDPOINTS[label][1] if not options.formats or f in options.formats]
+        for file_format in formats:
+            for size in options.sizes:
+                file_path = sized_file(file_format, size)
+                for _ in range(options.repeat):
+                    scroll_to_keywords_view(page, label)
+                    remove(page, label)
+                    file_input = get_label_corresponding_element(
+                        page, label, 'following-sibling::div//input[@type="file"]'
+                    )
+                    sample = profiler.profile(label, file_input, file_path, file_format, size)
+                    logger.info(f"{label} {file_format} {size // 1024}KB: 总耗时 {sample.total_ms}ms")
+        remove(page, label)
+
+
+def run_profile(options) -> dict:
+    """登录后逐个表单分析上传耗时，返回写出的报告"""
+    labels = options.endpoints or list(ENDPOINTS)
+    forms = {}
+    for label in labels:
+        forms.setdefault(ENDPOINTS[label][0], []).append(label)
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=options.headless)
+        context = browser.new_context()
+        page = context.new_page()
+        profiler = UploadProfiler(page, timeout=options.timeout)
+        try:
+            login_page = LoginPage(page)
+            login_page.navigate(options.fd_base_url)
+            login_page.fill_credentials(options.username, options.password)
+            login_page.click_login_button()
+            page.wait_for_load_state("networkidle")
+            for form, form_labels in forms.items():
+                profile_form(page, profiler, form, form_labels, options)
+        finally:
+            context.close()
+            browser.close()
+
+    report_path = options.report or os.path.join(
+        PERF_REPORT_DIR, f"upload_profile_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    meta = {
+        "fd_base_url": options.fd_base_url,
+        "endpoints": labels,
+        "sizes": options.sizes,
+        "formats": options.formats,
+        "repeat": options.repeat,
+    }
+    report = profiler.write_report(report_path, meta)
+    logger.info(f"上传耗时曲线（各阶段中位数，毫秒）\n{profiler.format_table()}")
+    logger.info(f"报告已写入 {report_path}")
+    return report
+
+
+def _size(value: str) -> int:
+    """解析文件大小，支持 K / M 后缀，例如 100K、2M"""
+    units = {"K": 1024, "M": 1024 * 1024}
+    value = value.strip().upper().rstrip("B")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="证件上传耗时分析")
+    parser.add_argument("--fd-base-url", required=True, help="房东端地址，例如 http://192.168.40.61:3333")
+    parser.add_argument("--username", required=True, help="房东账号")
+    parser.add_argument("--password", required=True, help="房东密码")
+    parser.add_argument("--minsu-name", help="用于打开房间备案表单的民宿名称")
+    parser.add_argument("--endpoints", type=lambda v: [e.strip() for e in v.split(",") if e.strip()],
+                        help=f"分析的上传控件，逗号分隔，默认全部：{','.join(ENDPOINTS)}")
+    parser.add_argument("--sizes", type=lambda v: [_size(s) for s in v.split(",") if s.strip()],
+                        default=UPLOAD_PROFILE_SIZES, help="文件大小档位，逗号分隔，例如 100K,1M,10M")
+    parser.add_argument("--formats", type=lambda v: [f.strip().lower() for f in v.split(",") if f.strip()],
+                        help="只分析指定的文件类型，逗号分隔，例如 png,pdf")
+    parser.add_argument("--repeat", type=int, default=3, help="每个 控件/类型/大小 组合上传的次数")
+    parser.add_argument("--timeout", type=float, default=60000, help="等待上传响应与遮罩消失的最长毫秒数")
+    parser.add_argument("--headed", dest="headless", action="store_false", help="显示浏览器窗口")
+    parser.add_argument("--report", help="报告文件路径，默认写入 reports/perf/")
+    options = parser.parse_args(argv)
+    unknown = [e for e in options.endpoints or [] if e not in ENDPOINTS]
+    if unknown:
+        parser.error(f"未知的上传控件: {','.join(unknown)}")
+    if options.repeat < 1:
+        parser.error("--repeat 至少为 1")
+    return options
+
+
+def main(argv=None):
+    run_profile(parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
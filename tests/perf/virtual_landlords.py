@@ -0,0 +1,273 @@
+"""
+虚拟房东并发压测
+
+启动 N 个虚拟房东（每个一个线程、一个独立浏览器），按 ramp-up 时间均匀错开启动，
+每个虚拟房东复用页面对象完成：登录 -> 新增民宿 -> 备案房间 -> 提交备案，
+各步骤的延迟分位数、错误率与吞吐量写入 JSON 报告（默认 reports/perf/）。
+
+    python -m tests.perf.virtual_landlords --fd-base-url http://192.168.40.61:3333 \\
+        --accounts landlords.csv --users 20 --ramp-up 60 --iterations 3 --rooms 2
+
+landlords.csv 每行 "账号,密码"，虚拟房东按顺序轮流使用；也可以用 --username / --password
+让所有虚拟房东共用一个账号（门户若限制同账号多端登录，结果会混入登录失效错误）。
+压测产生的民宿名称记录在报告的 meta.created_minsu 中，可交给 tests/prepare/delete_ms.py 清理。
+
+页面对象的方法内部带有固定等待（time.sleep），步骤耗时包含这部分时间，
+适合对比不同并发下的相对变化，而不是衡量单个接口的绝对响应时间。
+"""
+import argparse
+import csv
+import os
+import threading
+import time
+import uuid
+
+from playwright.sync_api import sync_playwright
+
+from conf.config import (
+    BATHROOM_FILES,
+    BEDROOM_FILES,
+    COMMON_ROOM_PARAMS,
+    COMMON_minsu_PARAMS,
+    JPEG_FIRE_SAFETY_CERTIFICATE,
+    JPEG_PUBLIC_SECURITY_CERTIFICATE,
+    KITCHEN_FILES,
+    LIVING_ROOM_FILES,
+    PERF_REPORT_DIR,
+)
+from conf.logging_config import logger
+from tests.pages.fd.add_new_minsu import AddNewMinsuPage
+from tests.pages.fd.filing_room_page import FilingRoomPage
+from tests.pages.fd.login_page import LoginPage
+from tests.pages.fd.minsu_management_page import MinsuManagementPage
+from tests.utils.perf_stats import PerfStats
+
+
+class _AbortIteration(Exception):
+    """步骤失败，放弃本轮剩余步骤"""
+
+
+class VirtualLandlord:
+    """
+    单个虚拟房东
+
+    Args:
+        index: 虚拟房东序号
+        account: (账号, 密码)
+        options: 命令行参数
+        stats: 共享的 PerfStats
+        run_id: 本次压测标识，用于生成不重复的民宿名称
+    """
+
+    def __init__(self, index: int, account: tuple[str, str], options, stats: PerfStats, run_id: str):
+        self.user = f"vu{index:02d}"
+        self.username, self.password = account
+        self.options = options
+        self.stats = stats
+        self.run_id = run_id
+        self.created_minsu = []
+        self.completed_iterations = 0
+        self.failed_iterations = 0
+
+    def _step(self, step: str, action):
+        """执行一个步骤：action 返回 False 视为失败；失败时放弃本轮"""
+        with self.stats.measure(step, self.user) as measurement:
+            try:
+                if action() is False:
+                    measurement.fail()
+            except Exception as e:
+                measurement.fail(f"{type(e).__name__}: {e}")
+        if not measurement.ok:
+            logger.error(f"[{self.user}] 步骤「{step}」失败: {measurement.error}")
+            raise _AbortIteration(step)
+
+    def _login(self, page):
+        def action():
+            login_page = LoginPage(page)
+            login_page.navigate(self.options.fd_base_url)
+            login_page.fill_credentials(self.username, self.password)
+            login_page.click_login_button()
+            page.wait_for_load_state("networkidle")
+            return "/login" not in page.url
+
+        self._step("登录", action)
+
+    def _open_minsu_management(self, page) -> MinsuManagementPage:
+        minsu_management_page = MinsuManagementPage(page)
+        self._step("打开民宿管理", lambda: minsu_management_page.open(self.options.fd_base_url))
+        return minsu_management_page
+
+    def _query(self, minsu_management_page: MinsuManagementPage, minsu_name: str):
+        self._step("查询民宿", lambda: minsu_management_page.query_minsu(minsu_name) is not None)
+
+    def _run_iteration(self, page, iteration: int):
+        minsu_name = f"压测{self.run_id}_{self.user}_{iteration:02d}"
+        minsu_management_page = self._open_minsu_management(page)
+
+        def add_minsu():
+            minsu_management_page.go_to_add_minsu_page()
+            page.wait_for_load_state("load")
+            AddNewMinsuPage(page).add_new_minsu(**{**COMMON_minsu_PARAMS, "minsu_name": minsu_name})
+            page.wait_for_load_state("networkidle")
+
+        self._step("新增民宿", add_minsu)
+        self.created_minsu.append(minsu_name)
+
+        for room_index in range(1, self.options.rooms + 1):
+            self._query(minsu_management_page, minsu_name)
+
+            def filing_room(room_name=f"{minsu_name}_房{room_index}"):
+                if not minsu_management_page.minsu_operation("备案房间", minsu_name):
+                    return False
+                filing_room_page = FilingRoomPage(page)
+                filing_room_page.filing_room(
+                    property_certificate=JPEG_FIRE_SAFETY_CERTIFICATE,
+                    fire_safety_certificate=JPEG_FIRE_SAFETY_CERTIFICATE,
+                    public_security_registration_form=JPEG_PUBLIC_SECURITY_CERTIFICATE,
+                    bedroom_files=BEDROOM_FILES,
+                    living_room_files=LIVING_ROOM_FILES,
+                    kitchen_files=KITCHEN_FILES,
+                    bathroom_files=BATHROOM_FILES,
+                    **{**COMMON_ROOM_PARAMS, "ms_name": minsu_name, "room_name": room_name},
+                )
+                filing_room_page.submit_form()
+                return filing_room_page.check_register_result()
+
+            self._step("备案房间", filing_room)
+            page.wait_for_load_state("networkidle")
+
+        self._step("提交备案", lambda: minsu_management_page.minsu_submit(minsu_name))
+
+        def check_status():
+            row = minsu_management_page.query_minsu(minsu_name)
+            return row is not None and minsu_management_page.check_filing_status("待确认", row - 1)
+
+        self._step("核对备案状态", check_status)
+
+    def run(self, start_delay: float, deadline: float | None):
+        time.sleep(start_delay)
+        logger.info(f"[{self.user}] 启动，账号 {self.username}")
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=self.options.headless)
+            context = browser.new_context()
+            page = context.new_page()
+            try:
+                self._login(page)
+                iteration = 0
+                while True:
+                    iteration += 1
+                    if deadline is None and iteration > self.options.iterations:
+                        break
+                    if deadline is not None and time.time() >= deadline:
+                        break
+                    with self.stats.measure("完整流程", self.user) as measurement:
+                        try:
+                            self._run_iteration(page, iteration)
+                        except _AbortIteration as e:
+                            measurement.fail(f"步骤「{e}」失败")
+                    if measurement.ok:
+                        self.completed_iterations += 1
+                    else:
+                        self.failed_iterations += 1
+                    if self.options.think_time:
+                        time.sleep(self.options.think_time)
+            except _AbortIteration:
+                self.failed_iterations += 1
+            except Exception as e:
+                logger.error(f"[{self.user}] 异常退出: {e}", exc_info=True)
+            finally:
+                context.close()
+                browser.close()
+        logger.info(f"[{self.user}] 结束：成功 {self.completed_iterations} 轮，失败 {self.failed_iterations} 轮")
+
+
+def load_accounts(options) -> list[tuple[str, str]]:
+    """读取虚拟房东使用的账号列表"""
+    if options.accounts:
+        with open(options.accounts, encoding="utf-8-sig", newline="") as f:
+            accounts = [
+                (row[0].strip(), row[1].strip())
+                for row in csv.reader(f)
+                if len(row) >= 2 and row[0].strip() and not row[0].startswith("#")
+            ]
+        if not accounts:
+            raise ValueError(f"账号文件中没有可用账号: {options.accounts}")
+        return accounts
+    if options.username and options.password:
+        return [(options.username, options.password)]
+    raise ValueError("需要通过 --accounts 或 --username/--password 提供房东账号")
+
+
+def run_load(options) -> dict:
+    """按参数启动虚拟房东并等待全部结束，返回写出的报告"""
+    accounts = load_accounts(options)
+    run_id = uuid.uuid4().hex[:4]
+    stats = PerfStats()
+    deadline = time.time() + options.ramp_up + options.duration if options.duration else None
+
+    landlords = [
+        VirtualLandlord(i, accounts[(i - 1) % len(accounts)], options, stats, run_id)
+        for i in range(1, options.users + 1)
+    ]
+    interval = options.ramp_up / options.users if options.users else 0
+    threads = [
+        threading.Thread(target=landlord.run, args=(interval * n, deadline), name=landlord.user, daemon=True)
+        for n, landlord in enumerate(landlords)
+    ]
+    logger.info(f"启动 {options.users} 个虚拟房东，ramp-up {options.ramp_up}s，压测标识 {run_id}")
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats.finish()
+
+    report_path = options.report or os.path.join(
+        PERF_REPORT_DIR, f"virtual_landlords_{time.strftime('%Y%m%d_%H%M%S')}_{run_id}.json"
+    )
+    meta = {
+        "run_id": run_id,
+        "fd_base_url": options.fd_base_url,
+        "users": options.users,
+        "accounts": len(accounts),
+        "ramp_up_s": options.ramp_up,
+        "iterations": options.iterations,
+        "duration_s": options.duration,
+        "rooms": options.rooms,
+        "think_time_s": options.think_time,
+        "completed_iterations": sum(l.completed_iterations for l in landlords),
+        "failed_iterations": sum(l.failed_iterations for l in landlords),
+        "created_minsu": [name for l in landlords for name in l.created_minsu],
+    }
+    report = stats.write_report(report_path, meta)
+    logger.info(f"压测结果\n{stats.format_table()}")
+    logger.info(f"报告已写入 {report_path}")
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="虚拟房东并发压测")
+    parser.add_argument("--fd-base-url", required=True, help="房东端地址，例如 http://192.168.40.61:3333")
+    parser.add_argument("--accounts", help="账号文件，每行 账号,密码")
+    parser.add_argument("--username", help="所有虚拟房东共用的账号")
+    parser.add_argument("--password", help="所有虚拟房东共用的密码")
+    parser.add_argument("--users", type=int, default=5, help="虚拟房东数量")
+    parser.add_argument("--ramp-up", type=float, default=10, help="全部虚拟房东启动完成所用的秒数")
+    parser.add_argument("--iterations", type=int, default=1, help="每个虚拟房东执行的轮数")
+    parser.add_argument("--duration", type=float, default=0,
+                        help="持续压测的秒数（不含 ramp-up），设置后忽略 --iterations")
+    parser.add_argument("--rooms", type=int, default=1, help="每个民宿备案的房间数")
+    parser.add_argument("--think-time", type=float, default=0, help="两轮之间的等待秒数")
+    parser.add_argument("--headed", dest="headless", action="store_false", help="显示浏览器窗口")
+    parser.add_argument("--report", help="报告文件路径，默认写入 reports/perf/")
+    options = parser.parse_args(argv)
+    if options.users < 1:
+        parser.error("--users 至少为 1")
+    return options
+
+
+def main(argv=None):
+    run_load(parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+静态资源缓存插件
+
+为每个使用 page fixture 或页面池的用例在其 BrowserContext 上注册 AssetCache 路由，
+门户 JS/CSS 打包文件在所有 context 与 xdist 进程间复用，并在会话结束时输出命中统计。
+
+本插件的路由晚于 network_profile 注册、因而先执行；第三方资源与非缓存资源通过 route.fallback()
+交还给网络拦截方案，stub / abort 仍然生效。
+"""
+import os
+import uuid
+
+import pytest
+
+from conf.config import ASSET_CACHE_DIR, ASSET_CACHE_RESOURCE_TYPES, ASSET_CACHE_URL_PATTERNS
+from tests.utils.asset_cache import AssetCache
+from tests.utils.page_pool import context_setup, uses_browser_page
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-asset-cache",
+        action="store_true",
+        default=False,
+        help="关闭静态资源本地缓存，所有 JS/CSS 直接从服务器下载",
+    )
+
+
+def pytest_configure(config):
+    # HAR 录制/回放时资源由 HAR 提供，不再走本地缓存
+    if config.getoption("--no-asset-cache") or config.getoption("--har-mode", "off") != "off":
+        config._asset_cache = None
+        return
+    # xdist 各进程共享同一 testrunuid，保证整个会话只校验一次；单进程运行时自行生成
+    session_id = os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+    config._asset_cache = AssetCache(
+        ASSET_CACHE_DIR,
+        session_id,
+        resource_types=ASSET_CACHE_RESOURCE_TYPES,
+        url_patterns=ASSET_CACHE_URL_PATTERNS,
+    )
+
+
+@pytest.fixture(autouse=True)
+def asset_cache(request):
+    """为当前页面的 BrowserContext 安装静态资源缓存路由"""
+    cache = request.config._asset_cache
+    if cache is None or not uses_browser_page(request):
+        yield None
+        return
+
+    def install(context):
+        context.route("**/*", cache.handle)
+        return lambda: context.unroute("**/*", cache.handle)
+
+    with context_setup(request, install):
+        yield cache
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    cache = getattr(config, "_asset_cache", None)
+    if cache is None:
+        return
+    stats = cache.stats
+    if not any(stats[k] for k in ("hit", "revalidated", "miss")):
+        return
+    terminalreporter.section("静态资源缓存统计")
+    terminalreporter.write_line(
+        f"命中 {stats['hit']}，条件请求校验通过 {stats['revalidated']}，下载 {stats['miss']}，"
+        f"本地返回 {stats['bytes_served'] / 1024:.1f} KB"
+    )
@@ -0,0 +1,70 @@
+"""
+常驻浏览器服务插件
+
+提供会话级 fixture browser 与用例级 fixture context、page：
+    - 使用 --browser-server 时连接 tests.utils.browser_server 启动的常驻服务，
+      服务不存在或不可达时回退为本地启动
+    - 每个用例一个独立的 BrowserContext，用例结束后关闭
+
+Playwright 实例优先取会话中已有的 playwright fixture（pytest-playwright 或 conftest 定义），
+否则使用 tests.utils.browser_server.shared_playwright()。同一线程只能有一个同步 API 的 Playwright，
+conftest 中自行创建 page 的 fixture 必须复用同一实例，否则本插件与页面池的 fixture 无法使用，例如：
+
+    @pytest.fixture
+    def page(context):
+        page = context.new_page()
+        ...
+
+或在 conftest 中删除 page fixture 直接使用本插件的 page，--browser-server 才对现有用例生效。
+"""
+import pytest
+from _pytest.fixtures import FixtureLookupError
+
+from tests.utils.browser_server import BrowserProvider, shared_playwright, stop_shared_playwright
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-server",
+        action="store_true",
+        default=False,
+        help="连接常驻浏览器服务（python -m tests.utils.browser_server start），不可用时本地启动",
+    )
+
+
+@pytest.fixture(scope="session")
+def browser_provider(request):
+    try:
+        playwright = request.getfixturevalue("playwright")
+    except FixtureLookupError:
+        playwright = shared_playwright()
+    provider = BrowserProvider(playwright, use_server=request.config.getoption("--browser-server"))
+    yield provider
+    provider.close()
+
+
+@pytest.fixture(scope="session")
+def browser(browser_provider):
+    return browser_provider.get()
+
+
+@pytest.fixture
+def context(browser_provider):
+    # 每次重新获取：常驻服务在会话中途断开时重新连接或回退为本地启动
+    context = browser_provider.get().new_context()
+    yield context
+    try:
+        context.close()
+    except Exception:
+        # 连接已断开时 context 随之失效
+        pass
+
+
+@pytest.fixture
+def page(context):
+    # 页面随 context 一起关闭
+    return context.new_page()
+
+
+def pytest_unconfigure(config):
+    stop_shared_playwright()
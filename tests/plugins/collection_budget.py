@@ -0,0 +1,84 @@
+"""
+用例收集耗时预算插件
+
+统计用例收集阶段（导入测试模块及其依赖的页面对象、工具模块）的耗时，在会话结束时输出，
+超出 --collect-budget 时列出最慢的测试模块；使用 --collect-budget-strict 时以失败状态退出，
+用于发现在模块顶层导入了重量级依赖（paramiko、Faker、mysql.connector 等）的改动。
+
+xdist 运行时收集在各 worker 中进行，主进程不统计。
+"""
+import time
+
+import pytest
+
+from conf.config import COLLECTION_SLOWEST_MODULES, COLLECTION_TIME_BUDGET
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--collect-budget",
+        type=float,
+        default=COLLECTION_TIME_BUDGET,
+        help="用例收集耗时预算（秒），0 表示不检查",
+    )
+    parser.addoption(
+        "--collect-budget-strict",
+        action="store_true",
+        default=False,
+        help="用例收集耗时超出预算时以失败状态退出",
+    )
+
+
+def pytest_configure(config):
+    config._collection_started = None
+    config._collection_elapsed = None
+    config._collection_modules = []
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection(session):
+    session.config._collection_started = time.perf_counter()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    if not isinstance(collector, pytest.Module):
+        yield
+        return
+    started = time.perf_counter()
+    yield
+    collector.config._collection_modules.append((time.perf_counter() - started, collector.nodeid))
+
+
+def pytest_collection_finish(session):
+    started = session.config._collection_started
+    if started is not None:
+        session.config._collection_elapsed = time.perf_counter() - started
+
+
+def _over_budget(config) -> bool:
+    budget = config.getoption("--collect-budget")
+    elapsed = config._collection_elapsed
+    return bool(budget) and elapsed is not None and elapsed > budget
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session, exitstatus):
+    if (session.config.getoption("--collect-budget-strict") and _over_budget(session.config)
+            and exitstatus == pytest.ExitCode.OK):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    elapsed = config._collection_elapsed
+    if elapsed is None:
+        return
+    budget = config.getoption("--collect-budget")
+    if not _over_budget(config):
+        terminalreporter.write_line(f"用例收集耗时 {elapsed:.2f}s（预算 {budget:g}s）")
+        return
+
+    terminalreporter.section("用例收集超出预算")
+    terminalreporter.write_line(f"用例收集耗时 {elapsed:.2f}s，超出预算 {budget:g}s，最慢的测试模块：")
+    for duration, nodeid in sorted(config._collection_modules, reverse=True)[:COLLECTION_SLOWEST_MODULES]:
+        terminalreporter.write_line(f"  {duration:.2f}s  {nodeid}")
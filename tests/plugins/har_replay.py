@@ -0,0 +1,164 @@
+"""
+HAR 录制/回放插件
+
+--har-mode=record  每个用例的网络流量通过 route_from_har(update=True) 录制到独立 HAR 文件，
+                   会话结束后把易变字段（时间戳、令牌等）统一替换为占位值
+--har-mode=replay  通过 route_from_har 回放录制的响应，未录制的请求直接中止，
+                   请求发出前先做同样的易变字段归一化，保证与录制内容匹配
+
+回放只覆盖浏览器侧流量；直接连接 MySQL / SSH 的用例仍需要真实环境。
+"""
+import json
+import os
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import pytest
+
+from conf.config import (
+    HAR_DIR,
+    HAR_VOLATILE_BODY_FIELDS,
+    HAR_VOLATILE_PLACEHOLDER,
+    HAR_VOLATILE_QUERY_PARAMS,
+)
+from conf.logging_config import logger
+from tests.utils.page_pool import context_setup, uses_browser_page
+
+_VOLATILE_QUERY = frozenset(HAR_VOLATILE_QUERY_PARAMS)
+_VOLATILE_BODY = frozenset(HAR_VOLATILE_BODY_FIELDS)
+
+
+def normalize_url(url: str) -> str:
+    """把 URL 查询参数中的易变字段替换为占位值"""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if not any(key in _VOLATILE_QUERY for key, _ in query):
+        return url
+    query = [(key, HAR_VOLATILE_PLACEHOLDER if key in _VOLATILE_QUERY else value) for key, value in query]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _normalize_json(value):
+    if isinstance(value, dict):
+        return {
+            key: HAR_VOLATILE_PLACEHOLDER if key in _VOLATILE_BODY else _normalize_json(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_normalize_json(item) for item in value]
+    return value
+
+
+def normalize_post_data(post_data: str | None, content_type: str = "") -> str | None:
+    """把请求体（JSON 或表单）中的易变字段替换为占位值，无法识别的格式原样返回"""
+    if not post_data:
+        return post_data
+    if "json" in content_type or post_data.lstrip().startswith(("{", "[")):
+        try:
+            return json.dumps(_normalize_json(json.loads(post_data)), ensure_ascii=False, separators=(",", ":"))
+        except ValueError:
+            return post_data
+    if "x-www-form-urlencoded" in content_type:
+        fields = parse_qsl(post_data, keep_blank_values=True)
+        return urlencode(
+            [(key, HAR_VOLATILE_PLACEHOLDER if key in _VOLATILE_BODY else value) for key, value in fields]
+        )
+    return post_data
+
+
+def normalize_har_file(har_path: str):
+    """录制完成后对 HAR 文件中的请求做归一化，写回原文件"""
+    with open(har_path, "r", encoding="utf-8") as f:
+        har = json.load(f)
+
+    for entry in har.get("log", {}).get("entries", []):
+        request = entry["request"]
+        request["url"] = normalize_url(request["url"])
+        request["queryString"] = [
+            {"name": q["name"], "value": HAR_VOLATILE_PLACEHOLDER if q["name"] in _VOLATILE_QUERY else q["value"]}
+            for q in request.get("queryString", [])
+        ]
+        post_data = request.get("postData")
+        if post_data and "text" in post_data:
+            post_data["text"] = normalize_post_data(post_data["text"], post_data.get("mimeType", ""))
+
+    with open(har_path, "w", encoding="utf-8") as f:
+        json.dump(har, f, ensure_ascii=False, indent=2)
+
+
+def har_path_for(item) -> str:
+    """按测试模块与用例名生成 HAR 文件路径"""
+    module = os.path.splitext(os.path.relpath(str(item.path), str(item.config.rootpath)))[0]
+    name = re.sub(r"[^\w\-.]+", "_", item.name)
+    return os.path.join(HAR_DIR, module, f"{name}.har")
+
+
+def _normalizing_route(route):
+    """回放时先归一化请求，再交给 route_from_har 匹配"""
+    request = route.request
+    url = normalize_url(request.url)
+    post_data = normalize_post_data(request.post_data, request.headers.get("content-type", ""))
+    if url == request.url and post_data == request.post_data:
+        route.fallback()
+    else:
+        route.fallback(url=url, post_data=post_data)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--har-mode",
+        action="store",
+        default="off",
+        choices=("off", "record", "replay"),
+        help="HAR 录制/回放模式：off（默认，访问真实环境）、record、replay",
+    )
+
+
+def pytest_configure(config):
+    config._har_recorded = []
+
+
+@pytest.fixture(autouse=True)
+def har_replay(request):
+    """按 --har-mode 为当前页面的 BrowserContext 安装 HAR 录制或回放"""
+    mode = request.config.getoption("--har-mode")
+    if mode == "off" or not uses_browser_page(request):
+        yield None
+        return
+
+    har_path = har_path_for(request.node)
+
+    if mode == "record":
+        os.makedirs(os.path.dirname(har_path), exist_ok=True)
+
+        def record(context):
+            context.route_from_har(har_path, update=True, update_content="embed")
+            # HAR 在 context 关闭时写出：用例结束即关闭，池中页面因此不再复用；归一化放到会话结束统一处理
+            return context.close
+
+        request.config._har_recorded.append(har_path)
+        with context_setup(request, record):
+            yield har_path
+        return
+
+    if not os.path.exists(har_path):
+        pytest.skip(f"未找到录制的 HAR 文件: {har_path}，请先使用 --har-mode=record 运行")
+
+    def replay(context):
+        context.route_from_har(har_path, not_found="abort")
+        # 后注册的路由先执行：归一化后回退给 HAR 路由匹配
+        context.route("**/*", _normalizing_route)
+
+    with context_setup(request, replay):
+        yield har_path
+
+
+def pytest_sessionfinish(session, exitstatus):
+    for har_path in session.config._har_recorded:
+        if not os.path.exists(har_path):
+            logger.warning(f"HAR 文件未生成（context 可能未正常关闭）: {har_path}")
+            continue
+        normalize_har_file(har_path)
+        logger.info(f"已录制并归一化 HAR: {har_path}")
@@ -0,0 +1,217 @@
+"""
+网络拦截方案插件
+
+根据测试标记（room、register 等）为页面所在的 BrowserContext 注册路由拦截，
+中止或以空响应替换表单校验用例不需要的资源（图片、字体、地图瓦片、统计脚本），
+并在会话结束时汇总被拦截的请求数、字节数和估算节省的加载时间。
+
+被拦截的请求不会真正下载，字节数和耗时取自未拦截时记录在 pytest 缓存中的历史值，
+首次运行（或 --network-profile=off 运行）时只统计请求数。
+"""
+import re
+
+import pytest
+
+from conf.config import MARKER_NETWORK_PROFILES, NETWORK_PROFILES
+from conf.logging_config import logger
+from tests.utils.page_pool import context_setup, uses_browser_page
+
+# pytest 缓存键：{url: {"bytes": 响应体字节数, "ms": 加载耗时}}
+_RESOURCE_CACHE_KEY = "network_profile/resources"
+
+# stub 响应按资源类型返回的内容类型
+_STUB_CONTENT_TYPES = {
+    "script": "application/javascript",
+    "stylesheet": "text/css",
+    "image": "image/gif",
+    "xhr": "application/json",
+    "fetch": "application/json",
+}
+
+
+class _CompiledProfile:
+    """预编译的拦截方案，避免每个请求重复编译正则"""
+
+    def __init__(self, name: str, config: dict):
+        self.name = name
+        self.abort_resource_types = frozenset(config.get("abort_resource_types", ()))
+        self.abort_patterns = [re.compile(p) for p in config.get("abort_url_patterns", ())]
+        self.stub_patterns = [re.compile(p) for p in config.get("stub_url_patterns", ())]
+
+    def decide(self, url: str, resource_type: str) -> str:
+        """返回 "stub"、"abort" 或 "pass" """
+        if any(p.search(url) for p in self.stub_patterns):
+            return "stub"
+        if resource_type in self.abort_resource_types or any(p.search(url) for p in self.abort_patterns):
+            return "abort"
+        return "pass"
+
+
+class NetworkProfileStats:
+    """会话级拦截统计"""
+
+    def __init__(self, known_resources: dict):
+        self.known_resources = known_resources
+        self.learned_resources = {}
+        self.aborted = 0
+        self.stubbed = 0
+        self.blocked_bytes = 0
+        self.saved_ms = 0.0
+        self.unknown = 0
+        self.by_profile = {}
+
+    def record_blocked(self, profile: str, url: str, action: str):
+        if action == "abort":
+            self.aborted += 1
+        else:
+            self.stubbed += 1
+        self.by_profile[profile] = self.by_profile.get(profile, 0) + 1
+
+        known = self.known_resources.get(url)
+        if known is None:
+            self.unknown += 1
+            return
+        self.blocked_bytes += known.get("bytes", 0)
+        self.saved_ms += known.get("ms", 0.0)
+
+    def learn(self, url: str, body_bytes: int, duration_ms: float):
+        """记录未被拦截时资源的真实大小与耗时，供后续拦截运行估算"""
+        self.learned_resources[url] = {"bytes": body_bytes, "ms": round(duration_ms, 1)}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--network-profile",
+        action="store",
+        default="auto",
+        help="网络拦截方案：auto 按测试标记选择（默认），off 关闭拦截，或直接指定 conf.NETWORK_PROFILES 中的方案名",
+    )
+
+
+def pytest_configure(config):
+    option = config.getoption("--network-profile")
+    if option not in ("auto", "off") and option not in NETWORK_PROFILES:
+        raise pytest.UsageError(f"未知的网络拦截方案: {option}，可选: auto, off, {', '.join(NETWORK_PROFILES)}")
+
+    known = config.cache.get(_RESOURCE_CACHE_KEY, {}) if config.cache else {}
+    config._network_profile_stats = NetworkProfileStats(known)
+    config._network_profiles = {name: _CompiledProfile(name, cfg) for name, cfg in NETWORK_PROFILES.items()}
+
+
+def _select_profile(item) -> str | None:
+    """根据命令行选项与测试标记选择拦截方案名"""
+    option = item.config.getoption("--network-profile")
+    if option == "off":
+        return None
+    if option != "auto":
+        return option
+    for marker in item.iter_markers():
+        if marker.name == "network_profile":
+            return marker.args[0] if marker.args else None
+        if marker.name in MARKER_NETWORK_PROFILES:
+            return MARKER_NETWORK_PROFILES[marker.name]
+    return None
+
+
+def _make_route_handler(profile: _CompiledProfile, stats: NetworkProfileStats):
+    def handle(route):
+        request = route.request
+        action = profile.decide(request.url, request.resource_type)
+        if action == "pass":
+            route.fallback()
+            return
+
+        stats.record_blocked(profile.name, request.url, action)
+        if action == "abort":
+            route.abort("blockedbyclient")
+        else:
+            route.fulfill(
+                status=200,
+                body="",
+                content_type=_STUB_CONTENT_TYPES.get(request.resource_type, "text/plain"),
+            )
+
+    return handle
+
+
+def _make_learning_listener(stats: NetworkProfileStats, profiles: dict):
+    """未启用拦截时，记录本可被拦截的资源大小与耗时"""
+
+    def on_request_finished(request):
+        if all(p.decide(request.url, request.resource_type) == "pass" for p in profiles.values()):
+            return
+        try:
+            sizes = request.sizes()
+            timing = request.timing
+        except Exception:
+            return
+        duration = timing.get("responseEnd", -1)
+        stats.learn(request.url, sizes.get("responseBodySize", 0), max(duration, 0.0))
+
+    return on_request_finished
+
+
+@pytest.fixture(autouse=True)
+def network_profile(request):
+    """
+    按测试标记为当前页面的 BrowserContext 安装网络拦截方案
+
+    对使用了 page fixture 或页面池（pooled_page）的用例生效；拦截注册在 context 上，用例中新开的页面同样生效。
+    """
+    if not uses_browser_page(request):
+        yield None
+        return
+
+    config = request.config
+    stats = config._network_profile_stats
+    profile_name = _select_profile(request.node)
+
+    if profile_name is None:
+        listener = _make_learning_listener(stats, config._network_profiles)
+
+        def learn(context):
+            context.on("requestfinished", listener)
+            return lambda: context.remove_listener("requestfinished", listener)
+
+        with context_setup(request, learn):
+            yield None
+        return
+
+    profile = config._network_profiles[profile_name]
+    handler = _make_route_handler(profile, stats)
+
+    def block(context):
+        context.route("**/*", handler)
+        return lambda: context.unroute("**/*", handler)
+
+    logger.info(f"已启用网络拦截方案: {profile_name}")
+    with context_setup(request, block):
+        yield profile_name
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    stats = getattr(config, "_network_profile_stats", None)
+    if stats is None:
+        return
+
+    if stats.learned_resources and config.cache:
+        merged = dict(stats.known_resources)
+        merged.update(stats.learned_resources)
+        config.cache.set(_RESOURCE_CACHE_KEY, merged)
+
+    blocked = stats.aborted + stats.stubbed
+    if blocked == 0:
+        return
+
+    terminalreporter.section("网络拦截统计")
+    terminalreporter.write_line(f"拦截请求数: {blocked}（中止 {stats.aborted}，空响应 {stats.stubbed}）")
+    for name, count in sorted(stats.by_profile.items()):
+        terminalreporter.write_line(f"  方案 {name}: {count}")
+    terminalreporter.write_line(
+        f"节省流量: {stats.blocked_bytes / 1024:.1f} KB，估算节省加载时间: {stats.saved_ms / 1000:.2f} s"
+        f"（按资源串行耗时累加，为上限估计）"
+    )
+    if stats.unknown:
+        terminalreporter.write_line(
+            f"其中 {stats.unknown} 个请求无历史大小记录，可使用 --network-profile=off 运行一次以采集"
+        )
@@ -0,0 +1,87 @@
+"""
+预热页面池插件
+
+提供会话级 fixture page_pool（每个 xdist 进程一个 PagePool）与用例级 fixture pooled_page：
+
+    def test_xxx(pooled_page):
+        page = pooled_page("fd:注册表单")
+
+用例结束后自动归还，用例失败时页面直接关闭不再复用。定义了 fd_base_url fixture 时自动登记
+"fd:注册表单"；需要登录态或前置数据的表单由套件自行登记，例如房间备案表单
+（tests/test_suites/fd/test_filing_room.py 中的 filing_room_pool）：
+
+    @pytest.fixture(scope="session")
+    def filing_room_pool(page_pool, browser_provider, fd_base_url, fd_test_user):
+        storage_state = ...  # 登录一次取得登录态
+
+        def warm(page):
+            RoomManagementPage(page).open(fd_base_url).go_to_filling_room_page()
+
+        def reset(page):
+            ...  # 单页应用内重新进入表单，失败时 warm(page)
+
+        page_pool.register("fd:房间备案表单", warm, reset=reset, storage_state=storage_state)
+        return page_pool
+
+归还时撤销用例添加的路由拦截（例如短信验证码桩），cookies 与 localStorage 恢复到预热完成时的状态。
+网络拦截、静态资源缓存、HAR 录制/回放与导航指标插件通过 PagePool.add_context_setup 作用于用例借出的页面；
+不在用例内借出的页面（例如类级 fixture 直接调用 page_pool.page()）不受这些插件影响。
+"""
+import pytest
+from _pytest.fixtures import FixtureLookupError
+
+from tests.utils.page_pool import PagePool
+
+
+@pytest.fixture(scope="session")
+def page_pool(request, browser_provider):
+    pool = PagePool(lambda **options: browser_provider.get().new_context(**options))
+    try:
+        fd_base_url = request.getfixturevalue("fd_base_url")
+    except FixtureLookupError:
+        fd_base_url = None
+    if fd_base_url:
+        from tests.pages.fd.register_page import RegisterPage
+        pool.register("fd:注册表单", lambda page: RegisterPage(page).navigate(fd_base_url))
+
+    request.config._page_pool = pool
+    yield pool
+    request.config._page_pool_leaks = pool.close()
+
+
+@pytest.fixture
+def pooled_page(request, page_pool):
+    """借出页面的工厂，用例结束后归还"""
+    borrowed = []
+
+    def checkout(route: str):
+        page = page_pool.checkout(route, owner=request.node.nodeid)
+        borrowed.append(page)
+        return page
+
+    yield checkout
+    failed = getattr(request.node, "_page_pool_failed", False)
+    for page in borrowed:
+        page_pool.checkin(page, discard=failed)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed:
+        item._page_pool_failed = True
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    pool = getattr(config, "_page_pool", None)
+    if pool is None:
+        return
+    stats = pool.stats
+    terminalreporter.section("页面池")
+    terminalreporter.write_line(
+        f"命中 {stats['hits']}，新建 {stats['misses']}，LRU 淘汰 {stats['evictions']}，"
+        f"回收 {stats['recycled']}，重置失败 {stats['reset_failures']}，关闭残留页面 {stats['stray_pages']}"
+    )
+    for route, owner in getattr(config, "_page_pool_leaks", []):
+        terminalreporter.write_line(f"未归还: {route}，借用者 {owner or '未知'}")
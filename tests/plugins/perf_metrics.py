@@ -0,0 +1,102 @@
+"""
+前端性能指标插件
+
+默认关闭，使用 --perf-metrics 开启。开启后为每个使用 page fixture 或页面池的用例：
+    - 在 BrowserContext 上注入 PerformanceObserver（长任务、LCP）
+    - 激活 NavigationMetricsRecorder，页面对象中以 record_navigation 装饰的导航方法自动采集指标
+    - 用例结束后将指标写入 user_properties（junitxml / pytest-html 报告可见），安装了 allure 时附加为 JSON
+
+指标追加到 PERF_METRICS_HISTORY，并与同一导航最近若干次的中位数比较，明显变慢时在会话结束汇总；
+使用 --perf-metrics-strict 时变慢的用例判定为失败。HAR 回放时页面不访问真实门户，不采集。
+"""
+import json
+
+import pytest
+
+from conf.config import PERF_METRICS_HISTORY
+from tests.utils.page_pool import context_setup, uses_browser_page
+from tests.utils.perf_metrics import (
+    PERF_OBSERVER_SCRIPT,
+    NavigationMetricsRecorder,
+    load_baseline,
+    set_active_recorder,
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=False,
+        help="采集页面导航的前端性能指标并与历史基线比较（默认不采集）",
+    )
+    parser.addoption(
+        "--perf-metrics-strict",
+        action="store_true",
+        default=False,
+        help="导航指标明显慢于历史基线时判定用例失败（需同时使用 --perf-metrics）",
+    )
+
+
+def pytest_configure(config):
+    enabled = config.getoption("--perf-metrics") and config.getoption("--har-mode", "off") == "off"
+    config._perf_metrics_baseline = load_baseline(PERF_METRICS_HISTORY) if enabled else None
+    config._perf_metrics_regressions = []
+
+
+@pytest.fixture(autouse=True)
+def perf_metrics(request):
+    """为当前用例激活导航指标记录"""
+    baseline = request.config._perf_metrics_baseline
+    if baseline is None or not uses_browser_page(request):
+        yield None
+        return
+
+    profile = request.getfixturevalue("network_profile")
+
+    def observe(context):
+        context.add_init_script(PERF_OBSERVER_SCRIPT)
+        # 池中页面已加载完成，init script 要到下一次整页加载才执行，先在当前文档中补上
+        for page in context.pages:
+            page.evaluate(PERF_OBSERVER_SCRIPT)
+
+    recorder = NavigationMetricsRecorder(request.node.nodeid, profile=profile, baseline=baseline)
+    set_active_recorder(recorder)
+    request.node._perf_metrics_recorder = recorder
+    with context_setup(request, observe):
+        yield recorder
+    set_active_recorder(None)
+
+    if recorder.records:
+        request.node.user_properties.append(("navigation_metrics", json.dumps(recorder.records, ensure_ascii=False)))
+        try:
+            import allure
+        except ImportError:
+            pass
+        else:
+            allure.attach(
+                json.dumps(recorder.records, ensure_ascii=False, indent=2),
+                name="navigation_metrics",
+                attachment_type=allure.attachment_type.JSON,
+            )
+    request.config._perf_metrics_regressions.extend((request.node.nodeid, m) for m in recorder.regressions)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    recorder = getattr(item, "_perf_metrics_recorder", None)
+    if (report.when == "call" and report.passed and recorder is not None and recorder.regressions
+            and item.config.getoption("--perf-metrics-strict")):
+        report.outcome = "failed"
+        report.longrepr = "页面渲染明显慢于历史基线:\n" + "\n".join(recorder.regressions)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    regressions = getattr(config, "_perf_metrics_regressions", None)
+    if not regressions:
+        return
+    terminalreporter.section("页面渲染变慢")
+    for nodeid, message in regressions:
+        terminalreporter.write_line(f"{nodeid}: {message}")
@@ -0,0 +1,87 @@
+"""
+场景检查点插件
+
+提供会话级 fixture scenario_checkpoint。用例声明需要的前置场景及其构造方法，
+本会话第一次需要时执行构造并保存检查点，之后直接从检查点恢复：
+
+    def test_xxx(scenario_checkpoint, browser):
+        restored = scenario_checkpoint.ensure(
+            "minsu_pending_one_room",
+            lambda: build_minsu_with_room(browser, fd_base_url, fd_test_user, submit=True),
+        )
+        context = browser.new_context(storage_state=restored["storage_state"])
+        minsu_name = next(iter(restored["names"].values()))
+
+build 函数返回 (根表名称列表, storage_state)，界面构造流程见 tests/utils/scenario_builders.py。
+检查点带有会话标识，每个会话都会重新构造；xdist 各进程共享 testrunuid 与检查点目录，同一场景只由一个进程构造，其余进程等待后直接恢复。
+会话结束时删除 clone 出来的数据。
+"""
+import os
+import time
+import uuid
+
+import pytest
+
+from conf.config import SCENARIO_CHECKPOINT_DIR
+from conf.logging_config import logger
+from tests.utils.scenario_checkpoint import ScenarioCheckpointStore
+
+# 等待其他进程构造同一场景的最长时间（秒）
+_BUILD_LOCK_TIMEOUT = 600
+
+
+class ScenarioCheckpoints:
+    """会话内的场景检查点入口"""
+
+    def __init__(self, store: ScenarioCheckpointStore):
+        self.store = store
+
+    def _lock_path(self, name: str) -> str:
+        return os.path.join(self.store.checkpoint_dir, f"{name}.{self.store.session_id}.lock")
+
+    def ensure(self, name: str, build, mode: str = "clone") -> dict:
+        """
+        获取场景：本会话没有检查点时执行 build() 构造并保存，然后按 mode 恢复
+
+        :param name: 场景名称
+        :param build: 构造函数，返回 (根表名称列表, storage_state)
+        :param mode: clone / reset，见 ScenarioCheckpointStore.restore
+        """
+        if not self.store.exists(name):
+            self._build_once(name, build)
+        return self.store.restore(name, mode=mode)
+
+    def _build_once(self, name: str, build):
+        lock_path = self._lock_path(name)
+        deadline = time.monotonic() + _BUILD_LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                # 其他进程正在构造同一场景，等待其完成后直接使用
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"等待场景 [{name}] 构造超时")
+                time.sleep(1)
+                if self.store.exists(name):
+                    return
+        try:
+            os.close(fd)
+            # 等锁期间其他进程可能已构造完成并释放了锁
+            if self.store.exists(name):
+                return
+            logger.info(f"构造场景 [{name}]")
+            root_names, storage_state = build()
+            self.store.capture(name, root_names, storage_state)
+        finally:
+            os.remove(lock_path)
+
+
+@pytest.fixture(scope="session")
+def scenario_checkpoint():
+    """会话级场景检查点，结束时清理本会话 clone 出来的数据"""
+    session_id = os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+    store = ScenarioCheckpointStore(SCENARIO_CHECKPOINT_DIR, session_id)
+    checkpoints = ScenarioCheckpoints(store)
+    yield checkpoints
+    store.drop_clones()
@@ -15,8 +15,78 @@ from tests.pages.fd.home_page import HomePage
 from tests.pages.fd.login_page import LoginPage
 from tests.pages.fd.room_management_page import RoomManagementPage
 from tests.pages.fd.filing_room_page import FilingRoomPage
+from tests.utils.form_schema import ROOM_FORM_SCHEMA
 from tests.utils.form_validation_utils import FormValidationUtils
+from tests.utils.page_pool import reset_forms
 from tests.utils.page_utils import *
+from tests.utils.pairwise import pairwise_params, schema_domains
+from tests.utils.sized_file_factory import sized_file
+
+# 参数化占位：超大文件用例运行时才通过 oversized_upload_file 夹具生成文件
+OVERSIZED_UPLOAD_FILE = "<oversized_upload_file>"
+
+
+@pytest.fixture(scope="module")
+def oversized_upload_file():
+    """超过上传大小上限 1 字节的合法图片，按需生成，无需在仓库中保存大文件"""
+    return sized_file("png", UPLOAD_SIZE_LIMIT + 1)
+
+
+# 页面池中的房间备案表单路由
+FILING_ROOM_ROUTE = "fd:房间备案表单"
+
+
+@pytest.fixture(scope="session")
+def filing_room_pool(page_pool, browser_provider, fd_base_url, fd_test_user):
+    """
+    在页面池登记房间备案表单：登录一次取得登录态，池中页面直达房间管理页面后点击"备案房间"。
+    上传列表不属于表单字段，借出时在单页应用内返回列表重新进入表单并清空字段，失败时才重新加载页面。
+    """
+    context = browser_provider.get().new_context()
+    try:
+        page = context.new_page()
+        login_page = LoginPage(page)
+        login_page.navigate(fd_base_url)
+        login_page.fill_credentials(fd_test_user["username"], fd_test_user["password"])
+        login_page.click_login_button()
+        page.wait_for_url("**/fangdonghome/home")
+        storage_state = context.storage_state()
+    finally:
+        context.close()
+
+    def warm(page):
+        RoomManagementPage(page).open(fd_base_url).go_to_filling_room_page()
+
+    def reset(page):
+        try:
+            RoomManagementPage(page).reopen_filling_room_page()
+            # 表单被 keep-alive 缓存时字段仍保留上次输入
+            reset_forms(page)
+        except Exception as e:
+            logger.warning(f"单页应用内重新进入房间备案表单失败，重新加载页面: {e}")
+            warm(page)
+
+    page_pool.register(FILING_ROOM_ROUTE, warm, reset=reset, storage_state=storage_state)
+    return page_pool
+
+
+@pytest.fixture
+def filing_room_page_setup(pooled_page, filing_room_pool):
+    """从页面池借出已打开的房间备案表单"""
+    return FilingRoomPage(pooled_page(FILING_ROOM_ROUTE))
+
+
+@pytest.fixture(scope="class")
+def harvested_empty_errors(filing_room_pool):
+    """
+    空表单只提交一次，收集所有字段的错误提示，本类的非空校验用例共用
+
+    Returns:
+        dict: {字段键: 错误文本}，见 FilingRoomPage.submit_and_harvest_errors
+    """
+    with filing_room_pool.page(FILING_ROOM_ROUTE, owner="harvested_empty_errors") as page:
+        return FilingRoomPage(page).submit_and_harvest_errors()
+
 
 # ------------------------------
 # 工具函数：减少重复逻辑
@@ -74,11 +144,6 @@ class TestFilingRoom:
         ("fridge", "", "请选择冰箱"),
         ("stove", "", "请选择炉灶"),
         ("toilet", "", "请选择便器"),
-
-        # 证件类型与上传关联验证
-        ("property_type", "自有", "请上传产权证明"),
-        ("property_type", "租赁", "请上传租赁证明"),
-        ("property_type", "共有", "请上传共有产权证明"),
     ]
     base_field_empty_ids = [
         "room_name_empty", "ms_not_selected", "floor_not_selected", "ly_not_selected", "room_type_not_selected",
@@ -88,40 +153,52 @@ class TestFilingRoom:
         "tv_not_selected", "projector_not_selected", "washing_machine_not_selected",
         "clothes_steamer_not_selected", "water_heater_not_selected", "hair_dryer_not_selected",
         "fridge_not_selected", "stove_not_selected", "toilet_not_selected",
+    ]
+
+    @pytest.mark.parametrize("field, test_value, expected_tip", base_field_empty_cases, ids=base_field_empty_ids)
+    def test_base_field_empty_validation(self, harvested_empty_errors, field, test_value, expected_tip):
+        """
+        测试基础字段的非空验证。
+        空表单提交一次即可触发全部字段的校验，类级 fixture harvested_empty_errors 提交并收集所有错误提示，
+        各用例逐字段断言预期的错误提示信息。
+        """
+        field_key = FormValidationUtils.ROOM_FIELD_MAPPING.get(field, field)
+        actual_tip = harvested_empty_errors.get(field_key)
+        logger.info(f"字段 [{field}] 预期提示: {expected_tip}，实际提示: {actual_tip}")
+        assert actual_tip == expected_tip
+
+    # 证件类型与上传关联验证
+    property_type_cases = [
+        ("property_type", "自有", "请上传产权证明"),
+        ("property_type", "租赁", "请上传租赁证明"),
+        ("property_type", "共有", "请上传共有产权证明"),
+    ]
+    property_type_ids = [
         "property_certificate_not_uploaded_owned", "property_certificate_not_uploaded_leased",
         "property_certificate_not_uploaded_shared"
     ]
 
-    @pytest.mark.parametrize("field, test_value, expected_tip", base_field_empty_cases, ids=base_field_empty_ids)
+    @pytest.mark.parametrize("field, test_value, expected_tip", property_type_cases, ids=property_type_ids)
     def test_base_field_validation(self, filing_room_page_setup, field, test_value, expected_tip):
         """
-        测试基础字段的非空及合法性验证。
-        该测试用例主要目的是验证房间注册页面中各个基础字段在输入为空或不合法数据时，是否能正确显示预期的错误提示信息。
+        测试产权类型与证件上传的关联验证。
+        该测试用例主要目的是验证不同产权类型下未上传对应证明时，是否能正确显示预期的错误提示信息。
         """
         filing_room_page = filing_room_page_setup
         params = FormValidationUtils.get_form_params("room", field, test_value)
 
-        # 处理产权类型特殊逻辑
-        if field == "property_type":
-            test_fields = "property_certificate"
-        else:
-            test_fields = field
-
-        filing_room_page.fill_room_info(test_fields=test_fields, **params)
+        filing_room_page.fill_room_info(test_fields="property_certificate", **params)
         filing_room_page.submit_form()
         time.sleep(1)
 
         # 验证错误提示
-        if field == "property_type":
-            assert filing_room_page.property_certificate_empty_error(expected_tip)
-        else:
-            check_error_message(filing_room_page, field, expected_tip)
+        assert filing_room_page.property_certificate_empty_error(expected_tip)
 
     # 场景2：文件上传验证用例
     file_upload_cases = [
         # 产权证明文件验证
         ("property_certificate", "", "", "empty_property_certificate"),
-        ("property_certificate", LARGE_PROPERTY_CERTIFICATE, "上传文件大小不能超过 10 MB!",
+        ("property_certificate", OVERSIZED_UPLOAD_FILE, "上传文件大小不能超过 10 MB!",
          "large_property_certificate"),
         ("property_certificate", HTML_PROPERTY_CERTIFICATE, "文件格式不正确, 请上传pdf/jpg/jpeg/png格式文件!",
          "html_property_certificate"),
@@ -139,7 +216,7 @@ class TestFilingRoom:
          "multi_property_certificate"),
 
         # 消防安全证明文件验证
-        ("fire_safety_certificate", LARGE_PROPERTY_CERTIFICATE, "上传文件大小不能超过 10 MB!",
+        ("fire_safety_certificate", OVERSIZED_UPLOAD_FILE, "上传文件大小不能超过 10 MB!",
          "large_fire_safety_certificate"),
         ("fire_safety_certificate", HTML_PROPERTY_CERTIFICATE,
          "文件格式不正确, 请上传pdf/jpg/jpeg/png格式文件!", "html_fire_safety_certificate"),
@@ -157,7 +234,7 @@ class TestFilingRoom:
          "multi_fire_safety_certificate"),
 
         # 公安登记表文件验证
-        ("public_security_registration_form", LARGE_PROPERTY_CERTIFICATE, "上传文件大小不能超过 10 MB!",
+        ("public_security_registration_form", OVERSIZED_UPLOAD_FILE, "上传文件大小不能超过 10 MB!",
          "large_public_security_form"),
         ("public_security_registration_form", HTML_PROPERTY_CERTIFICATE,
          "文件格式不正确, 请上传pdf/jpg/jpeg/png格式文件!", "html_public_security_form"),
@@ -210,6 +287,8 @@ class TestFilingRoom:
         27.公安登记表多次上传文件
         """
         filing_room_page = filing_room_page_setup
+        if test_value == OVERSIZED_UPLOAD_FILE:
+            test_value = request.getfixturevalue("oversized_upload_file")
         params = FormValidationUtils.get_form_params("room", field, test_value)
         current_test_id = request.node.name
         logger.info(f"📌 当前测试场景：: {current_test_id}")
@@ -275,52 +354,16 @@ class TestFilingRoom:
         filing_room_page.fill_room_info(test_fields=field, **params)
         check_error_message(filing_room_page, field, expected_tip)
 
-    # 场景4：单选按钮标签文本与值映射
+    # 场景4：单选按钮标签文本与值映射（设施类单选项，取自表单描述）
     radio_mapping = {
-        "parking": "是否有车位",
-        "balcony": "是否有阳台",
-        "window": "是否有窗户",
-        "tv": "电视机",
-        "washing_machine": "洗衣机",
-        "water_heater": "热水器",
-        "fridge": "冰箱",
-        "toilet": "便器",
-        "projector": "投影仪",
-        "clothes_steamer": "挂烫机",
-        "hair_dryer": "吹风机",
-        "stove": "炉灶"
+        spec.key: spec.label
+        for spec in ROOM_FORM_SCHEMA
+        if spec.control == "radio" and spec.key != "property_type"
     }
 
     # 单选按钮所有选项组合
     radio_all_options = [
-        ("parking", "有"),
-        ("parking", "无"),
-        ("balcony", "有"),
-        ("balcony", "无"),
-        ("window", "有"),
-        ("window", "无"),
-        ("tv", "有"),
-        ("tv", "无"),
-        ("washing_machine", "有"),
-        ("washing_machine", "无"),
-        ("water_heater", "有"),
-        ("water_heater", "无"),
-        ("fridge", "有"),
-        ("fridge", "无"),
-        ("projector", "有"),
-        ("projector", "无"),
-        ("clothes_steamer", "有"),
-        ("clothes_steamer", "无"),
-        ("hair_dryer", "有"),
-        ("hair_dryer", "无"),
-        ("toilet", "智能马桶"),
-        ("toilet", "普通马桶"),
-        ("toilet", "蹲便"),
-        ("toilet", "无"),
-        ("stove", "无"),
-        ("stove", "燃气灶"),
-        ("stove", "电磁炉"),
-        ("stove", "其他")
+        (field, option) for field in radio_mapping for option in ROOM_FORM_SCHEMA[field].options
     ]
 
     @pytest.mark.parametrize("field, value", radio_all_options)
@@ -497,7 +540,46 @@ class TestFilingRoom:
             params["bathroom_number"]
         )
 
-    # 场景7：备案房间成功用例
+    # 场景7：设施、产权类型与户型数量的两两组合
+    # 取值域来自表单描述的可选项与公共参数，任意两个字段的任意取值组合至少出现一次
+    room_option_domains = schema_domains(
+        ROOM_FORM_SCHEMA,
+        COMMON_ROOM_PARAMS,
+        overrides={
+            "bedroom_number": ["1", "2", "3"],
+            "living_room_number": ["1", "2", "3"],
+            "kitchen_number": ["1", "2", "3"],
+            "bathroom_number": ["1", "2", "3"],
+        },
+    )
+    room_option_cases = pairwise_params(
+        room_option_domains,
+        base={**COMMON_ROOM_PARAMS, "room_name": "pairwise room", "ms_name": "手持机民宿"},
+        id_prefix="room_options",
+    )
+
+    @pytest.mark.parametrize("params", room_option_cases)
+    def test_room_option_combinations(self, filing_room_page_setup, params):
+        """
+        测试设施选项、产权类型与户型数量的组合填写。
+        按两两覆盖生成的组合填写表单后回读，验证每个组合字段的取值与填写一致，且图片输入框数量与户型数量对应。
+        """
+        filing_room_page = filing_room_page_setup
+        combined_fields = [field for field, values in self.room_option_domains.items() if len(values) > 1]
+
+        filing_room_page.fill_room_info(test_fields="all", **params)
+
+        actual = filing_room_page.read_room_info(combined_fields)
+        mismatched = {field: (params[field], actual[field]) for field in combined_fields if params[field] != actual[field]}
+        assert not mismatched, f"回读值与填写值不一致（预期, 实际）: {mismatched}"
+        assert filing_room_page.validate_file_inputs(
+            params["bedroom_number"],
+            params["living_room_number"],
+            params["kitchen_number"],
+            params["bathroom_number"]
+        )
+
+    # 场景8：备案房间成功用例
     def test_room_register_success_redirect(self, filing_room_page_setup):
         """
         测试房间注册成功后是否正确跳转到指定页面。
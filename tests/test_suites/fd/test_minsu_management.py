@@ -1,12 +1,12 @@
 import re
 import time
+import uuid
 from zoneinfo import ZoneInfo
 
 import pytest
 from conf.config import *
 from datetime import datetime
 from conf.logging_config import logger
-from tests.conftest import page
 from tests.pages.fd.add_new_minsu import AddNewMinsuPage
 from tests.pages.fd.ft_manage_page import FTManagePage
 from tests.pages.fd.home_page import HomePage
@@ -19,7 +19,21 @@ from tests.pages.ga.ga_home_page import GAHomePage
 
 from tests.utils.page_utils import  checkTipDialog
 from tests.pages.fd.login_page import LoginPage
+from playwright.async_api import async_playwright
+from tests.pages.fd.async_login_page import AsyncLoginPage
+from tests.pages.fd.async_minsu_management_page import AsyncMinsuManagementPage
+from tests.pages.ga.async_ga_filing_management_page import AsyncGAFilingManagementPage
+from tests.utils.async_page_utils import run_async, run_concurrently
+from tests.utils.browser_server import discover
 from tests.utils.validation_utils import check_minsu_management_alert_error_messages
+from tests.utils.lifecycle_model import MINSU_LIFECYCLE, minsu_state, run_transition_sequence
+from tests.utils.scenario_builders import (
+    MINSU_PENDING_ONE_ROOM_CHECKPOINT,
+    add_minsu,
+    build_minsu_with_room,
+    confirm_filing_on_ga,
+    file_one_room,
+)
 
 
 # ------------------------------
@@ -29,6 +43,16 @@ class TestConfig:
     """自定义配置类，存储共享数据"""
     minsu_pending_confirmation = "民宿_提交_备案"
 
+
+@pytest.fixture(scope="function")
+def pending_minsu(scenario_checkpoint, browser, fd_base_url, fd_test_user):
+    """从检查点 clone 一个备案状态为待确认的民宿，每个用例拿到独立副本，返回民宿名称"""
+    restored = scenario_checkpoint.ensure(
+        MINSU_PENDING_ONE_ROOM_CHECKPOINT,
+        lambda: build_minsu_with_room(browser, fd_base_url, fd_test_user, submit=True),
+    )
+    return next(iter(restored["names"].values()))
+
 @pytest.mark.register
 class TestMinsuManage:
     """新增民宿管理测试类"""
@@ -339,19 +363,59 @@ class TestMinsuManage:
         time.sleep(300)
 
     def test_filing_approval(self,
+                             pending_minsu,
                              ga_filing_management_setup
                              ):
         """
         公安端对提交备案的民宿通过
+
+        待确认民宿从场景检查点 clone，不依赖 test_submit_filing 的执行结果
         """
         ga_filing_management_page = ga_filing_management_setup
-        time.sleep(5)
-        logger.info(f"待确认民宿为: {TestConfig.minsu_pending_confirmation}")
-        ga_filing_management_page.query_minsu_tr(TestConfig.minsu_pending_confirmation)
+        logger.info(f"待确认民宿为: {pending_minsu}")
 
-        assert ga_filing_management_page.filing_operation("确认","金庸")
+        assert ga_filing_management_page.filing_operation("确认","金庸", minsu_name=pending_minsu)
+        # 备案通过后的状态校验使用同一个民宿
+        TestConfig.minsu_pending_confirmation = pending_minsu
         time.sleep(300)
 
+    def test_filing_approval_across_portals(self, pending_minsu, fd_base_url, ga_base_url, fd_test_user,
+                                            ga_test_user):
+        """
+        公安端确认备案的同时，房东端轮询民宿列表直到备案状态变为「已确认」
+
+        待确认民宿从场景检查点 clone，与其他用例互不影响。两个门户在同一事件循环中并发驱动，
+        查询时结果有多页也会逐页查找目标民宿，只在名称完全匹配的行上点击「确认」。
+        """
+        minsu_name = pending_minsu
+
+        async def flow():
+            async with async_playwright() as p:
+                server = discover("chromium")
+                browser = await (p.chromium.connect(server["ws_endpoint"]) if server else p.chromium.launch())
+                try:
+                    fd_page = await (await browser.new_context()).new_page()
+                    ga_page = await (await browser.new_context()).new_page()
+                    await run_concurrently(
+                        AsyncLoginPage(fd_page).login(fd_base_url, fd_test_user["username"], fd_test_user["password"]),
+                        AsyncLoginPage(ga_page).login(ga_base_url, ga_test_user["username"], ga_test_user["password"]),
+                    )
+                    minsu_management_page, ga_filing_management_page = await run_concurrently(
+                        AsyncMinsuManagementPage(fd_page).open(fd_base_url),
+                        AsyncGAFilingManagementPage(ga_page).open(ga_base_url),
+                    )
+
+                    return await run_concurrently(
+                        ga_filing_management_page.filing_operation("确认", "金庸", minsu_name=minsu_name),
+                        minsu_management_page.wait_for_filing_status(minsu_name, "已确认", timeout=300),
+                    )
+                finally:
+                    await browser.close()
+
+        approved, confirmed = run_async(flow())
+        assert approved, f"公安端确认民宿 {minsu_name} 失败"
+        assert confirmed, f"房东端民宿 {minsu_name} 的备案状态未变为「已确认」"
+
   # 场景4：确认
 
     def test_approved_filing(
@@ -399,3 +463,47 @@ class TestMinsuManage:
         logger.info(
             f"✅ [备案通过后] 步骤「{step_flag}」成功：操作集合符合预期（可用: {operations}, 禁用: {disabled_operations}）")
 
+
+    # 场景5：按状态机覆盖民宿备案状态迁移
+    # 未提交:无房间 -[备案房间]-> 未提交 -[提交]-> 待确认 -[确认]-> 已确认，整条序列只新增一个民宿
+    minsu_transition_sequences = MINSU_LIFECYCLE.transition_cover()
+
+    @pytest.mark.parametrize(
+        "sequence",
+        minsu_transition_sequences,
+        ids=[MINSU_LIFECYCLE.sequence_id(sequence) for sequence in minsu_transition_sequences]
+    )
+    def test_minsu_lifecycle_transitions(self, sequence, minsu_management_setup, page, browser,
+                                         ga_base_url, ga_test_user):
+        """
+        测试民宿生命周期的状态迁移
+        序列由状态机计算，每一步校验房间数量与备案状态对应的状态以及操作集合；「确认」在公安端执行
+        """
+        minsu_management_page = minsu_management_setup
+        minsu_name = f"生命周期民宿_{uuid.uuid4().hex[:6]}"
+
+        def seed(state):
+            # 新增的民宿即处于初始状态"未提交:无房间"
+            assert state == MINSU_LIFECYCLE.initial, f"无法直接构造状态: {state}"
+            add_minsu(minsu_management_page, minsu_name)
+            return minsu_name
+
+        def perform(name, transition):
+            if transition.action == "备案房间":
+                return file_one_room(minsu_management_page, name)
+            if transition.action == "提交":
+                return minsu_management_page.minsu_submit(name)
+            if transition.action == "确认":
+                return confirm_filing_on_ga(browser, ga_base_url, ga_test_user, name)
+            raise ValueError(f"未实现的民宿操作: {transition.action}")
+
+        def verify(name, state):
+            minsu_management_page.query_minsu(name)
+            actual_state = minsu_state(minsu_management_page.get_room_number(),
+                                       minsu_management_page.get_filing_status())
+            return actual_state == state and minsu_management_page.check_minsu_operations(
+                operations=MINSU_LIFECYCLE.operations(state),
+                disabled_operations=MINSU_LIFECYCLE.disabled_operations(state),
+            )
+
+        run_transition_sequence(MINSU_LIFECYCLE, sequence, seed, perform, verify)
@@ -9,6 +9,7 @@ from tests.pages.fd.register_page import RegisterPage
 from tests.utils.validation_utils import check_register_error_messages, assert_filed_messages, \
     check_register_alert_error_messages
 from tests.utils.validator import generate_random_phone_number
+from tests.utils.identity_allocator import IdentityAllocator
 from tests.pages.fd.login_page import LoginPage
 
 
@@ -19,20 +20,28 @@ from tests.pages.fd.login_page import LoginPage
 @pytest.fixture(scope="class")
 def phone_number_generator():
     """
-    一个 Pytest Fixture，用于生成递增的手机号。
-    每次调用都会返回一个新的、唯一的手机号字符串。
+    一个 Pytest Fixture，用于分配互不冲突的手机号。
+    每次调用都会返回一个新的、可用的手机号字符串（跨进程唯一，跳过 t_sys_user 中已注册的号码）。
+    用例结束后归还号码：已注册成功的号码（调用 phone_number_generator.registered(号码) 标记，
+    或结束时已出现在 t_sys_user 中）不再分配；发送过验证码的号码由 RegisterPage 记录冷却时间，
+    冷却期内暂不再分配；其余号码立即可复用。
     """
-    start_number = 13810135777
-    current_number = start_number
+    allocator = IdentityAllocator()
+    allocated = []
+    registered = set()
 
     def _get_next_number():
-        nonlocal current_number
-        number_to_return = current_number
-        current_number += 1
-        return str(number_to_return)
+        number = allocator.acquire_phone()
+        allocated.append(number)
+        return number
 
+    _get_next_number.registered = registered.add
     yield _get_next_number
 
+    registered |= allocator.registered("phone", allocated)
+    for number in allocated:
+        allocator.release("phone", number, consumed=number in registered)
+
 # ------------------------------
 # 测试类：个人/企业房东注册功能测试
 # ------------------------------
@@ -50,8 +59,18 @@ class TestRegister:
         :param fields: 表单字段数据字典
         :return: 注册页面对象
         """
+        RegisterPage(page).navigate(fd_base_url)
+        return self._submit_register_form(page, fd_type, fields)
+
+    def _submit_register_form(self, page, fd_type, fields):
+        """
+        公共方法：在已打开的注册页面上填充表单并提交（页面池借出的页面已打开注册表单）
+        :param page: Playwright 页面对象
+        :param fd_type: 房东类型（个人/企业）
+        :param fields: 表单字段数据字典
+        :return: 注册页面对象
+        """
         register_page = RegisterPage(page)
-        register_page.navigate(fd_base_url)
 
         # 处理企业类型特有字段
         if fd_type == "企业":
@@ -237,16 +256,16 @@ class TestRegister:
     )
     def test_username_length_validation(
             self,
-            page,
-            fd_base_url,
+            pooled_page,
             scenario,
             fd_type,
             register_info,
             expected_errors
     ):
         """测试账户长度必须在2到30个字符之间的验证逻辑"""
-        register_page = self._navigate_and_submit_register_form(
-            page, fd_base_url, fd_type, register_info.copy()  # 传拷贝避免原数据被修改
+        page = pooled_page("fd:注册表单")
+        register_page = self._submit_register_form(
+            page, fd_type, register_info.copy()  # 传拷贝避免原数据被修改
         )
         page.wait_for_timeout(1000)  # 等待验证结果
 
@@ -0,0 +1,178 @@
+"""
+静态资源本地缓存
+
+BrowserContext 之间不共享 HTTP 缓存，每个新 context 都会重新下载门户的 JS/CSS 打包文件。
+本模块通过路由拦截把这些资源按内容哈希保存到磁盘，供所有 context 与并发进程复用；
+每个资源在一次测试会话内至多向服务器做一次 ETag / Last-Modified 条件请求校验。
+只缓存与发起请求的页面同源的资源；统计脚本等第三方资源一律 route.fallback()，
+交给后注册的路由（例如网络拦截方案的 stub / abort）处理。
+
+目录结构:
+    <cache_dir>/blobs/<内容sha256>        资源内容，相同内容只存一份
+    <cache_dir>/index/<URL sha256>.json   URL 元数据（内容哈希、校验头、最近校验的会话）
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from urllib.parse import urlsplit
+
+from conf.logging_config import logger
+
+# 回放时保留的响应头，其余（如 content-length、content-encoding）由 Playwright 重新计算
+_REPLAY_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+
+def _atomic_write(path: str, data: bytes):
+    """先写临时文件再 os.replace，保证并发进程读到的总是完整文件"""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _origin(url: str) -> tuple:
+    parts = urlsplit(url)
+    return parts.scheme, parts.netloc
+
+
+def _is_same_origin(request) -> bool:
+    """请求是否与发起它的页面同源"""
+    try:
+        frame_url = request.frame.url
+    except Exception:
+        # Service Worker 发出的请求没有所属 frame
+        return False
+    return _origin(request.url) == _origin(frame_url)
+
+
+class AssetCache:
+    """
+    内容寻址的静态资源缓存
+
+    Args:
+        cache_dir: 缓存根目录
+        session_id: 当前测试会话标识，同一会话内已校验过的资源直接从磁盘返回
+        resource_types: 参与缓存的资源类型
+        url_patterns: 参与缓存的 URL 正则，与资源类型任一命中即缓存（均要求同源）
+    """
+
+    def __init__(self, cache_dir: str, session_id: str, resource_types=(), url_patterns=()):
+        self.cache_dir = cache_dir
+        self.session_id = session_id
+        self.resource_types = frozenset(resource_types)
+        self.url_patterns = [re.compile(p) for p in url_patterns]
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        self.index_dir = os.path.join(cache_dir, "index")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        os.makedirs(self.index_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # 本进程内已确认有效的 URL -> 元数据，命中时不再读索引文件
+        self._validated = {}
+        self.stats = {"hit": 0, "revalidated": 0, "miss": 0, "bytes_served": 0}
+
+    def is_cacheable(self, request) -> bool:
+        if request.method != "GET" or not _is_same_origin(request):
+            return False
+        if request.resource_type in self.resource_types:
+            return True
+        return any(p.search(request.url) for p in self.url_patterns)
+
+    def _index_path(self, url: str) -> str:
+        return os.path.join(self.index_dir, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest)
+
+    def _load_entry(self, url: str):
+        try:
+            with open(self._index_path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self._blob_path(entry["sha256"])):
+            return None
+        return entry
+
+    def _save_entry(self, url: str, entry: dict):
+        _atomic_write(self._index_path(url), json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+
+    def _store(self, url: str, body: bytes, headers: dict) -> dict:
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            _atomic_write(blob_path, body)
+        entry = {
+            "url": url,
+            "sha256": digest,
+            "headers": {k: headers[k] for k in _REPLAY_HEADERS if k in headers},
+            "validated_session": self.session_id,
+        }
+        self._save_entry(url, entry)
+        return entry
+
+    def _fulfill_from_disk(self, route, entry: dict):
+        with open(self._blob_path(entry["sha256"]), "rb") as f:
+            body = f.read()
+        self.stats["bytes_served"] += len(body)
+        route.fulfill(status=200, headers=entry["headers"], body=body)
+
+    def handle(self, route):
+        """context.route 处理函数：非缓存资源交给后续处理器"""
+        request = route.request
+        if not self.is_cacheable(request):
+            route.fallback()
+            return
+
+        url = request.url
+        with self._lock:
+            entry = self._validated.get(url)
+        if entry is None:
+            entry = self._load_entry(url)
+
+        if entry is not None and entry.get("validated_session") == self.session_id:
+            with self._lock:
+                self._validated[url] = entry
+            self.stats["hit"] += 1
+            self._fulfill_from_disk(route, entry)
+            return
+
+        headers = dict(request.headers)
+        if entry is not None:
+            etag = entry["headers"].get("etag")
+            last_modified = entry["headers"].get("last-modified")
+            if etag:
+                headers["if-none-match"] = etag
+            if last_modified:
+                headers["if-modified-since"] = last_modified
+
+        response = route.fetch(headers=headers)
+
+        if entry is not None and response.status == 304:
+            entry["validated_session"] = self.session_id
+            self._save_entry(url, entry)
+            with self._lock:
+                self._validated[url] = entry
+            self.stats["revalidated"] += 1
+            self._fulfill_from_disk(route, entry)
+            return
+
+        self.stats["miss"] += 1
+        response_headers = response.headers
+        cache_control = response_headers.get("cache-control", "")
+        if response.status == 200 and "no-store" not in cache_control:
+            body = response.body()
+            entry = self._store(url, body, response_headers)
+            with self._lock:
+                self._validated[url] = entry
+            logger.debug(f"静态资源已缓存: {url}")
+        route.fulfill(response=response)
@@ -0,0 +1,418 @@
+"""
+page_utils 的 asyncio 版本
+
+与 page_utils 中的同名函数行为一致，区别在于所有与浏览器交互的步骤都是 await，
+等待使用 asyncio.sleep，因此一个进程内可以同时驱动多个页面、多个门户：
+房东端提交后等待列表刷新时，公安端页面可以同时加载。
+
+Locator 的创建（page.locator / get_by_role 等）不与浏览器通信，仍为同步调用；
+count / click / fill / text_content 等操作需要 await。
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        fd_page, ga_page = await browser.new_page(), await browser.new_page()
+        await run_concurrently(fd_flow(fd_page), ga_flow(ga_page))
+
+pytest-asyncio 不在依赖中，同步用例通过 run_async() 在独立事件循环中执行协程。
+"""
+import asyncio
+import re
+import threading
+from typing import List, Union
+
+from playwright.async_api import Locator, Page, TimeoutError
+
+from conf.logging_config import logger
+
+
+# ------------------------------
+# 协程调度
+# ------------------------------
+async def run_concurrently(*coros, return_exceptions: bool = False) -> list:
+    """
+    并发执行多个页面流程，返回值顺序与传入顺序一致
+
+    :param coros: 协程对象
+    :param return_exceptions: True 时异常作为结果返回，不中断其他流程
+    """
+    return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+
+def run_async(coro):
+    """
+    在同步代码中执行协程并返回结果
+
+    pytest-playwright 的同步 fixture 会在当前线程占用事件循环，此时 asyncio.run 不可用，
+    改为在新线程中启动独立的事件循环执行。
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result = {}
+
+    def runner():
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=runner, name="async-page-flow")
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
+
+
+# ------------------------------
+# 元素定位
+# ------------------------------
+async def locate_element_by_step_strategy(target_label: Locator, xpath: str) -> Locator:
+    """分步定位单个元素，见 page_utils.locate_element_by_step_strategy"""
+    steps = xpath.split('//', 1)
+    if len(steps) > 1:
+        first_step, remaining_steps = steps
+        middle_locator = target_label.locator(f'xpath={first_step}')
+        if await middle_locator.count() > 0:
+            return middle_locator.locator(f'xpath=//{remaining_steps}').nth(0)
+    return target_label.locator(f'xpath={xpath}').nth(0)
+
+
+def get_label_corresponding_input(page: Page, label_text) -> Locator:
+    """获取指定标签对应的输入框（仅创建 Locator，无需 await）"""
+    target_label = page.get_by_text(label_text, exact=True)
+    return target_label.locator('xpath=following-sibling::div//input')
+
+
+async def get_label_corresponding_elements(page: Page, label_text: str, xpath: str) -> list[Locator]:
+    """获取标签对应的所有元素"""
+    if not xpath:
+        raise ValueError("必须提供自定义XPath表达式")
+    target_label = page.get_by_text(label_text, exact=True)
+    try:
+        return await target_label.locator(f'xpath={xpath}').all()
+    except TimeoutError:
+        raise ValueError(f"未找到与标签 '{label_text}' 对应的元素，XPath: {xpath}")
+
+
+async def get_element_corresponding_error_tip(target_element: Locator, xpath: str, expected_message: str) -> bool:
+    """
+    检查元素对应的错误提示是否与预期一致
+
+    :param target_element: 目标元素
+    :param xpath: 错误提示元素相对于目标元素的 XPath
+    :param expected_message: 预期的错误提示，None 表示期望没有错误提示
+    """
+    if not xpath:
+        raise ValueError("必须提供自定义XPath表达式")
+    try:
+        error_element = await locate_element_by_step_strategy(target_element, xpath)
+        if await error_element.count() == 0:
+            result = expected_message is None
+            logger.info(f"定位失败，该元素没有任何错误提示， <返回值>: {result}")
+            return result
+
+        error_text = (await error_element.text_content()).strip()
+        if error_text == expected_message:
+            logger.info(f"✅ 验证成功：错误提示信息正确，内容为 '{error_text}'")
+            return True
+        logger.error(f"错误提示信息不符，预期: '{expected_message}'，实际: '{error_text}'")
+        return False
+    except Exception as e:
+        logger.error(f"获取错误提示信息时出错: {e}")
+        return False
+
+
+# ------------------------------
+# 表单操作
+# ------------------------------
+async def fill_textbox(page: Page, label: str, value: str) -> None:
+    """填写文本框"""
+    try:
+        await page.get_by_role("textbox", name=label).fill(value)
+    except Exception as e:
+        logger.error(f"填写文本框 {label} 时出错: {e}")
+
+
+async def select_radio_button(page: Page, label_text: str, target_option: str) -> None:
+    """在指定标签下按文本选择单选按钮"""
+    try:
+        radio_buttons = await get_label_corresponding_elements(page, label_text, 'following-sibling::div//label')
+        texts = []
+        for btn in radio_buttons:
+            btn_text = (await btn.text_content()).strip()
+            texts.append(btn_text)
+            if target_option in btn_text:
+                await btn.click()
+                logger.info(f"已选择选项：{btn_text}")
+                return
+        raise ValueError(f"未找到选项：{target_option}，可用选项为：{texts}")
+    except Exception as e:
+        logger.error(f"选择单选按钮 {target_option} 时出错: {e}")
+        raise
+
+
+# ------------------------------
+# 提示与对话框
+# ------------------------------
+async def check_alert_text(page: Page, expected_text: str, timeout: int = 1000) -> tuple[bool, str]:
+    """检查页面上的 alert 文本是否与预期一致，返回 (是否一致, 实际文本)"""
+    actual_text = ""
+    try:
+        alert_element = await page.wait_for_selector('[role="alert"]', timeout=timeout)
+        if not alert_element:
+            logger.info("错误: 未找到 [role='alert'] 元素")
+            return False, actual_text
+
+        actual_text = await alert_element.inner_text()
+        if actual_text == expected_text:
+            logger.info(f"✅ 验证通过: alert 文本 '{actual_text}' 与预期一致")
+            return True, actual_text
+        logger.info(f"❌ 验证失败: 实际文本 '{actual_text}' 与预期 '{expected_text}' 不匹配")
+        return False, actual_text
+    except TimeoutError:
+        logger.info(f"错误: 等待 alert 元素超时 ({timeout}ms)")
+        return False, actual_text
+    except Exception as e:
+        logger.info(f"错误: 获取 alert 文本时发生异常: {str(e)}")
+        return False, actual_text
+
+
+async def operation_alert_error(page, expected_text):
+    is_matched, actual_text = await check_alert_text(page, expected_text)
+    return is_matched
+
+
+async def checkTipDialog(
+    page: Page,
+    expected_text: str,
+    confirm_text: Union[str, List[str]],
+    cancel_text: Union[str, List[str]],
+    operation: str
+) -> Locator | None:
+    """
+    检查可见的确认对话框，按 operation（confirm / cancel）返回对应按钮，验证失败返回 None
+    """
+    if operation not in ["confirm", "cancel"]:
+        logger.error(f"❌ 无效的operation参数：{operation}，必须是'confirm'或'cancel'")
+        return None
+
+    async def get_button_by_multi_text(locator_parent, text_list: Union[str, List[str]]):
+        text_list = [text_list] if isinstance(text_list, str) else text_list
+        for text in text_list:
+            button = locator_parent.locator(f"button:has-text('{text}')")
+            if await button.is_visible() and await button.count() > 0:
+                logger.info(f"✅ 找到匹配按钮：{text}")
+                return button
+        logger.error(f"❌ 未找到匹配按钮，预期文本：{text_list}")
+        return None
+
+    try:
+        await page.wait_for_selector('div[role="dialog"]', state="attached", timeout=8000)
+        all_dialogs = page.locator('div[role="dialog"]')
+        visible_dialog = None
+        for i in range(await all_dialogs.count()):
+            dialog = all_dialogs.nth(i)
+            if await dialog.is_visible():
+                visible_dialog = dialog
+                break
+        if not visible_dialog:
+            logger.error("❌ 所有对话框均处于隐藏状态")
+            return None
+
+        message_locator = visible_dialog.locator(".el-message-box__message")
+        await message_locator.wait_for(state="visible", timeout=3000)
+        message_text = (await message_locator.text_content()).strip()
+        if message_text != expected_text:
+            logger.error(f"❌ 提示文本不匹配：预期「{expected_text}」，实际「{message_text}」")
+            return None
+
+        button_text = confirm_text if operation == "confirm" else cancel_text
+        button = await get_button_by_multi_text(visible_dialog, button_text)
+        if button is None:
+            return None
+        if not await button.is_enabled():
+            logger.error(f"❌ {'确认' if operation == 'confirm' else '取消'}按钮处于禁用状态")
+            return None
+        return button
+    except Exception as e:
+        logger.error(f"❌ 检查对话框时发生异常：{str(e)}", exc_info=True)
+        return None
+
+
+# ------------------------------
+# 表格
+# ------------------------------
+async def get_table_cell_or_button(page, row: int, col: int, button_text: str = None,
+                                   timeout: int = 5000) -> Locator:
+    """
+    定位表格单元格（td），或单元格内指定文本的操作按钮，见 page_utils.get_table_cell_or_button
+
+    Raises:
+        ValueError: 索引非法、未找到行/列/按钮
+        TimeoutError: 表格加载超时
+    """
+    tbody = page.locator('//tbody')
+    tr_elements = tbody.locator('tr')
+    await tbody.wait_for(state="visible", timeout=timeout)
+
+    row_count = await tr_elements.count()
+    if row < 0 or row >= row_count:
+        raise ValueError(f"行索引{row}超出范围！表格共{row_count}行（有效索引：0~{row_count - 1}）")
+
+    target_td = tr_elements.nth(row).locator(f"td:nth-child({col + 1})")
+    if not await target_td.is_visible():
+        raise ValueError(f"第{row}行第{col}列（索引）的td单元格不存在或不可见")
+    if button_text is None:
+        return target_td
+
+    if not isinstance(button_text, str) or len(button_text.strip()) == 0:
+        raise ValueError("按钮文本不能为空字符串")
+    target_button = target_td.locator(f"button:has(span:has-text('{button_text}'))")
+    if await target_button.count() == 0:
+        raise ValueError(
+            f"目标td内未找到文本为「{button_text}」的按钮！"
+            f"当前td包含按钮：{await target_td.locator('button span').all_text_contents()}"
+        )
+    if not await target_button.is_visible():
+        raise ValueError(f"文本为「{button_text}」的按钮存在但不可见")
+    logger.info(f"✅ 定位目标按钮：td（行{row}列{col}）→ 「{button_text}」按钮")
+    return target_button
+
+
+async def set_max_page_size(page: Page, timeout: int = 5000) -> bool:
+    """将 el-pagination 的每页条数切换为最大值，见 page_utils.set_max_page_size"""
+    sizes_input = page.locator('.el-pagination .el-pagination__sizes input')
+    if await sizes_input.count() == 0:
+        return False
+    await sizes_input.first.click()
+    options = page.locator('.el-select-dropdown:visible .el-select-dropdown__item')
+    await options.first.wait_for(state="visible", timeout=timeout)
+    sizes = [int(re.search(r'\d+', text).group()) for text in await options.all_text_contents()]
+    largest = options.nth(sizes.index(max(sizes)))
+    if "selected" in (await largest.get_attribute("class") or ""):
+        await page.keyboard.press("Escape")
+        return True
+    await largest.click()
+    await page.wait_for_load_state("networkidle", timeout=30000)
+    logger.info(f"每页条数已切换为 {max(sizes)}")
+    return True
+
+
+async def _goto_next_table_page(page: Page, timeout: int = 5000) -> bool:
+    """点击 el-pagination 的下一页并等待页码切换，已是最后一页或没有分页时返回 False"""
+    next_button = page.locator('.el-pagination button.btn-next')
+    if await next_button.count() == 0 or await next_button.first.is_disabled():
+        return False
+    active = page.locator('.el-pagination .el-pager li.number.active')
+    current = int((await active.first.text_content()).strip()) if await active.count() > 0 else None
+    await next_button.first.click()
+    if current is not None:
+        await page.locator(f'.el-pagination .el-pager li.number.active:text-is("{current + 1}")').wait_for(
+            timeout=timeout)
+    await page.wait_for_load_state("networkidle", timeout=30000)
+    return True
+
+
+async def iter_table_rows(page: Page, max_page_size: bool = False, timeout: int = 5000):
+    """
+    逐行产出 el-table 的数据行，当前页的行被取完后才翻到下一页，见 page_utils.iter_table_rows
+
+        async for page_number, row_number, tr in iter_table_rows(page):
+            ...
+
+    产出:
+        (页码, 当前页内的行号（从1开始）, 行元素)；表格显示"暂无数据"时不产出任何行
+    """
+    if max_page_size:
+        await set_max_page_size(page, timeout)
+    page_number = 1
+    while True:
+        empty_block = page.locator('//div[@class="el-table__empty-block"]')
+        if await empty_block.count() > 0 and await empty_block.is_visible():
+            return
+        tbody = page.locator('//tbody')
+        if await tbody.count() == 0:
+            logger.info("未找到表格tbody元素")
+            return
+        try:
+            await tbody.wait_for(state="visible", timeout=timeout)
+        except Exception as e:
+            logger.warning(f"tbody存在但不可见：{str(e)}")
+            return
+
+        tr_elements = tbody.locator('tr')
+        for i in range(await tr_elements.count()):
+            yield page_number, i + 1, tr_elements.nth(i)
+
+        if not await _goto_next_table_page(page, timeout):
+            return
+        page_number += 1
+        logger.info(f"已翻到表格第 {page_number} 页")
+
+
+async def _search_rows(page, target_part: str, target_part_name: str,
+                       max_page_size: bool = False) -> tuple[Locator, int] | None:
+    """
+    展开查询区域并按名称搜索，返回 (匹配的行, 当前页内的行号，从1开始)，未找到返回 None
+
+    query_target_name_tr / query_target_name_index 共用的搜索与完全匹配逻辑。
+    结果有多页时逐页查找，找到后停留在匹配行所在的页。
+    """
+    await asyncio.sleep(1)
+    custom_query_btn = page.get_by_role("button", name="自定义查询", exact=True)
+    if await custom_query_btn.count() > 0:
+        await custom_query_btn.click()
+
+    await asyncio.sleep(1)
+    target_query_input = page.locator(f'//input[@placeholder="请输入{target_part}名称"]')
+    await target_query_input.fill("")
+    await target_query_input.fill(target_part_name)
+    await page.get_by_role("button", name="搜索").click()
+    logger.info(f" 已执行{target_part}查询，查询关键词：{target_part_name}（完全匹配模式）")
+
+    await page.wait_for_load_state("networkidle", timeout=30000)
+    target_name = target_part_name.strip()
+    contents = []
+    async for page_number, row_number, current_tr in iter_table_rows(page, max_page_size):
+        target_div = current_tr.locator('td:nth-child(2) > div')
+        try:
+            await target_div.wait_for(state="visible", timeout=2000)
+        except Exception:
+            logger.warning(f" 第 {page_number} 页第 {row_number} 个tr的目标div不可见，跳过检查")
+            continue
+        div_content = (await target_div.text_content()).strip()
+        if div_content == target_name:
+            logger.info(f" 找到完全匹配的 tr 元素（第 {page_number} 页第 {row_number} 个，内容：{div_content}）")
+            await asyncio.sleep(2)
+            return current_tr, row_number
+        contents.append(f"第 {page_number} 页第 {row_number} 个：{div_content}")
+
+    if contents:
+        logger.info(f" 未找到与 {target_name} 完全匹配的元素")
+        logger.debug(f"所有 tr 的 td[2] 内容：{', '.join(contents)}")
+    else:
+        logger.info(f" 未找到任何 tr 元素（查询关键词：{target_part_name}）")
+    return None
+
+
+async def query_target_name_tr(page, target_part: str, target_part_name: str, max_page_size: bool = False):
+    """按名称查询并返回完全匹配的行，结果有多页时逐页查找，未找到返回 None"""
+    try:
+        found = await _search_rows(page, target_part, target_part_name, max_page_size)
+        return found[0] if found else None
+    except Exception as e:
+        logger.error(f" 查询{target_part} {target_part_name} 时发生异常：{str(e)}", exc_info=True)
+        return None
+
+
+async def query_target_name_index(page, target_part: str, target_part_name: str, max_page_size: bool = False):
+    """按名称查询并返回完全匹配行在当前页中的位置（从1开始），结果有多页时逐页查找，未找到返回 None"""
+    try:
+        found = await _search_rows(page, target_part, target_part_name, max_page_size)
+        return found[1] if found else None
+    except Exception as e:
+        logger.error(f" 查询{target_part} {target_part_name} 时发生异常：{str(e)}", exc_info=True)
+        return None
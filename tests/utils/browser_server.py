@@ -0,0 +1,246 @@
+"""
+常驻浏览器服务
+
+每次 pytest 运行（以及每个 xdist worker）都从冷启动拉起 Chromium，需要数秒。
+常驻浏览器服务通过 Playwright 驱动的 launch-server 启动一次，ws 地址与进程号写入
+BROWSER_SERVER_DIR/<浏览器>.json；测试会话读取该文件，健康检查通过后连接，
+每个用例在连接上的浏览器中创建独立的 BrowserContext。服务不存在、不可达或连接失败时
+自动回退为本地启动浏览器。
+
+    python -m tests.utils.browser_server start      # 启动（已在运行时直接复用）
+    python -m tests.utils.browser_server status
+    python -m tests.utils.browser_server stop
+
+    pytest --browser-server ...                     # 见 tests.plugins.browser_server
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser, Playwright, sync_playwright
+
+from conf.config import (
+    BROWSER_HEADLESS,
+    BROWSER_SERVER_CONNECT_TIMEOUT,
+    BROWSER_SERVER_DIR,
+    BROWSER_SERVER_START_TIMEOUT,
+)
+from conf.logging_config import logger
+from tests.utils.perf_stats import write_json
+
+
+_shared_playwright = None
+
+
+def shared_playwright() -> Playwright:
+    """
+    进程内共享的 Playwright 实例
+
+    同一线程中第二次 sync_playwright().start() 会报 "using Playwright Sync API inside the asyncio loop"，
+    因此自行启动 Playwright 的 fixture 都应改为调用本函数（或依赖 pytest-playwright 的 playwright fixture）。
+    """
+    global _shared_playwright
+    if _shared_playwright is None:
+        _shared_playwright = sync_playwright().start()
+    return _shared_playwright
+
+
+def stop_shared_playwright():
+    global _shared_playwright
+    if _shared_playwright is not None:
+        _shared_playwright.stop()
+        _shared_playwright = None
+
+
+def _state_path(browser_name: str) -> str:
+    return os.path.join(BROWSER_SERVER_DIR, f"{browser_name}.json")
+
+
+def _log_path(browser_name: str) -> str:
+    return os.path.join(BROWSER_SERVER_DIR, f"{browser_name}.log")
+
+
+def discover(browser_name: str = "chromium") -> dict | None:
+    """读取服务状态文件，不存在或内容损坏时返回 None"""
+    try:
+        with open(_state_path(browser_name), encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if state.get("ws_endpoint") else None
+
+
+def is_healthy(ws_endpoint: str, timeout: float = 1.0) -> bool:
+    """检查服务端口能否建立 TCP 连接；真正的协议握手在 connect 时进行"""
+    parts = urlsplit(ws_endpoint)
+    try:
+        with socket.create_connection((parts.hostname, parts.port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def start_server(browser_name: str = "chromium", headless: bool = True, port: int = 0) -> dict:
+    """
+    启动常驻浏览器服务并写入状态文件；已有健康的服务时直接返回其状态
+
+    服务进程与当前进程分离（独立进程组），当前进程退出后继续运行，需用 stop_server 停止。
+    """
+    state = discover(browser_name)
+    if state and is_healthy(state["ws_endpoint"]):
+        logger.info(f"浏览器服务已在运行: {state['ws_endpoint']}")
+        return state
+
+    os.makedirs(BROWSER_SERVER_DIR, exist_ok=True)
+    config_path = os.path.join(BROWSER_SERVER_DIR, f"{browser_name}.config.json")
+    write_json(config_path, {"headless": headless, "host": "127.0.0.1", "port": port})
+
+    log_path = _log_path(browser_name)
+    detach = ({"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == "nt"
+              else {"start_new_session": True})
+    with open(log_path, "w", encoding="utf-8") as log:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "playwright", "launch-server", "--browser", browser_name, "--config", config_path],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, **detach,
+        )
+
+    # launch-server 在浏览器就绪后向标准输出打印 ws 地址
+    deadline = time.time() + BROWSER_SERVER_START_TIMEOUT
+    ws_endpoint = None
+    while ws_endpoint is None:
+        with open(log_path, encoding="utf-8", errors="replace") as log:
+            ws_endpoint = next((line.strip() for line in log if line.startswith("ws://")), None)
+        if ws_endpoint:
+            break
+        if process.poll() is not None or time.time() > deadline:
+            _terminate(process.pid)
+            with open(log_path, encoding="utf-8", errors="replace") as log:
+                output = log.read().strip()
+            raise RuntimeError(f"浏览器服务启动失败: {output[-500:] or '启动超时'}")
+        time.sleep(0.1)
+
+    state = {
+        "browser": browser_name,
+        "ws_endpoint": ws_endpoint,
+        "pid": process.pid,
+        "headless": headless,
+        "started": time.time(),
+    }
+    write_json(_state_path(browser_name), state)
+    logger.info(f"浏览器服务已启动: {ws_endpoint}（pid {process.pid}）")
+    return state
+
+
+def _terminate(pid: int):
+    """结束服务进程及其子进程（驱动与浏览器）"""
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], capture_output=True)
+        else:
+            os.killpg(pid, signal.SIGTERM)
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+
+def stop_server(browser_name: str = "chromium") -> bool:
+    """停止服务并删除状态文件，没有记录的服务时返回 False"""
+    state = discover(browser_name)
+    if state is None:
+        return False
+    _terminate(state["pid"])
+    try:
+        os.remove(_state_path(browser_name))
+    except OSError:
+        pass
+    logger.info(f"浏览器服务已停止（pid {state['pid']}）")
+    return True
+
+
+class BrowserProvider:
+    """
+    为测试会话提供浏览器：优先连接常驻服务，失败时本地启动
+
+    连接上的浏览器断开（服务被停止或崩溃）后，下一次 get() 重新连接或回退为本地启动，
+    已创建的 BrowserContext 随连接一起失效。
+
+    Args:
+        playwright: sync_playwright() 启动的 Playwright 实例
+        browser_name: chromium / firefox / webkit
+        use_server: 是否尝试连接常驻服务，False 时总是本地启动
+        launch_options: 本地启动时传给 launch() 的参数
+    """
+
+    def __init__(self, playwright: Playwright, browser_name: str = "chromium", use_server: bool = True,
+                 launch_options: dict = None):
+        self.browser_type = getattr(playwright, browser_name)
+        self.browser_name = browser_name
+        self.use_server = use_server
+        self.launch_options = {"headless": BROWSER_HEADLESS, **(launch_options or {})}
+        self.reused = False
+        self._browser = None
+
+    def _connect(self) -> Browser | None:
+        state = discover(self.browser_name)
+        if state is None:
+            logger.info("未发现常驻浏览器服务，本地启动浏览器")
+            return None
+        if not is_healthy(state["ws_endpoint"]):
+            logger.warning(f"常驻浏览器服务不可达: {state['ws_endpoint']}，本地启动浏览器")
+            return None
+        try:
+            browser = self.browser_type.connect(state["ws_endpoint"], timeout=BROWSER_SERVER_CONNECT_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"连接常驻浏览器服务失败: {e}，本地启动浏览器")
+            return None
+        logger.info(f"已连接常驻浏览器服务: {state['ws_endpoint']}")
+        return browser
+
+    def get(self) -> Browser:
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+        browser = self._connect() if self.use_server else None
+        self.reused = browser is not None
+        self._browser = browser or self.browser_type.launch(**self.launch_options)
+        return self._browser
+
+    def close(self):
+        """关闭本地启动的浏览器；连接的常驻服务只断开连接，其上创建的 context 一并关闭"""
+        if self._browser is not None and self._browser.is_connected():
+            self._browser.close()
+        self._browser = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="常驻浏览器服务")
+    parser.add_argument("action", choices=["start", "stop", "status"])
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", dest="headless", action="store_false", help="显示浏览器窗口")
+    parser.add_argument("--port", type=int, default=0, help="服务端口，0 表示随机空闲端口")
+    options = parser.parse_args(argv)
+
+    if options.action == "start":
+        try:
+            start_server(options.browser, options.headless, options.port)
+        except RuntimeError as e:
+            logger.error(str(e))
+            sys.exit(1)
+    elif options.action == "stop":
+        if not stop_server(options.browser):
+            logger.info("没有运行中的浏览器服务")
+    else:
+        state = discover(options.browser)
+        if state is None:
+            logger.info("没有运行中的浏览器服务")
+        else:
+            status = "正常" if is_healthy(state["ws_endpoint"]) else "不可达"
+            logger.info(f"{state['ws_endpoint']}（pid {state['pid']}）{status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,10 @@
 import random
 import string
+from functools import lru_cache
 
-from faker import Faker
-from utils.id_card_validator import validate_id_card  # 新增校验模块
+from tests.utils.id_card_validator import generate_id_card, iter_id_cards
+from tests.utils.uscc_generator import generate_uscc, iter_uscc
 
-# 创建Faker实例，用于生成各种随机数据
-fake = Faker('zh_CN')
 
 # 企业类型列表（限定为制造企业和销售企业）
 enterprise_types = ["制造企业", "销售企业"]
@@ -13,12 +12,20 @@ enterprise_types = ["制造企业", "销售企业"]
 # 经营范围列表（限定为射钉器、射钉弹、射钉器和射钉弹）
 scopes = ["射钉器", "射钉弹", "射钉器和射钉弹"]
 
+# 注册数据字段（销售企业额外包含经办人信息，其余类型留空）
+REGISTRATION_FIELDS = [
+    "enterprise_name", "enterprise_type", "province", "city", "district", "legal_representative",
+    "unified_social_credit_code", "registered_address", "business_location", "telephone",
+    "safety_director", "scope", "business_license_path", "handle_by", "handler_tel", "handler_ID",
+]
+
+# 每个种子预先采样的姓名、企业名、地址数量
+POOL_SIZE = 1000
+
 
 def generate_random_credit_code():
-    """生成随机的统一社会信用代码"""
-    # 统一社会信用代码由18位数字或字母组成
-    characters = string.digits + 'ABCDEFGHJKLMNPQRTUWXY'
-    return ''.join(random.choice(characters) for _ in range(18))
+    """生成随机的统一社会信用代码（校验码符合 GB 32100）"""
+    return generate_uscc()
 
 
 def generate_random_phone():
@@ -26,80 +33,91 @@ def generate_random_phone():
     return '1' + ''.join(random.choice(string.digits) for _ in range(10))
 
 
-def generate_id_card():
-    """生成符合国家标准的18位身份证号码"""
-    # 使用Faker生成原始身份证号码（包含校验码）
-    raw_id = fake.ssn(min_age=18, max_age=80)  # 生成18位有效身份证
-
-    # 验证并确保格式正确
-    if validate_id_card(raw_id):
-        return raw_id
-    else:
-        # 递归重试（极个别情况Faker可能生成无效号码）
-        return generate_id_card()
-
-
-def generate_registration_data(num_users=500):
-    """生成指定数量的用户注册数据"""
-    data_list = []
+@lru_cache(maxsize=8)
+def _sample_pools(seed=None) -> dict:
+    """按种子一次性采样姓名、企业名、地址素材，后续记录只从池中抽取，不再逐条调用 Faker"""
+    from faker import Faker
+
+    pool_faker = Faker('zh_CN')
+    if seed is not None:
+        pool_faker.seed_instance(seed)
+    return {
+        "last_names": [pool_faker.last_name() for _ in range(POOL_SIZE)],
+        "male_first_names": [pool_faker.first_name_male() for _ in range(POOL_SIZE)],
+        "female_first_names": [pool_faker.first_name_female() for _ in range(POOL_SIZE)],
+        "company_prefixes": [pool_faker.company_prefix() for _ in range(POOL_SIZE)],
+        "company_suffixes": [pool_faker.company_suffix() for _ in range(POOL_SIZE)],
+        "street_addresses": [pool_faker.street_address() for _ in range(POOL_SIZE)],
+        "building_numbers": [pool_faker.building_number() for _ in range(POOL_SIZE)],
+        "street_names": [pool_faker.street_name() for _ in range(POOL_SIZE)],
+    }
+
+
+def iter_registration_data(num_users=500, seed=None):
+    """
+    逐条生成用户注册数据，恰好产生 num_users 条，内存占用与数量无关
+
+    Args:
+        num_users: 生成数量
+        seed: 随机种子，相同种子生成相同数据
+
+    Yields:
+        dict: 注册数据，字段见 REGISTRATION_FIELDS
+    """
+    rng = random.Random(seed)
+    pools = _sample_pools(seed)
+    credit_codes = iter_uscc(num_users, seed)
+    id_cards = iter_id_cards(num_users, seed)
+
+    last_names = pools["last_names"]
+    male_first_names = pools["male_first_names"]
+    female_first_names = pools["female_first_names"]
+    random_ = rng.random
+
+    def pick(pool):
+        # 比 rng.choice 少一次拒绝采样，大批量生成时明显更快
+        return pool[int(random_() * len(pool))]
+
+    def person_name(i):
+        first_names = male_first_names if random_() > 0.3 else female_first_names
+        return f"{pick(last_names)}{pick(first_names)}_{i}"
+
+    def phone():
+        return f"1{int(random_() * 10 ** 10):010d}"
+
+    # 硬编码省份、城市和区县
+    province = "山东省"
+    city = "潍坊市"
+    district = "坊子区"
+    address = f"{province}{city}{district}"
 
     for i in range(1, num_users + 1):
-        # 硬编码省份、城市和区县
-        province = "山东省"
-        city = "潍坊市"
-        district = "坊子区"
-
-        # 构建地址字符串
-        address = f"{province}{city}{district}"
-
-        # 生成企业名称
-        enterprise_name = f"{fake.company_prefix()}{fake.company_suffix()}_{i}"
-
-        # 生成法定代表人姓名
-        legal_representative = f"{fake.last_name()}{fake.first_name_male() if random.random() > 0.3 else fake.first_name_female()}_{i}"
-
-        # 生成统一社会信用代码
-        unified_social_credit_code = generate_random_credit_code()
-
-        # 生成注册地址和经营场所
-        registered_address = f"{province}{city}{district}{fake.street_address()}_{i}"
-        business_location = f"{province}{city}{district}{fake.building_number()}{fake.street_name()}_{i}"
-
-        # 生成安全负责人姓名
-        safety_director = f"{fake.last_name()}{fake.first_name_male() if random.random() > 0.3 else fake.first_name_female()}_{i}"
-
-        # 生成经营范围（从限定列表中选择）
-        scope = random.choice(scopes)
-
-        # 生成电话号码
-        telephone = generate_random_phone()
-
-        # 生成营业执照路径
-        business_license_path = f"C:\\Users\\Administrator\\Pictures\\Screenshots\\1.png"
-        enterprise_type = random.choice(enterprise_types)
-
-        # 创建注册数据字典
+        enterprise_type = pick(enterprise_types)
         data = {
-            "enterprise_name": enterprise_name,
+            "enterprise_name": f"{pick(pools['company_prefixes'])}{pick(pools['company_suffixes'])}_{i}",
             "enterprise_type": enterprise_type,
             "province": province,
             "city": city,
             "district": district,
-            "legal_representative": legal_representative,
-            "unified_social_credit_code": unified_social_credit_code,
-            "registered_address": registered_address,
-            "business_location": business_location,
-            "telephone": telephone,
-            "safety_director": safety_director,
-            "scope": scope,
-            "business_license_path": business_license_path
+            "legal_representative": person_name(i),
+            "unified_social_credit_code": next(credit_codes),
+            "registered_address": f"{address}{pick(pools['street_addresses'])}_{i}",
+            "business_location": f"{address}{pick(pools['building_numbers'])}{pick(pools['street_names'])}_{i}",
+            "telephone": phone(),
+            "safety_director": person_name(i),
+            "scope": pick(scopes),
+            "business_license_path": "C:\\Users\\Administrator\\Pictures\\Screenshots\\1.png",
         }
+        handler_id = next(id_cards)
 
         if enterprise_type == "销售企业":
-            data[
-                "handle_by"] = f"{fake.last_name()}{fake.first_name_male() if random.random() > 0.3 else fake.first_name_female()}_{i}"
-            data["handler_tel"] = generate_random_phone()
-            data["handler_ID"] = generate_id_card()
-            data_list.append(data)
+            data["handle_by"] = person_name(i)
+            data["handler_tel"] = phone()
+            data["handler_ID"] = handler_id
+
+        yield data
 
-    return data_list    
\ No newline at end of file
+
+def generate_registration_data(num_users=500, seed=None):
+    """生成指定数量的用户注册数据"""
+    return list(iter_registration_data(num_users, seed))
@@ -2,8 +2,10 @@ import csv
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Dict, Iterable, List
 from conf.logging_config import logger
+from tests.utils.fixture_catalog import IMAGE_EXTENSIONS, get_fixture_catalog
 
 def read_json_file(file_path: str) -> Dict[str, Any]:
     """读取JSON文件并返回内容"""
@@ -63,6 +65,56 @@ def append_info_to_csv(file_path: str, info: list[dict]) -> None:
             writer.writeheader()
         writer.writerows(info)
 
+def write_records_to_csv(file_path: str, records: Iterable[dict], fieldnames: list[str],
+                         chunk_size: int = 1000) -> int:
+    """
+    分块将记录流写入CSV文件，不在内存中保留全部记录
+
+    Args:
+        file_path: 文件路径
+        records: 记录迭代器（可为生成器）
+        fieldnames: 列名，记录中缺少的列写为空
+        chunk_size: 每次写入的记录数
+
+    Returns:
+        int: 写入的记录数
+    """
+    create_data_directory(os.path.dirname(file_path) or ".")
+    records = iter(records)
+    count = 0
+    with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, restval="")
+        writer.writeheader()
+        while chunk := list(islice(records, chunk_size)):
+            writer.writerows(chunk)
+            count += len(chunk)
+    logger.info(f"已写入 {count} 条记录到CSV文件: {file_path}")
+    return count
+
+def write_records_to_json(file_path: str, records: Iterable[dict], chunk_size: int = 1000) -> int:
+    """
+    分块将记录流写入JSON数组文件，不在内存中保留全部记录
+
+    Args:
+        file_path: 文件路径
+        records: 记录迭代器（可为生成器）
+        chunk_size: 每次写入的记录数
+
+    Returns:
+        int: 写入的记录数
+    """
+    create_data_directory(os.path.dirname(file_path) or ".")
+    records = iter(records)
+    count = 0
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        while chunk := list(islice(records, chunk_size)):
+            f.write(('\n' if count == 0 else ',\n') + ',\n'.join(json.dumps(r, ensure_ascii=False) for r in chunk))
+            count += len(chunk)
+        f.write('\n]\n' if count else ']\n')
+    logger.info(f"已写入 {count} 条记录到JSON文件: {file_path}")
+    return count
+
 def read_credentials(file_path: str) -> list[dict]:
     """从CSV文件读取用户名和密码"""
     if not Path(file_path).exists():
@@ -90,18 +142,22 @@ def get_image_files( directory):
     """
     获取目录下的所有图片文件
 
+    tests/data 下的目录直接查会话内共享的文件索引，不再每次 listdir 与排序
+
     Args:
         directory (str): 目录路径
 
     Returns:
         list: 图片文件列表
     """
+    catalog = get_fixture_catalog()
+    if os.path.abspath(directory).startswith(catalog.root + os.sep):
+        return [entry.name for entry in catalog.in_directory(directory, IMAGE_EXTENSIONS)]
+
     if os.path.exists(directory) and os.path.isdir(directory):
         files = [f for f in os.listdir(directory)
-                 if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
+                 if f.lower().endswith(IMAGE_EXTENSIONS)]
         return sorted(files)
     else:
         logger.warning(f"警告：目录 {directory} 不存在或不是目录")
         return []
-
-
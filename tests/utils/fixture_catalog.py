@@ -0,0 +1,238 @@
+"""
+tests/data 上传文件索引
+
+会话内只扫描一次 tests/data，为每个文件记录所在目录、扩展名、大小、按文件头识别的真实类型，
+内容哈希在需要去重时才计算（且只对大小相同的文件计算）。
+按属性查找文件，例如"不超过 1MB 的合法 png"，不再依赖写死的路径：
+
+    catalog = get_fixture_catalog()
+    catalog.find(mime="image/png", max_size=1024 * 1024, valid=True)
+
+上传用例在 conf 中以属性字典描述文件，页面对象上传前用 fixture_path 解析。
+"""
+import bisect
+import hashlib
+import os
+import threading
+
+from conf.config import TEST_DATA_DIR
+from conf.logging_config import logger
+
+# 文件头 -> 真实类型
+_MAGIC_NUMBERS = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"%PDF-", "application/pdf"),
+    (b"BM", "image/bmp"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"MZ", "application/x-msdownload"),
+    (b"GIF8", "image/gif"),
+]
+
+# 扩展名声称的类型，与文件头识别结果一致才视为"合法"文件
+_EXTENSION_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".pdf": "application/pdf",
+    ".bmp": "image/bmp",
+    ".zip": "application/zip",
+    ".exe": "application/x-msdownload",
+    ".gif": "image/gif",
+    ".html": "text/html",
+    ".svg": "image/svg+xml",
+    ".txt": "text/plain",
+    ".py": "text/x-python",
+    ".php": "text/x-php",
+}
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+
+def sniff_mime(head: bytes, extension: str) -> str:
+    """根据文件头判断真实类型；文本类文件没有固定文件头，沿用扩展名类型"""
+    for magic, mime in _MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return mime
+    stripped = head.lstrip().lower()
+    if stripped.startswith((b"<!doctype html", b"<html")):
+        return "text/html"
+    if stripped.startswith(b"<svg") or (stripped.startswith(b"<?xml") and b"<svg" in head):
+        return "image/svg+xml"
+    return _EXTENSION_MIME.get(extension, "application/octet-stream")
+
+
+class FixtureFile:
+    """单个测试数据文件的元信息，内容哈希首次访问时计算"""
+
+    __slots__ = ("path", "name", "directory", "category", "extension", "size", "mime", "_sha256")
+
+    def __init__(self, path: str, category: str, size: int, mime: str):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.directory = os.path.dirname(path)
+        self.category = category
+        self.extension = os.path.splitext(self.name)[1].lower()
+        self.size = size
+        self.mime = mime
+        self._sha256 = None
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            digest = hashlib.sha256()
+            with open(self.path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+            self._sha256 = digest.hexdigest()
+        return self._sha256
+
+    @property
+    def is_valid(self) -> bool:
+        """扩展名与真实类型一致（例如 lease.jpg 实际为 png 时为 False）"""
+        return _EXTENSION_MIME.get(self.extension) == self.mime
+
+    def __repr__(self):
+        return f"FixtureFile({self.path!r}, {self.mime}, {self.size}B)"
+
+
+class FixtureCatalog:
+    """
+    测试数据文件索引
+
+    Args:
+        root: 扫描的根目录，默认 tests/data
+    """
+
+    def __init__(self, root: str = TEST_DATA_DIR):
+        self.root = os.path.abspath(root)
+        self.files = []
+        self._by_path = {}
+        self._by_directory = {}
+        # (mime, 是否合法) -> 按大小升序的文件列表与对应大小列表，mime / 是否合法为 None 表示不限
+        self._by_mime = {}
+        self._duplicates = None
+        self._redundant_paths = None
+        self._scan()
+
+    def _scan(self):
+        for directory, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "__")))
+            relative = os.path.relpath(directory, self.root)
+            category = relative.split(os.sep)[0] if relative != "." else ""
+            for filename in sorted(filenames):
+                path = os.path.join(directory, filename)
+                with open(path, "rb") as f:
+                    head = f.read(64)
+                entry = FixtureFile(path, category, os.path.getsize(path), "")
+                entry.mime = sniff_mime(head, entry.extension)
+                self.files.append(entry)
+                self._by_path[path] = entry
+                self._by_directory.setdefault(directory, []).append(entry)
+
+        for entry in sorted(self.files, key=lambda e: e.size):
+            for key in ((entry.mime, None), (entry.mime, entry.is_valid), (None, None), (None, entry.is_valid)):
+                files, sizes = self._by_mime.setdefault(key, ([], []))
+                files.append(entry)
+                sizes.append(entry.size)
+        logger.info(f"测试数据索引完成: {len(self.files)} 个文件（{self.root}）")
+
+    def get(self, path: str) -> FixtureFile | None:
+        return self._by_path.get(os.path.abspath(path))
+
+    def in_directory(self, directory: str, extensions=None) -> list[FixtureFile]:
+        """目录下（不含子目录）的文件，按文件名排序，可按扩展名过滤"""
+        entries = self._by_directory.get(os.path.abspath(directory), [])
+        if extensions:
+            entries = [e for e in entries if e.extension in extensions]
+        return entries
+
+    def find(self, mime: str = None, min_size: int = 0, max_size: int = None, valid: bool = None,
+             category: str = None, extension: str = None) -> FixtureFile | None:
+        """
+        按属性查找一个文件，返回满足条件中最小的文件，找不到返回 None
+
+        不限目录时跳过内容重复的副本，只返回规范文件
+
+        :param mime: 真实类型，例如 "image/png"，None 不限
+        :param min_size: 最小字节数
+        :param max_size: 最大字节数
+        :param valid: True 只要扩展名与类型一致的文件，False 只要不一致的（伪装文件），None 不限
+        :param category: tests/data 下的一级目录名，例如 "evidence_files"
+        :param extension: 扩展名，例如 ".jpg"
+        """
+        files, sizes = self._by_mime.get((mime, valid), ([], []))
+        redundant = self._redundant() if category is None else set()
+        index = bisect.bisect_left(sizes, min_size)
+        for entry in files[index:]:
+            if max_size is not None and entry.size > max_size:
+                return None
+            if category is not None and entry.category != category:
+                continue
+            if extension is not None and entry.extension != extension:
+                continue
+            if entry.path not in redundant:
+                return entry
+        return None
+
+    def duplicates(self) -> dict[str, list[FixtureFile]]:
+        """内容相同的文件分组：{规范路径: [重复文件...]}，只对大小相同的文件计算哈希"""
+        if self._duplicates is None:
+            by_size = {}
+            for entry in self.files:
+                by_size.setdefault(entry.size, []).append(entry)
+            groups = {}
+            for same_size in by_size.values():
+                if len(same_size) < 2:
+                    continue
+                by_hash = {}
+                for entry in same_size:
+                    by_hash.setdefault(entry.sha256, []).append(entry)
+                for same_content in by_hash.values():
+                    if len(same_content) > 1:
+                        groups[same_content[0].path] = same_content[1:]
+            self._duplicates = groups
+        return self._duplicates
+
+    def _redundant(self) -> set[str]:
+        if self._redundant_paths is None:
+            self._redundant_paths = {e.path for copies in self.duplicates().values() for e in copies}
+        return self._redundant_paths
+
+    def unique(self) -> list[FixtureFile]:
+        """去重后的文件列表，重复内容只保留第一个"""
+        redundant = self._redundant()
+        return [e for e in self.files if e.path not in redundant]
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_fixture_catalog() -> FixtureCatalog:
+    """获取会话内共享的测试数据索引，首次调用时扫描"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = FixtureCatalog()
+    return _catalog
+
+
+def fixture_path(spec) -> str:
+    """
+    把上传文件描述解析为文件路径
+
+    conf 中的上传文件常量写成属性字典（传给 FixtureCatalog.find），例如
+    {"category": "evidence_files", "extension": ".html"}；字符串原样返回，
+    便于"文件不存在"一类的用例继续传入固定路径
+
+    Raises:
+        FileNotFoundError: 属性字典没有匹配的文件
+    """
+    if not isinstance(spec, dict):
+        return spec
+    entry = get_fixture_catalog().find(**spec)
+    if entry is None:
+        raise FileNotFoundError(f"tests/data 中没有满足条件的文件: {spec}")
+    return entry.path
@@ -0,0 +1,249 @@
+"""
+声明式表单字段模型
+
+每个表单用一组 FieldSpec 描述：字段键、页面标签、控件类型、可选项、错误提示定位方式。
+页面对象的填写、回读、错误检查方法以及 FormValidationUtils 的字段映射都由同一份描述生成，
+新增字段只需在表单描述中增加一项。
+
+控件类型：
+    text     普通输入框，fill 后即生效
+    select   下拉选择框，点击后从列表中选择
+    number   房间户型中的数量输入框，同一标签下按 slot 区分，fill 后触发失焦校验
+    counter  带加减按钮的计数器，通过点击增加按钮设置
+    radio    单选按钮组，按选项文本匹配
+"""
+from playwright.sync_api import Page
+
+from conf.logging_config import logger
+from tests.utils.page_utils import (
+    get_element_corresponding_error_tip,
+    get_label_corresponding_elements,
+    get_label_corresponding_input,
+    select_option_by_input_element,
+    set_selector_input_by_input_element,
+    simulate_blur,
+)
+
+_ERROR_DIV = 'div[contains(@class, "el-form-item__error")]'
+
+# 控件类型 -> 错误提示相对于定位元素的 XPath
+_ERROR_XPATHS = {
+    "text": f"../following-sibling::{_ERROR_DIV}",
+    "select": f"../../following-sibling::{_ERROR_DIV}",
+    "number": f"../../following-sibling::{_ERROR_DIV}",
+    "counter": f"../../following-sibling::{_ERROR_DIV}",
+    "radio": f"../..//{_ERROR_DIV}",
+}
+
+_COUNTER_INCREASE_XPATH = "../../*[contains(@class, 'increase')]"
+
+
+class FieldSpec:
+    """
+    单个表单字段的描述
+
+    Args:
+        key: 字段键，与页面对象方法参数名一致
+        label: 页面上的标签文本
+        control: 控件类型，见模块说明
+        slot: 同一标签下的第几个控件（例如房间户型下的卧室/客厅/厨房/卫生间）
+        options: 可选项文本，select / radio 控件使用
+        error_method: 错误检查方法名，默认 "<key>_error"
+    """
+
+    __slots__ = ("key", "label", "control", "slot", "options", "error_method")
+
+    def __init__(self, key: str, label: str, control: str, slot: int = 0, options: tuple = (),
+                 error_method: str = None):
+        if control not in _ERROR_XPATHS:
+            raise ValueError(f"不支持的控件类型: {control}，可选: {', '.join(_ERROR_XPATHS)}")
+        self.key = key
+        self.label = label
+        self.control = control
+        self.slot = slot
+        self.options = tuple(options)
+        self.error_method = error_method or f"{key}_error"
+
+    @property
+    def error_xpath(self) -> str:
+        return _ERROR_XPATHS[self.control]
+
+    def __repr__(self):
+        return f"FieldSpec({self.key!r}, {self.label!r}, {self.control!r})"
+
+
+class FormSchema:
+    """一个表单的字段描述集合，字段顺序即填写顺序"""
+
+    def __init__(self, name: str, fields: list[FieldSpec]):
+        self.name = name
+        self.fields = {spec.key: spec for spec in fields}
+
+    def __getitem__(self, key: str) -> FieldSpec:
+        return self.fields[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.fields
+
+    def __iter__(self):
+        return iter(self.fields.values())
+
+    def field_mapping(self) -> dict:
+        """字段键 -> 表单参数名"""
+        return {key: key for key in self.fields}
+
+    def field_labels(self) -> dict:
+        """字段键 -> (标签文本, 标签内位置)"""
+        return {key: (spec.label, spec.slot) for key, spec in self.fields.items()}
+
+    def error_methods(self) -> dict:
+        """字段键 -> 页面对象上的错误检查方法名"""
+        return {key: spec.error_method for key, spec in self.fields.items()}
+
+    def default_params(self) -> dict:
+        """所有字段为空值的默认参数"""
+        return {key: "" for key in self.fields}
+
+
+class FormBinding:
+    """
+    表单描述与具体页面的绑定
+
+    每个字段的控件句柄首次使用时解析并缓存，后续填写、回读、错误检查直接复用，
+    不再每次按标签重新定位。页面跳转或重新打开表单后需新建绑定。
+    """
+
+    def __init__(self, page: Page, schema: FormSchema):
+        self.page = page
+        self.schema = schema
+        self._handles = {}
+        self._slot_groups = {}
+
+    def handle(self, key: str):
+        """字段的定位元素：输入类控件为 input，radio 为标签文本元素"""
+        if key not in self._handles:
+            self._handles[key] = self._resolve(self.schema[key])
+        return self._handles[key]
+
+    def _resolve(self, spec: FieldSpec):
+        if spec.control == "radio":
+            return self.page.get_by_text(spec.label, exact=True)
+        if spec.control == "number":
+            # 同一标签下的多个输入框只定位一次
+            if spec.label not in self._slot_groups:
+                self._slot_groups[spec.label] = get_label_corresponding_elements(
+                    self.page, spec.label, "following-sibling::div//input"
+                )
+            group = self._slot_groups[spec.label]
+            if len(group) <= spec.slot:
+                raise ValueError(f"标签 {spec.label} 下的输入框数量不足，需要第 {spec.slot + 1} 个")
+            return group[spec.slot]
+        return get_label_corresponding_input(self.page, spec.label)
+
+    def _radio_buttons(self, spec: FieldSpec) -> list:
+        cache_key = ("radio", spec.key)
+        if cache_key not in self._handles:
+            self._handles[cache_key] = get_label_corresponding_elements(
+                self.page, spec.label, "following-sibling::div//label"
+            )
+        return self._handles[cache_key]
+
+    def fill(self, key: str, value: str):
+        """按控件类型设置字段值"""
+        spec = self.schema[key]
+        if spec.control == "radio":
+            self._select_radio(spec, value)
+            return
+        element = self.handle(key)
+        if spec.control == "text":
+            element.fill(value)
+        elif spec.control == "select":
+            select_option_by_input_element(self.page, element, value)
+        elif spec.control == "number":
+            element.fill(value)
+            simulate_blur(element)
+        elif spec.control == "counter":
+            set_selector_input_by_input_element(element, _COUNTER_INCREASE_XPATH, value)
+
+    def _select_radio(self, spec: FieldSpec, value: str):
+        buttons = self._radio_buttons(spec)
+        for button in buttons:
+            text = button.text_content().strip()
+            if value in text:
+                button.click()
+                logger.info(f"已选择选项：{text}")
+                return
+        raise ValueError(f"未找到选项：{value}，可用选项为：{[b.text_content().strip() for b in buttons]}")
+
+    def read(self, key: str) -> str | None:
+        """回读字段当前值；radio 返回选中项文本，未选中返回 None"""
+        spec = self.schema[key]
+        if spec.control == "radio":
+            for button in self._radio_buttons(spec):
+                if "is-checked" in (button.get_attribute("class") or ""):
+                    return button.text_content().strip()
+            return None
+        return self.handle(key).input_value()
+
+    def read_all(self, keys=None) -> dict:
+        """回读多个字段，默认全部字段"""
+        return {key: self.read(key) for key in (keys or self.schema.fields)}
+
+    def error(self, key: str, message: str | None) -> bool:
+        """检查字段是否显示指定的错误提示；message 为 None 表示期望没有错误"""
+        spec = self.schema[key]
+        return get_element_corresponding_error_tip(self.handle(key), spec.error_xpath, message)
+
+
+def bind_error_methods(page_class, schema: FormSchema):
+    """
+    为页面对象类生成 "<key>_error" 错误检查方法，类中已手写的同名方法保留不覆盖
+
+    页面对象需要提供 form 属性（FormBinding 实例）。
+    """
+    for spec in schema:
+        if hasattr(page_class, spec.error_method):
+            continue
+
+        def error_method(self, message: str, _key=spec.key) -> bool:
+            return self.form.error(_key, message)
+
+        error_method.__name__ = spec.error_method
+        error_method.__doc__ = f"检查{spec.label}是否显示指定的错误提示"
+        setattr(page_class, spec.error_method, error_method)
+    return page_class
+
+
+_YES_NO = ("有", "无")
+
+ROOM_FORM_SCHEMA = FormSchema("room", [
+    # 基本信息
+    FieldSpec("room_name", "房间名称", "text"),
+    FieldSpec("property_type", "产权类型", "radio", options=("自有", "租赁", "共有"),
+              error_method="property_type_check"),
+    FieldSpec("ms_name", "民宿名称", "select"),
+    FieldSpec("floor", "楼层", "select"),
+    FieldSpec("ly_name", "楼宇", "select"),
+    FieldSpec("room_type", "房间类型", "select"),
+    # 房间户型
+    FieldSpec("bedroom_number", "房间户型", "number", slot=0),
+    FieldSpec("living_room_number", "房间户型", "number", slot=1),
+    FieldSpec("kitchen_number", "房间户型", "number", slot=2),
+    FieldSpec("bathroom_number", "房间户型", "number", slot=3),
+    FieldSpec("area", "房型面积(㎡)", "counter"),
+    FieldSpec("bed_number", "床数量", "counter"),
+    FieldSpec("max_occupancy", "最大住人数", "counter"),
+    # 设施
+    FieldSpec("parking", "是否有车位", "radio", options=_YES_NO),
+    FieldSpec("balcony", "是否有阳台", "radio", options=_YES_NO),
+    FieldSpec("window", "是否有窗户", "radio", options=_YES_NO),
+    FieldSpec("tv", "电视机", "radio", options=_YES_NO),
+    FieldSpec("projector", "投影仪", "radio", options=_YES_NO),
+    FieldSpec("washing_machine", "洗衣机", "radio", options=_YES_NO),
+    FieldSpec("clothes_steamer", "挂烫机", "radio", options=_YES_NO),
+    FieldSpec("water_heater", "热水器", "radio", options=_YES_NO),
+    FieldSpec("hair_dryer", "吹风机", "radio", options=_YES_NO),
+    FieldSpec("fridge", "冰箱", "radio", options=_YES_NO),
+    FieldSpec("stove", "炉灶", "radio", options=("无", "燃气灶", "电磁炉", "其他")),
+    FieldSpec("toilet", "便器", "radio", options=("智能马桶", "普通马桶", "蹲便", "无")),
+])
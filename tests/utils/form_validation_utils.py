@@ -2,6 +2,7 @@ import random
 
 import pytest
 from conf.logging_config import logger
+from tests.utils.form_schema import ROOM_FORM_SCHEMA
 
 class FormValidationUtils:
     """表单验证测试工具类（优化版）"""
@@ -31,34 +32,37 @@ class FormValidationUtils:
         "USCC": "USCC",
     }
 
-    # 房间信息表单字段映射配置
-    ROOM_FIELD_MAPPING = {
-        "room_name": "room_name",
-        "property_type": "property_type",
-        "ms_name": "ms_name",
-        "floor": "floor",
-        "ly_name": "ly_name",
-        "room_type": "room_type",
-        "bedroom_number": "bedroom_number",
-        "living_room_number": "living_room_number",
-        "kitchen_number": "kitchen_number",
-        "bathroom_number": "bathroom_number",
-        "area": "area",
-        "bed_number": "bed_number",
-        "max_occupancy": "max_occupancy",
-        "parking": "parking",
-        "balcony": "balcony",
-        "window": "window",
-        "tv": "tv",
-        "projector": "projector",
-        "washing_machine": "washing_machine",
-        "clothes_steamer": "clothes_steamer",
-        "water_heater": "water_heater",
-        "hair_dryer": "hair_dryer",
-        "fridge": "fridge",
-        "stove": "stove",
-        "toilet": "toilet",
-    }
+    # 房间信息表单字段映射与页面标签位置，均由表单描述生成
+    ROOM_FIELD_MAPPING = ROOM_FORM_SCHEMA.field_mapping()
+    ROOM_FIELD_LABELS = ROOM_FORM_SCHEMA.field_labels()
+
+    @staticmethod
+    def map_harvested_errors(form_type: str, harvested_errors: list[dict]) -> dict:
+        """
+        将 harvest_form_errors 一次收集到的错误列表映射回表单字段键
+
+        Args:
+            form_type: 表单类型，目前支持"room"
+            harvested_errors: harvest_form_errors 的返回值
+
+        Returns:
+            dict: {字段键: 错误文本}，未出现错误的字段不在结果中
+        """
+        if form_type == "room":
+            mapping = FormValidationUtils.ROOM_FIELD_MAPPING
+            field_labels = FormValidationUtils.ROOM_FIELD_LABELS
+        else:
+            raise ValueError(f"不支持的表单类型: {form_type}")
+
+        label_to_field = {position: field for field, position in field_labels.items()}
+        field_errors = {}
+        for error in harvested_errors:
+            field = label_to_field.get((error["label"], error["slot"]))
+            if field is None:
+                logger.warning(f"未能映射到字段的错误提示: {error}")
+                continue
+            field_errors[mapping.get(field, field)] = error["text"]
+        return field_errors
 
     @staticmethod
 
@@ -168,33 +172,9 @@ class FormValidationUtils:
     @staticmethod
     def _get_default_room_params() -> dict:
         """获取房间信息表单默认参数"""
-        return {
-            "room_name": "",
-            "property_type": "自有",  # 设置默认值为自有
-            "ms_name": "",
-            "floor": "",
-            "ly_name": "",
-            "room_type": "",
-            "bedroom_number": "",
-            "living_room_number": "",
-            "kitchen_number": "",
-            "bathroom_number": "",
-            "area": "",
-            "bed_number": "",
-            "max_occupancy": "",
-            "parking": "",
-            "balcony": "",
-            "window": "",
-            "tv": "",
-            "projector": "",
-            "washing_machine": "",
-            "clothes_steamer": "",
-            "water_heater": "",
-            "hair_dryer": "",
-            "fridge": "",
-            "stove": "",
-            "toilet": "",
-        }
+        params = ROOM_FORM_SCHEMA.default_params()
+        params["property_type"] = "自有"  # 设置默认值为自有
+        return params
 
 
     @staticmethod
@@ -226,31 +206,6 @@ class FormValidationUtils:
     @staticmethod
     def _get_room_error_selectors() -> dict:
         """获取房间信息表单错误选择器映射"""
-        return {
-            "room_name": "room_name_error",
-            "property_type": "property_type_check",
-            "ms_name": "ms_name_error",
-            "floor": "floor_error",
-            "ly_name": "ly_name_error",
-            "room_type": "room_type_error",
-            "bedroom_number": "bedroom_number_error",
-            "living_room_number": "living_room_number_error",
-            "kitchen_number": "kitchen_number_error",
-            "bathroom_number": "bathroom_number_error",
-            "area": "area_error",
-            "bed_number": "bed_number_error",
-            "max_occupancy": "max_occupancy_error",
-            "parking": "parking_error",
-            "balcony": "balcony_error",
-            "window": "window_error",
-            "tv": "tv_error",
-            "projector": "projector_error",
-            "washing_machine": "washing_machine_error",
-            "clothes_steamer": "clothes_steamer_error",
-            "water_heater": "water_heater_error",
-            "hair_dryer": "hair_dryer_error",
-            "fridge": "fridge_error",
-            "stove": "stove_error",
-            "toilet": "toilet_error",
-            "public_security_registration_form": "public_security_registration_form_error",
-        }
\ No newline at end of file
+        selectors = ROOM_FORM_SCHEMA.error_methods()
+        selectors["public_security_registration_form"] = "public_security_registration_form_error"
+        return selectors
@@ -0,0 +1,104 @@
+"""
+基于 http.client 的连接池
+
+基准测试按固定并发重放请求时，每个请求都新建 TCP 连接会把握手时间计入延迟。
+连接池按 scheme/host/port 保持长连接，请求结束后连接放回池中复用；
+服务端关闭了空闲连接时自动重连重试一次。
+"""
+import http.client
+import queue
+import ssl
+import threading
+from urllib.parse import urlsplit
+
+
+class HTTPConnectionPool:
+    """
+    单个主机的长连接池
+
+    Args:
+        base_url: 目标地址，只使用其中的 scheme、host、port
+        size: 池中保留的最大空闲连接数，一般等于并发数
+        timeout: 连接与读取超时（秒）
+        verify_tls: HTTPS 是否校验证书，测试环境多为自签名证书，默认不校验
+    """
+
+    # 服务端关闭空闲连接时出现的异常，可重连后重试
+    _RETRYABLE = (http.client.RemoteDisconnected, http.client.CannotSendRequest, ConnectionResetError,
+                  BrokenPipeError)
+
+    def __init__(self, base_url: str, size: int = 10, timeout: float = 30, verify_tls: bool = False):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"不支持的协议: {parts.scheme}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.timeout = timeout
+        self._ssl_context = None
+        if parts.scheme == "https" and not verify_tls:
+            self._ssl_context = ssl._create_unverified_context()
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        with self._lock:
+            self.created += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout,
+                                               context=self._ssl_context)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, connection: http.client.HTTPConnection):
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def request(self, method: str, path: str, body: bytes = None, headers: dict = None) -> tuple[int, bytes]:
+        """
+        发送请求并读取完整响应
+
+        :param path: 路径与查询串，例如 "/api/minsu/list?pageNum=1"
+        :return: (状态码, 响应体)
+        """
+        headers = headers or {}
+        for attempt in range(2):
+            connection = self._acquire()
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except self._RETRYABLE:
+                connection.close()
+                if attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+            return response.status, data
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,23 +1,115 @@
-import paramiko
+import random
 import re
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+# 前17位权重系数（GB 11643）
+ID_WEIGHTS = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
+# 校验码映射：加权和模 11 的余数 -> 校验码
+ID_CHECK_CODES = "10X98765432"
+
+# 生成身份证号使用的行政区划代码
+ID_REGION_CODES = [
+    "110101", "110105", "120101", "310101", "310104", "320102", "330102", "340102",
+    "350102", "350203", "370102", "370202", "370704", "410102", "420102", "430102",
+    "440103", "440305", "500103", "510104", "610102",
+]
+
+# 指定随机种子时计算年龄范围的基准日期，保证相同种子在任何日期都生成相同序列
+ID_REFERENCE_DATE = date(2025, 1, 1)
+
+# 三位顺序码各取值的加权和，下标即顺序码
+_SEQUENCE_SUMS = [
+    int(f"{n:03d}"[0]) * ID_WEIGHTS[14] + int(f"{n:03d}"[1]) * ID_WEIGHTS[15] + int(f"{n:03d}"[2]) * ID_WEIGHTS[16]
+    for n in range(1000)
+]
+
+
+@lru_cache(maxsize=None)
+def _region_sum(region_code: str) -> int:
+    """行政区划代码（第1-6位）的加权和"""
+    return sum(int(d) * w for d, w in zip(region_code, ID_WEIGHTS[:6]))
+
+
+@lru_cache(maxsize=None)
+def _birth_sum(birth: str) -> int:
+    """出生日期（第7-14位）的加权和"""
+    return sum(int(d) * w for d, w in zip(birth, ID_WEIGHTS[6:14]))
+
+
+def id_check_code(body: str) -> str:
+    """根据前17位计算校验码，区划码与出生日期部分的加权和按段缓存"""
+    total = _region_sum(body[:6]) + _birth_sum(body[6:14]) + _SEQUENCE_SUMS[int(body[14:17])]
+    return ID_CHECK_CODES[total % 11]
+
 
 def validate_id_card(id_card):
     """验证身份证号码是否合法"""
-    if len(id_card) != 18:
+    if len(id_card) != 18 or not id_card[:17].isdigit():
         return False
+    return id_card[-1].upper() == id_check_code(id_card[:17])
+
+
+def validate_id_cards(id_cards) -> list[bool]:
+    """批量验证身份证号码，返回与输入顺序一致的结果列表"""
+    return [validate_id_card(id_card) for id_card in id_cards]
+
+
+def _years_ago(today: date, years: int) -> date:
+    """today 往前推 years 年，2月29日落在平年时取2月28日"""
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:
+        return today.replace(year=today.year - years, day=28)
 
-    # 前17位权重系数
-    weights = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
-    # 校验码映射
-    check_code = ['1', '0', 'X', '9', '8', '7', '6', '5', '4', '3', '2']
 
-    # 计算前17位加权和
-    total = sum(int(id_card[i]) * weights[i] for i in range(17))
-    mod = total % 11
-    expected_check = check_code[mod]
+def iter_id_cards(count: int, seed=None, min_age: int = 18, max_age: int = 80, region_codes=None,
+                  reference_date: date = None):
+    """
+    逐个生成校验码正确的18位身份证号码
 
-    return id_card[-1].upper() == expected_check
+    由行政区划代码、出生日期、顺序码直接拼接，校验码按公式计算，无需生成后再校验重试。
+
+    :param count: 生成数量
+    :param seed: 随机种子，相同种子得到相同序列
+    :param min_age: 最小年龄
+    :param max_age: 最大年龄
+    :param region_codes: 可选的行政区划代码列表，默认 ID_REGION_CODES
+    :param reference_date: 计算年龄的基准日期；默认指定 seed 时为 ID_REFERENCE_DATE，否则为当天
+    """
+    rng = random.Random(seed)
+    regions = region_codes or ID_REGION_CODES
+    if reference_date is not None:
+        today = reference_date
+    else:
+        today = ID_REFERENCE_DATE if seed is not None else date.today()
+    earliest = _years_ago(today, max_age + 1) + timedelta(days=1)
+    latest = _years_ago(today, min_age)
+    span = (latest - earliest).days
+    birth_cache = {}
+    random_ = rng.random
+
+    for _ in range(count):
+        region = regions[int(random_() * len(regions))]
+        offset = int(random_() * (span + 1))
+        birth = birth_cache.get(offset)
+        if birth is None:
+            birth = birth_cache[offset] = (earliest + timedelta(days=offset)).strftime("%Y%m%d")
+        # 顺序码 000 不分配，取值 001-999
+        sequence = 1 + int(random_() * 999)
+        total = _region_sum(region) + _birth_sum(birth) + _SEQUENCE_SUMS[sequence]
+        yield f"{region}{birth}{sequence:03d}{ID_CHECK_CODES[total % 11]}"
+
+
+def generate_id_cards(count: int, seed=None, min_age: int = 18, max_age: int = 80, region_codes=None,
+                      reference_date: date = None) -> list[str]:
+    """批量生成校验码正确的18位身份证号码，参数同 iter_id_cards"""
+    return list(iter_id_cards(count, seed, min_age, max_age, region_codes, reference_date))
+
+
+def generate_id_card(seed=None, min_age: int = 18, max_age: int = 80, reference_date: date = None) -> str:
+    """生成一个符合国家标准的18位身份证号码"""
+    return next(iter_id_cards(1, seed, min_age, max_age, reference_date=reference_date))
 
 def get_latest_verify_code(
         remote_host: str,
@@ -41,6 +133,9 @@ def get_latest_verify_code(
     返回:
         str | None: 找到的最新验证码，如果未找到则返回None
     """
+    # paramiko 导入较慢，只在实际需要 SSH 时导入
+    import paramiko
+
     try:
         # 创建SSH客户端
         ssh = paramiko.SSHClient()
@@ -0,0 +1,258 @@
+"""
+测试身份数据分配器
+
+并发进程或重复运行时，注册用例需要互不冲突的手机号、用户名和身份证号。
+分配状态保存在本地 SQLite 文件中（BEGIN IMMEDIATE 保证跨进程互斥）：
+    - 新值从计数器递增产生，跳过 t_sys_user 中已存在的值
+    - 发送过验证码的手机号（mark_code_sent）记录冷却到期时间，归还后到期才优先复用
+    - 已注册成功（consumed）的值不再分配
+
+数据库不可达时（离线运行）跳过存在性检查，只保证本地不重复。
+"""
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from datetime import date, timedelta
+
+from conf.config import (
+    DB_CONFIG,
+    DB_NAMES,
+    IDENTITY_DB_PATH,
+    IDENTITY_PHONE_START,
+    SMS_SEND_COOLDOWN,
+)
+from conf.logging_config import logger
+from tests.utils.id_card_validator import id_check_code
+
+# 分配类型 -> t_sys_user 中对应的列，未列出的类型只做本地去重
+_USER_COLUMNS = {
+    "phone": "telephone",
+    "username": "username",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS allocations (
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    state TEXT NOT NULL,            -- leased / free / consumed
+    cooldown_until REAL NOT NULL DEFAULT 0,
+    owner TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (kind, value)
+);
+CREATE INDEX IF NOT EXISTS idx_allocations_free ON allocations (kind, state, cooldown_until);
+CREATE TABLE IF NOT EXISTS counters (
+    kind TEXT PRIMARY KEY,
+    next_index INTEGER NOT NULL
+);
+"""
+
+
+def _id_number_from_index(index: int) -> str:
+    """按序号构造校验位正确的 18 位身份证号（北京市东城区，1980-01-01 起逐日递增）"""
+    birth = date(1980, 1, 1) + timedelta(days=index // 999)
+    body = f"110101{birth:%Y%m%d}{index % 999 + 1:03d}"
+    return body + id_check_code(body)
+
+
+class IdentityAllocator:
+    """
+    跨进程的手机号 / 用户名 / 身份证号分配器
+
+    Args:
+        db_path: SQLite 文件路径
+        check_database: 是否查询 t_sys_user 跳过已存在的值
+        batch_size: 每次向 MySQL 批量检查的候选数量
+    """
+
+    def __init__(self, db_path: str = IDENTITY_DB_PATH, check_database: bool = True, batch_size: int = 50):
+        self.db_path = db_path
+        self.check_database = check_database
+        self.batch_size = batch_size
+        self.owner = os.environ.get("PYTEST_XDIST_WORKER") or uuid.uuid4().hex[:8]
+        self._mysql_available = None
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _existing_in_database(self, kind: str, candidates: list[str]) -> set[str]:
+        """返回 candidates 中已存在于 t_sys_user 的值；数据库不可用时返回空集合"""
+        if not self.check_database or self._mysql_available is False or not candidates:
+            return set()
+        if kind not in _USER_COLUMNS:
+            return set()
+
+        column = _USER_COLUMNS[kind]
+        sql = f"SELECT {column} FROM t_sys_user WHERE {column} IN ({', '.join(['%s'] * len(candidates))})"
+        existing = set()
+        try:
+            import mysql.connector
+
+            for db_name in DB_NAMES:
+                connection = mysql.connector.connect(**DB_CONFIG, database=db_name, connection_timeout=5)
+                try:
+                    cursor = connection.cursor()
+                    cursor.execute(sql, candidates)
+                    existing.update(str(row[0]) for row in cursor.fetchall())
+                    cursor.close()
+                finally:
+                    connection.close()
+            self._mysql_available = True
+        except Exception as e:
+            logger.warning(f"无法查询 t_sys_user，跳过已存在检查: {e}")
+            self._mysql_available = False
+        return existing
+
+    def _format(self, kind: str, index: int, prefix: str) -> str:
+        if kind == "phone":
+            return str(IDENTITY_PHONE_START + index)
+        if kind == "username":
+            return f"{prefix}{index:06d}"
+        if kind == "id_number":
+            return _id_number_from_index(index)
+        raise ValueError(f"不支持的分配类型: {kind}")
+
+    def _lease(self, conn, kind: str, value: str, now: float):
+        conn.execute(
+            "INSERT INTO allocations (kind, value, state, cooldown_until, owner, updated_at) "
+            "VALUES (?, ?, 'leased', 0, ?, ?) "
+            "ON CONFLICT (kind, value) DO UPDATE SET state = 'leased', owner = excluded.owner, "
+            "updated_at = excluded.updated_at",
+            (kind, value, self.owner, now),
+        )
+
+    @staticmethod
+    def _like_prefix(prefix: str) -> str:
+        """LIKE 前缀匹配模式，转义前缀中的 % 与 _"""
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"{escaped}%"
+
+    def _reserve(self, conn, kind: str, prefix: str) -> list[str]:
+        """
+        在写锁内预留一批候选值（状态记为 leased），返回预留的值
+
+        优先取一个冷却已到期的归还值，否则从计数器取一批新值。
+        """
+        counter_kind = f"{kind}:{prefix}" if kind == "username" else kind
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT value FROM allocations WHERE kind = ? AND state = 'free' AND cooldown_until <= ? "
+                "AND value LIKE ? ESCAPE '\\' ORDER BY cooldown_until LIMIT 1",
+                (kind, now, self._like_prefix(prefix)),
+            ).fetchone()
+            if row is not None:
+                candidates = [row[0]]
+            else:
+                start = conn.execute("SELECT next_index FROM counters WHERE kind = ?", (counter_kind,)).fetchone()
+                start = start[0] if start else 0
+                candidates = [self._format(kind, i, prefix) for i in range(start, start + self.batch_size)]
+                known = {
+                    r[0] for r in conn.execute(
+                        f"SELECT value FROM allocations WHERE kind = ? AND value IN "
+                        f"({', '.join(['?'] * len(candidates))})",
+                        [kind, *candidates],
+                    )
+                }
+                candidates = [c for c in candidates if c not in known]
+                conn.execute(
+                    "INSERT INTO counters (kind, next_index) VALUES (?, ?) "
+                    "ON CONFLICT (kind) DO UPDATE SET next_index = excluded.next_index",
+                    (counter_kind, start + self.batch_size),
+                )
+            for value in candidates:
+                self._lease(conn, kind, value, now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return candidates
+
+    def acquire(self, kind: str, prefix: str = "") -> str:
+        """
+        分配一个当前可用的值
+
+        优先复用冷却已到期的归还值，否则从计数器取新值；两者都跳过 t_sys_user 中已存在的值。
+        候选值先在 SQLite 写锁内预留，再在锁外查询 MySQL，避免所有进程排队等待网络请求。
+
+        :param kind: phone / username / id_number
+        :param prefix: 用户名前缀，仅 kind="username" 时使用
+        """
+        with closing(self._connect()) as conn:
+            while True:
+                candidates = self._reserve(conn, kind, prefix)
+                existing = self._existing_in_database(kind, candidates)
+                available = [c for c in candidates if c not in existing]
+                now = time.time()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for value in existing & set(candidates):
+                        conn.execute(
+                            "UPDATE allocations SET state = 'consumed', owner = NULL, updated_at = ? "
+                            "WHERE kind = ? AND value = ?",
+                            (now, kind, value),
+                        )
+                    # 同批次剩余候选作为空闲值保存，供后续分配直接复用
+                    for rest in available[1:]:
+                        conn.execute(
+                            "UPDATE allocations SET state = 'free', owner = NULL, updated_at = ? "
+                            "WHERE kind = ? AND value = ?",
+                            (now, kind, rest),
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                if available:
+                    logger.info(f"分配 {kind}: {available[0]}")
+                    return available[0]
+
+    def acquire_phone(self) -> str:
+        return self.acquire("phone")
+
+    def acquire_username(self, prefix: str = "auto_") -> str:
+        return self.acquire("username", prefix)
+
+    def acquire_id_number(self) -> str:
+        return self.acquire("id_number")
+
+    def mark_code_sent(self, phone_number: str, cooldown: float = SMS_SEND_COOLDOWN):
+        """记录该手机号刚发送过验证码，冷却期内不会再分配"""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE allocations SET cooldown_until = ?, updated_at = ? WHERE kind = 'phone' AND value = ?",
+                (time.time() + cooldown, time.time(), phone_number),
+            )
+
+    def mark_consumed(self, kind: str, value: str):
+        """记录该值已注册成功，之后不再分配"""
+        self.release(kind, value, consumed=True)
+
+    def registered(self, kind: str, values: list[str]) -> set[str]:
+        """返回 values 中已存在于 t_sys_user 的值（即已注册成功），数据库不可用时返回空集合"""
+        return self._existing_in_database(kind, list(values))
+
+    def release(self, kind: str, value: str, consumed: bool = False, cooldown: float = 0):
+        """
+        归还分配的值
+
+        :param consumed: 已注册成功、不可再使用时为 True
+        :param cooldown: 归还后多少秒内不再分配（例如刚发送过验证码的手机号）
+        """
+        now = time.time()
+        state = "consumed" if consumed else "free"
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE allocations SET state = ?, owner = NULL, updated_at = ?, "
+                "cooldown_until = MAX(cooldown_until, ?) WHERE kind = ? AND value = ?",
+                (state, now, now + cooldown, kind, value),
+            )
@@ -0,0 +1,191 @@
+"""
+民宿 / 房间生命周期状态机
+
+每个状态允许的操作、禁用的操作以及操作引起的状态迁移以数据描述，页面对象的预期操作、
+预期状态都从这里查询，不再在页面对象中手写 if/else。
+
+transition_cover() 计算覆盖全部迁移的一组操作序列：每条序列从可直接构造的起始状态出发，
+依次走到最近的未覆盖迁移并执行，直到无法继续；序列条数即需要准备的测试数据条数。
+run_transition_sequence() 按序列执行操作并在每一步校验状态，起始状态由调用方提供的
+构造函数直接准备（例如新建房间即为"正常"），不必每个场景都从头走完整的界面流程。
+"""
+from collections import deque
+from typing import NamedTuple
+
+from conf.logging_config import logger
+
+
+class Transition(NamedTuple):
+    source: str
+    action: str
+    target: str
+
+    def __str__(self):
+        return f"{self.source} -[{self.action}]-> {self.target}"
+
+
+class LifecycleModel:
+    """
+    生命周期状态机
+
+    Args:
+        name: 模型名称，用于日志与用例 id
+        initial: 新建对象的初始状态
+        states: {状态: {"operations": 可见操作列表, "disabled": 禁用操作列表}}
+        transitions: [(起始状态, 操作, 目标状态), ...]，顺序决定探索时的优先级
+    """
+
+    def __init__(self, name: str, initial: str, states: dict, transitions: list):
+        self.name = name
+        self.initial = initial
+        self.states = states
+        self.transitions = [Transition(*t) for t in transitions]
+        for t in self.transitions:
+            if t.source not in states or t.target not in states:
+                raise ValueError(f"迁移 {t} 引用了未定义的状态")
+        self._outgoing = {state: [] for state in states}
+        for t in self.transitions:
+            self._outgoing[t.source].append(t)
+
+    def operations(self, state: str) -> list[str]:
+        """状态下可见的操作，未知状态返回空列表"""
+        return list(self.states.get(state, {}).get("operations", []))
+
+    def disabled_operations(self, state: str) -> list[str]:
+        """状态下可见但处于禁用状态的操作"""
+        return list(self.states.get(state, {}).get("disabled", []))
+
+    def next_state(self, state: str, action: str) -> str | None:
+        """在 state 下执行 action 后的状态，该操作不引起迁移时返回 None"""
+        for t in self._outgoing.get(state, []):
+            if t.action == action:
+                return t.target
+        return None
+
+    def target_of(self, action: str) -> str:
+        """操作的目标状态（与起始状态无关时），操作未定义或目标不唯一时返回空字符串"""
+        targets = {t.target for t in self.transitions if t.action == action}
+        return targets.pop() if len(targets) == 1 else ""
+
+    def _nearest_uncovered(self, start: str, uncovered: set) -> list[Transition] | None:
+        """从 start 出发到达并执行最近一条未覆盖迁移的路径（广度优先，按迁移定义顺序）"""
+        queue = deque([(start, [])])
+        visited = {start}
+        while queue:
+            state, path = queue.popleft()
+            for t in self._outgoing[state]:
+                if t in uncovered:
+                    return path + [t]
+            for t in self._outgoing[state]:
+                if t.target not in visited:
+                    visited.add(t.target)
+                    queue.append((t.target, path + [t]))
+        return None
+
+    def transition_cover(self, start_states=None) -> list[list[Transition]]:
+        """
+        计算覆盖全部可达迁移的操作序列
+
+        :param start_states: 可直接构造的起始状态，默认只有初始状态
+        :return: 序列列表，每条序列的第一个迁移的 source 即需要准备的起始状态
+        """
+        start_states = list(start_states or [self.initial])
+        uncovered = set(self.transitions)
+        sequences = []
+        while uncovered:
+            # 选择到达未覆盖迁移最近的起始状态，减少前置操作
+            candidates = [(s, self._nearest_uncovered(s, uncovered)) for s in start_states]
+            candidates = [(s, path) for s, path in candidates if path]
+            if not candidates:
+                logger.warning(f"[{self.name}] 以下迁移从起始状态不可达: {', '.join(map(str, uncovered))}")
+                break
+            _, path = min(candidates, key=lambda c: len(c[1]))
+
+            sequence = []
+            while path:
+                sequence.extend(path)
+                uncovered.difference_update(path)
+                path = self._nearest_uncovered(sequence[-1].target, uncovered)
+            sequences.append(sequence)
+        return sequences
+
+    def sequence_id(self, sequence: list[Transition]) -> str:
+        """序列的可读 id，例如 "正常-禁用-恢复" """
+        return "-".join([sequence[0].source] + [t.action for t in sequence])
+
+
+def run_transition_sequence(model: LifecycleModel, sequence: list[Transition], seed, perform, verify):
+    """
+    执行一条迁移序列
+
+    :param model: 生命周期模型
+    :param sequence: transition_cover() 返回的一条序列
+    :param seed: seed(起始状态) -> 上下文，直接准备处于起始状态的对象
+    :param perform: perform(上下文, 迁移) -> bool，执行迁移对应的操作
+    :param verify: verify(上下文, 状态) -> bool，校验对象处于预期状态（含操作集合）
+    """
+    start = sequence[0].source
+    logger.info(f"[{model.name}] 执行迁移序列: {model.sequence_id(sequence)}")
+    context = seed(start)
+    assert verify(context, start), f"[{model.name}] 起始状态不是 {start}"
+    for transition in sequence:
+        assert perform(context, transition), f"[{model.name}] 操作失败: {transition}"
+        assert verify(context, transition.target), f"[{model.name}] 迁移后状态不符: {transition}"
+    return context
+
+
+# 房间状态：新增后为正常，可禁用、恢复、注销，注销为终态
+ROOM_LIFECYCLE = LifecycleModel(
+    name="room",
+    initial="正常",
+    states={
+        "正常": {"operations": ["修改", "禁用", "注销", "详情"]},
+        "禁用": {"operations": ["修改", "恢复", "注销", "详情"]},
+        "注销": {"operations": ["详情"]},
+    },
+    transitions=[
+        ("正常", "禁用", "禁用"),
+        ("禁用", "恢复", "正常"),
+        ("正常", "注销", "注销"),
+        ("禁用", "注销", "注销"),
+    ],
+)
+
+# 民宿备案状态：未提交（无房间时不能提交）-> 待确认 -> 已确认（公安端确认）
+MINSU_NO_ROOM_STATE = "未提交:无房间"
+
+MINSU_LIFECYCLE = LifecycleModel(
+    name="minsu",
+    initial=MINSU_NO_ROOM_STATE,
+    states={
+        MINSU_NO_ROOM_STATE: {"operations": ["备案房间", "提交", "修改", "详情", "删除"], "disabled": ["提交"]},
+        "未提交": {"operations": ["备案房间", "提交", "修改", "详情", "删除"]},
+        "待确认": {"operations": ["详情"]},
+        "已确认": {"operations": ["备案房间", "详情", "删除"]},
+    },
+    transitions=[
+        (MINSU_NO_ROOM_STATE, "备案房间", "未提交"),
+        ("未提交", "提交", "待确认"),
+        ("待确认", "确认", "已确认"),
+    ],
+)
+
+
+def minsu_state(room_number: int, filing_status: str) -> str:
+    """
+    由房间数量与备案状态得到民宿生命周期状态
+
+    Raises:
+        ValueError: 房间数量为负数或与备案状态组合无效时抛出
+    """
+    if room_number < 0:
+        raise ValueError(f"房间数量不能为负数: {room_number}")
+    if room_number == 0:
+        if filing_status != "未提交":
+            raise ValueError(f"房间数量为0时，备案状态必须为'未提交'，实际为'{filing_status}'")
+        return MINSU_NO_ROOM_STATE
+    if filing_status not in ("待确认", "已确认", "未提交"):
+        raise ValueError(
+            f"房间数量大于0时，备案状态必须为'待确认'、'已确认'或'未提交'，实际为'{filing_status}'"
+        )
+    return filing_status
@@ -0,0 +1,365 @@
+"""
+预热页面池
+
+表单校验类用例大多只在同一个表单上反复填写、提交、读错误提示，但每个用例都要新建 context、
+新建 page、加载 SPA 并渲染路由。页面池在每个进程内保留若干已打开目标页面的 page，
+用例借出时先恢复到干净状态，用完归还：
+
+    pool = PagePool(lambda **kw: browser.new_context(**kw))
+    pool.register("fd:注册表单", warm=lambda page: RegisterPage(page).navigate(fd_base_url))
+    with pool.page("fd:注册表单") as page:
+        ...
+
+    - 容量：池中页面（空闲 + 借出）总数不超过 capacity，满时淘汰最久未用的空闲页面（LRU）
+    - 回收：单个页面复用 max_uses 次后关闭重建，避免长时间运行的 SPA 内存膨胀
+    - 泄漏检测：借出超过 leak_timeout 秒未归还的页面记录告警，close() 返回仍未归还的页面；
+      归还时关闭用例中打开的其他页面（弹窗、新标签页）并计数
+
+归还时清除用例留下的浏览器状态：撤销 page / context 上的路由拦截（例如短信验证码桩），
+cookies 与 localStorage / sessionStorage 恢复为页面预热完成时的快照（保留登录态）。
+借出时再恢复表单：默认先尝试重置页面上的 Element UI 表单（resetFields，清空输入与校验提示），
+失败时重新执行 warm。上传列表等不属于表单字段的状态需要在 register 时提供 reset。
+
+网络拦截、HAR 回放等按 context 生效的设置通过 add_context_setup 登记，每次借出时在 reset / warm
+之前作用于页面所在的 context，归还时撤销（见 context_setup）。
+"""
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Page
+
+from conf.config import PAGE_POOL_CAPACITY, PAGE_POOL_LEAK_TIMEOUT, PAGE_POOL_MAX_USES
+from conf.logging_config import logger
+
+_RESET_FORMS_SCRIPT = """
+() => {
+  const forms = Array.from(document.querySelectorAll('.el-form')).map(el => el.__vue__).filter(Boolean);
+  forms.forEach(form => { form.resetFields(); form.clearValidate(); });
+  window.scrollTo(0, 0);
+  return forms.length;
+}
+"""
+
+
+_RESTORE_STORAGE_SCRIPT = """
+(items) => {
+  localStorage.clear();
+  sessionStorage.clear();
+  items.forEach(item => localStorage.setItem(item.name, item.value));
+}
+"""
+
+
+def reset_forms(page: Page) -> bool:
+    """重置页面上的 Element UI 表单，页面上没有可重置的表单时返回 False"""
+    return page.evaluate(_RESET_FORMS_SCRIPT) > 0
+
+
+class PooledPage:
+    """池中的一个页面及其 context"""
+
+    __slots__ = ("route", "context", "page", "baseline", "uses", "last_used", "owner", "checked_out_at",
+                 "teardowns")
+
+    def __init__(self, route: str, context, page: Page, baseline: dict):
+        self.route = route
+        self.context = context
+        self.page = page
+        # 预热完成时的 storage_state，归还时据此恢复 cookies 与 localStorage
+        self.baseline = baseline
+        self.uses = 0
+        self.last_used = time.time()
+        self.owner = None
+        self.checked_out_at = None
+        # 本次借出时 context setup 返回的撤销函数
+        self.teardowns = []
+
+
+class _Route:
+    __slots__ = ("warm", "reset", "context_options")
+
+    def __init__(self, warm, reset, context_options: dict):
+        self.warm = warm
+        self.reset = reset
+        self.context_options = context_options
+
+
+class PagePool:
+    """
+    单进程内的预热页面池，非线程安全（Playwright 同步 API 本身也只能在创建它的线程中使用）
+
+    Args:
+        new_context: 创建 BrowserContext 的函数，接收 new_context() 的关键字参数
+        capacity: 页面总数上限
+        max_uses: 单个页面复用次数上限
+        leak_timeout: 借出超过该秒数未归还视为泄漏
+    """
+
+    def __init__(self, new_context, capacity: int = PAGE_POOL_CAPACITY, max_uses: int = PAGE_POOL_MAX_USES,
+                 leak_timeout: float = PAGE_POOL_LEAK_TIMEOUT):
+        self.new_context = new_context
+        self.capacity = capacity
+        self.max_uses = max_uses
+        self.leak_timeout = leak_timeout
+        self._routes = {}
+        self._context_setups = []
+        # 空闲页面，按最近归还时间排序，最前面的最久未用
+        self._idle: OrderedDict[int, PooledPage] = OrderedDict()
+        self._checked_out: dict[int, PooledPage] = {}
+        self._reported_leaks = set()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "recycled": 0, "reset_failures": 0,
+                      "stray_pages": 0, "leaks": 0}
+
+    def register(self, route: str, warm, reset=None, **context_options):
+        """
+        登记路由
+
+        :param route: 路由名称，例如 "fd:房间备案表单"
+        :param warm: warm(page)，把新页面打开到该路由并等待就绪
+        :param reset: reset(page)，把用过的页面恢复到干净状态；不提供时使用 reset_forms，失败再 warm
+        :param context_options: 创建 context 的参数，例如 storage_state（登录态）
+        """
+        self._routes[route] = _Route(warm, reset, context_options)
+
+    def add_context_setup(self, setup):
+        """
+        登记 context 设置 setup(context)，之后借出的页面在 reset / warm 之前对其 context 执行，
+        setup 返回的可调用对象（可为 None）在页面归还时执行
+        """
+        self._context_setups.append(setup)
+
+    def remove_context_setup(self, setup):
+        if setup in self._context_setups:
+            self._context_setups.remove(setup)
+
+    @property
+    def size(self) -> int:
+        return len(self._idle) + len(self._checked_out)
+
+    # ------------------------------
+    # 借出与归还
+    # ------------------------------
+    def checkout(self, route: str, owner: str = "") -> Page:
+        """借出一个已打开 route 的干净页面，owner 用于泄漏告警中标识借用者（一般为用例 nodeid）"""
+        if route not in self._routes:
+            raise ValueError(f"页面池未登记路由: {route}，可选: {', '.join(self._routes)}")
+        self.check_leaks()
+
+        entry = self._take_idle(route)
+        if entry is not None and not (self._setup_context(entry) and self._reset(entry)):
+            self._close(entry)
+            entry = None
+        if entry is None:
+            entry = self._create(route)
+            self.stats["misses"] += 1
+        else:
+            self.stats["hits"] += 1
+
+        entry.uses += 1
+        entry.owner = owner
+        entry.checked_out_at = time.time()
+        self._checked_out[id(entry.page)] = entry
+        return entry.page
+
+    def checkin(self, page: Page, discard: bool = False):
+        """
+        归还页面
+
+        :param discard: 直接关闭而不放回池中，例如用例失败、页面状态不可信时
+        """
+        entry = self._checked_out.pop(id(page), None)
+        if entry is None:
+            logger.warning("归还的页面不属于页面池或已归还")
+            return
+        self._reported_leaks.discard(id(page))
+        entry.owner = None
+        entry.checked_out_at = None
+        entry.last_used = time.time()
+        self._teardown_context(entry)
+
+        if discard or page.is_closed() or entry.uses >= self.max_uses:
+            if entry.uses >= self.max_uses:
+                self.stats["recycled"] += 1
+            self._close(entry)
+            return
+        # 用例中打开的弹窗、新标签页不随页面复用
+        for other in entry.context.pages:
+            if other is not page:
+                self.stats["stray_pages"] += 1
+                other.close()
+        if not self._clear_state(entry):
+            self._close(entry)
+            return
+        self._idle[id(page)] = entry
+
+    @contextmanager
+    def page(self, route: str, owner: str = ""):
+        """借出页面的上下文管理器，发生异常时页面不放回池中"""
+        page = self.checkout(route, owner)
+        try:
+            yield page
+        except BaseException:
+            self.checkin(page, discard=True)
+            raise
+        self.checkin(page)
+
+    # ------------------------------
+    # 泄漏检测与关闭
+    # ------------------------------
+    def check_leaks(self) -> list[PooledPage]:
+        """返回借出超时的页面，每个页面只告警一次"""
+        now = time.time()
+        leaked = [e for e in self._checked_out.values() if now - e.checked_out_at > self.leak_timeout]
+        for entry in leaked:
+            if id(entry.page) not in self._reported_leaks:
+                self._reported_leaks.add(id(entry.page))
+                self.stats["leaks"] += 1
+                logger.warning(f"页面池页面借出 {now - entry.checked_out_at:.0f}s 未归还: "
+                               f"{entry.route}，借用者 {entry.owner or '未知'}")
+        return leaked
+
+    def close(self) -> list[tuple[str, str]]:
+        """关闭全部页面，返回关闭时仍未归还的 (路由, 借用者)"""
+        leaked = [(e.route, e.owner) for e in self._checked_out.values()]
+        self.stats["leaks"] += sum(1 for key in self._checked_out if key not in self._reported_leaks)
+        for entry in list(self._idle.values()) + list(self._checked_out.values()):
+            self._close(entry)
+        self._idle.clear()
+        self._checked_out.clear()
+        return leaked
+
+    # ------------------------------
+    # 内部实现
+    # ------------------------------
+    def _take_idle(self, route: str) -> PooledPage | None:
+        # 同一路由优先取最近归还的页面
+        for key in reversed(list(self._idle)):
+            entry = self._idle[key]
+            if entry.route == route:
+                del self._idle[key]
+                if entry.page.is_closed():
+                    self._close(entry)
+                    continue
+                return entry
+        return None
+
+    def _clear_state(self, entry: PooledPage) -> bool:
+        """撤销路由拦截，cookies 与 localStorage / sessionStorage 恢复到预热完成时的快照"""
+        try:
+            entry.page.unroute_all(behavior="ignoreErrors")
+            entry.context.unroute_all(behavior="ignoreErrors")
+            entry.context.clear_cookies()
+            if entry.baseline["cookies"]:
+                entry.context.add_cookies(entry.baseline["cookies"])
+            parts = urlsplit(entry.page.url)
+            if parts.scheme in ("http", "https"):
+                origin = f"{parts.scheme}://{parts.netloc}"
+                items = next((o["localStorage"] for o in entry.baseline["origins"] if o["origin"] == origin), [])
+                entry.page.evaluate(_RESTORE_STORAGE_SCRIPT, items)
+            return True
+        except Exception as e:
+            self.stats["reset_failures"] += 1
+            logger.warning(f"页面池清理 {entry.route} 的浏览器状态失败，关闭页面: {e}")
+            return False
+
+    def _setup_context(self, entry: PooledPage) -> bool:
+        try:
+            entry.teardowns = [setup(entry.context) for setup in self._context_setups]
+            return True
+        except Exception as e:
+            self.stats["reset_failures"] += 1
+            logger.warning(f"页面池设置 {entry.route} 的 context 失败，重建页面: {e}")
+            return False
+
+    @staticmethod
+    def _teardown_context(entry: PooledPage):
+        for teardown in reversed(entry.teardowns):
+            if teardown is None:
+                continue
+            try:
+                teardown()
+            except Exception as e:
+                logger.warning(f"页面池撤销 {entry.route} 的 context 设置失败: {e}")
+        entry.teardowns = []
+
+    def _reset(self, entry: PooledPage) -> bool:
+        route = self._routes[entry.route]
+        try:
+            if route.reset is not None:
+                route.reset(entry.page)
+            elif not reset_forms(entry.page):
+                route.warm(entry.page)
+            return True
+        except Exception as e:
+            self.stats["reset_failures"] += 1
+            logger.warning(f"页面池重置 {entry.route} 失败，重建页面: {e}")
+            return False
+
+    def _create(self, route: str) -> PooledPage:
+        while self.size >= self.capacity:
+            if not self._idle:
+                owners = ", ".join(f"{e.route}({e.owner or '未知'})" for e in self._checked_out.values())
+                raise RuntimeError(f"页面池已满（{self.capacity}），全部页面均已借出: {owners}")
+            _, lru = self._idle.popitem(last=False)
+            self.stats["evictions"] += 1
+            self._close(lru)
+
+        spec = self._routes[route]
+        context = self.new_context(**spec.context_options)
+        teardowns = []
+        try:
+            for setup in self._context_setups:
+                teardowns.append(setup(context))
+            page = context.new_page()
+            spec.warm(page)
+            baseline = context.storage_state()
+        except BaseException:
+            context.close()
+            raise
+        entry = PooledPage(route, context, page, baseline)
+        entry.teardowns = teardowns
+        return entry
+
+    @staticmethod
+    def _close(entry: PooledPage):
+        try:
+            entry.context.close()
+        except Exception:
+            # 浏览器连接已断开时 context 随之失效
+            pass
+
+
+@contextmanager
+def context_setup(request, setup):
+    """
+    让按 context 生效的插件同时作用于 page fixture 与页面池
+
+    用例使用 page fixture 时立即对其 context 执行 setup(context)；使用 pooled_page 时登记到页面池，
+    对本用例借出的每个页面生效。退出时执行 setup 返回的撤销函数或取消登记。
+    """
+    if "page" in request.fixturenames:
+        teardown = setup(request.getfixturevalue("page").context)
+        try:
+            yield
+        finally:
+            if teardown is not None:
+                try:
+                    teardown()
+                except Exception:
+                    # context 可能已随 page fixture 一起关闭
+                    pass
+        return
+
+    pool = request.getfixturevalue("page_pool")
+    pool.add_context_setup(setup)
+    try:
+        yield
+    finally:
+        pool.remove_context_setup(setup)
+
+
+def uses_browser_page(request) -> bool:
+    """用例是否使用 page fixture 或页面池"""
+    return "page" in request.fixturenames or "pooled_page" in request.fixturenames
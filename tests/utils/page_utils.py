@@ -1,9 +1,9 @@
 # base page operations
+import re
 import time
 from typing import Union, List
-from faker import Faker
 from typing import Optional, List
-from playwright.async_api import Page, Locator
+from playwright.sync_api import Page, Locator
 from conf.logging_config import logger
 from tests.utils.validator import *
 
@@ -384,6 +384,53 @@ def get_element_corresponding_error_tip(target_element: Locator, xpath: str, exp
         logger.error(f"错误提示信息时出错: {ae}")
         raise
 
+# 一次DOM遍历收集表单内所有 .el-form-item__error：
+# 每条错误归属到最近一个带 .el-form-item__label 的表单项（label），
+# 嵌套在该表单项内的子表单项（如"房间户型"下的4个数量框）用 slot 区分先后位置
+_HARVEST_FORM_ERRORS_JS = """
+(root) => {
+    const scope = root || document;
+    const ownLabel = (item) => item.querySelector(':scope > .el-form-item__label');
+    const results = [];
+    scope.querySelectorAll('.el-form-item__error').forEach((err) => {
+        const item = err.closest('.el-form-item');
+        if (!item) {
+            return;
+        }
+        let owner = item;
+        while (owner && !ownLabel(owner)) {
+            owner = owner.parentElement ? owner.parentElement.closest('.el-form-item') : null;
+        }
+        let slot = 0;
+        if (owner && owner !== item) {
+            slot = Array.from(owner.querySelectorAll('.el-form-item')).indexOf(item);
+        }
+        results.push({
+            label: owner ? ownLabel(owner).textContent.trim() : '',
+            slot: slot,
+            text: err.textContent.trim(),
+        });
+    });
+    return results;
+}
+"""
+
+def harvest_form_errors(page: Page, form_selector: str = "form.el-form") -> list[dict]:
+    """
+    一次性收集表单中当前显示的所有字段错误提示（单次 evaluate，不逐个字段定位）
+
+    :param page: Playwright的Page对象
+    :param form_selector: 表单容器选择器，找不到时退化为整个页面
+    :return: 错误列表，每项为 {"label": 标签文本, "slot": 标签内位置, "text": 错误文本}
+    """
+    form = page.locator(form_selector).first
+    if form.count() > 0:
+        errors = form.evaluate(_HARVEST_FORM_ERRORS_JS)
+    else:
+        errors = page.evaluate(_HARVEST_FORM_ERRORS_JS, None)
+    logger.info(f"共收集到 {len(errors)} 条表单错误提示")
+    return errors
+
 
 def wait_dialog_with_expected_message(page: Page, expected_message: str = "") -> Locator:
     """
@@ -1336,254 +1383,215 @@ def check_label_corresponding_input_value(
        logger.error(f"❌ Failed to verify input value for label '{label_text}': {str(e)}")
        raise
 
-def query_target_name_tr(page, target_part:str, target_part_name: str):
+def set_max_page_size(page: Page, timeout: int = 5000) -> bool:
     """
-    根据楼宇名称查询，优化按钮定位逻辑，确保正确识别"自定义查询"按钮
-    采用严格的文字完全匹配策略，允许tbody为None的情况
+    将 el-pagination 的每页条数切换为下拉选项中的最大值，减少翻页次数
+
+    返回:
+        已切换或已是最大值返回 True；页面没有每页条数选择器时返回 False
     """
-    try:
-        # 1. 优化按钮定位逻辑：使用更可靠的策略查找"自定义查询"按钮
-        time.sleep(1)
-        custom_query_btn = page.get_by_role("button", name="自定义查询", exact=True)
+    sizes_input = page.locator('.el-pagination .el-pagination__sizes input')
+    if sizes_input.count() == 0:
+        return False
+    sizes_input.first.click()
+    options = page.locator('.el-select-dropdown:visible .el-select-dropdown__item')
+    options.first.wait_for(state="visible", timeout=timeout)
+    # 选项文本形如 "100条/页"，按数值取最大而不依赖选项顺序
+    sizes = [int(re.search(r'\d+', text).group()) for text in options.all_text_contents()]
+    largest = options.nth(sizes.index(max(sizes)))
+    if "selected" in (largest.get_attribute("class") or ""):
+        page.keyboard.press("Escape")
+        return True
+    largest.click()
+    page.wait_for_load_state("networkidle", timeout=30000)
+    logger.info(f"每页条数已切换为 {max(sizes)}")
+    return True
 
-        # 检查按钮是否存在
-        btn_exists = custom_query_btn.count() > 0
-        used_locator = ""
 
-        if btn_exists:
-            custom_query_btn.click()
-            used_locator = "get_by_role(button, name='自定义查询')"
-        else:
-            # 检查"收起查询"按钮
-            collapse_query_btn = page.get_by_role("button", name="收起查询", exact=True)
-            collapse_query_btn_alt = page.locator(f"button:has-text('收起查询')")
-            collapse_exists = collapse_query_btn.count() > 0 or collapse_query_btn_alt.count() > 0
-
-            if not collapse_exists:
-                # 输出页面中所有按钮文本用于调试
-                all_buttons = page.locator("button")
-                btn_count = all_buttons.count()
-                btn_texts = []
-                for i in range(btn_count):
-                    text = all_buttons.nth(i).text_content().strip()
-                    if text:
-                        btn_texts.append(text)
-                logger.debug(f"页面中所有按钮文本：{', '.join(btn_texts)}")
+def _goto_next_table_page(page: Page, timeout: int = 5000) -> bool:
+    """点击 el-pagination 的下一页并等待页码切换，已是最后一页或没有分页时返回 False"""
+    next_button = page.locator('.el-pagination button.btn-next')
+    if next_button.count() == 0 or next_button.first.is_disabled():
+        return False
+    active = page.locator('.el-pagination .el-pager li.number.active')
+    current = int(active.first.text_content().strip()) if active.count() > 0 else None
+    next_button.first.click()
+    if current is not None:
+        page.locator(f'.el-pagination .el-pager li.number.active:text-is("{current + 1}")').wait_for(timeout=timeout)
+    page.wait_for_load_state("networkidle", timeout=30000)
+    return True
 
-        time.sleep(1)
-        # 清除输入框并填入查询关键词
-        target_query_input = page.locator(f'//input[@placeholder="请输入{target_part}名称"]')
-        target_query_button = page.get_by_role("button", name="搜索")
-        target_query_input.fill("")
-        target_query_input.fill(target_part_name)
-        target_query_button.click()
-        logger.info(f" 已执行{target_part}查询，查询关键词：{target_part_name}（完全匹配模式）")
-
-        # 等待搜索结果加载完成
-        logger.info("等待搜索结果加载...")
-        page.wait_for_load_state("networkidle", timeout=30000)
+
+def _goto_first_table_page(page: Page, timeout: int = 5000):
+    """回到 el-pagination 的第一页，已在第一页或没有分页时不操作"""
+    first = page.locator('.el-pagination .el-pager li.number').first
+    if first.count() == 0 or "active" in (first.get_attribute("class") or ""):
+        return
+    first.click()
+    page.locator('.el-pagination .el-pager li.number.active:text-is("1")').wait_for(timeout=timeout)
+    page.wait_for_load_state("networkidle", timeout=30000)
+
+
+def iter_table_rows(page: Page, max_page_size: bool = False, timeout: int = 5000):
+    """
+    逐行产出 el-table 的数据行，当前页的行被取完后才翻到下一页
+
+    调用方找到目标后停止迭代即不再翻页，表格停留在目标所在的页，
+    产出的行号可以直接用于 get_table_cell_or_button 等按当前页定位的函数。
+
+    参数:
+        page: 页面对象
+        max_page_size: 遍历前先把每页条数切换为最大值
+        timeout: 等待表格与页码切换的超时时间（毫秒）
+
+    产出:
+        (页码, 当前页内的行号（从1开始）, 行元素)；表格显示"暂无数据"时不产出任何行
+    """
+    if max_page_size:
+        set_max_page_size(page, timeout)
+    page_number = 1
+    while True:
         empty_block = page.locator('//div[@class="el-table__empty-block"]')
-        # 检查无数据提示块是否存在且可见（避免隐藏元素干扰判断）
         if empty_block.count() > 0 and empty_block.is_visible():
-            logger.info(f" 未找到任何 tr 元素（查询关键词：{target_part_name}，页面显示'暂无数据'）")
-            return None
-
-        # 3. 若无无数据提示，再执行原有tbody及tr元素的查询逻辑
+            return
         tbody = page.locator('//tbody')
-
-        # 检查tbody是否存在
         if tbody.count() == 0:
-            logger.info(f" 未找到tbody元素（查询关键词：{target_part_name}）")
-            return None
-
-        # 等待tbody可见（确保DOM已加载完成）
+            logger.info("未找到表格tbody元素")
+            return
         try:
-            tbody.wait_for(state="visible", timeout=5000)  # 5秒超时避免无限等待
+            tbody.wait_for(state="visible", timeout=timeout)
         except Exception as e:
-            logger.warning(f" tbody存在但不可见：{str(e)}")
-            return None
+            logger.warning(f"tbody存在但不可见：{str(e)}")
+            return
 
         tr_elements = tbody.locator('tr')
-        tr_count = tr_elements.count()
-
-        if tr_count == 0:
-            logger.info(f" tbody 下未找到任何 tr 元素（查询关键词：{target_part_name}）")
-            return None
-        logger.info(f" tbody 下共找到 {tr_count} 个 tr 元素，开始精确匹配{target_part}名称")
+        for i in range(tr_elements.count()):
+            yield page_number, i + 1, tr_elements.nth(i)
 
-        # 4. 精确匹配目标名称（完全匹配td:nth-child(2)下的div内容）
-        matched_tr = None
-        target_name = target_part_name.strip()  # 去除关键词前后空格，避免空格干扰匹配
+        if not _goto_next_table_page(page, timeout):
+            return
+        page_number += 1
+        logger.info(f"已翻到表格第 {page_number} 页")
 
-        for i in range(tr_count):
-            current_tr = tr_elements.nth(i)
-            # 定位目标列（第2列的div元素，与原逻辑保持一致）
-            target_div = current_tr.locator('td:nth-child(2) > div')
-            try:
-                target_div.wait_for(state="visible", timeout=2000)  # 等待当前行内容可见
-            except Exception:
-                logger.warning(f" 第 {i + 1} 个tr的目标div不可见，跳过检查")
-                continue
 
-            div_content = target_div.text_content().strip()  # 去除内容前后空格
+def _query_target_row(page, target_part: str, target_part_name: str, max_page_size: bool = False):
+    """
+    query_target_name_tr / query_target_name_index 共用的搜索与完全匹配逻辑
 
-            # 严格完全匹配（区分大小写、无额外字符）
-            if div_content == target_name:
-                matched_tr = current_tr
-                logger.info(f" 找到完全匹配的 tr 元素（第 {i + 1} 个，内容：{div_content}）")
-                break
+    返回:
+        (当前页内的行号, 行元素)，未找到返回 None
+    """
+    # 1. 展开"自定义查询"（已展开时页面上显示的是"收起查询"）
+    time.sleep(1)
+    custom_query_btn = page.get_by_role("button", name="自定义查询", exact=True)
+    if custom_query_btn.count() > 0:
+        custom_query_btn.click()
+    else:
+        collapse_query_btn = page.get_by_role("button", name="收起查询", exact=True)
+        collapse_query_btn_alt = page.locator(f"button:has-text('收起查询')")
+        if collapse_query_btn.count() == 0 and collapse_query_btn_alt.count() == 0:
+            # 输出页面中所有按钮文本用于调试
+            btn_texts = [text.strip() for text in page.locator("button").all_text_contents() if text.strip()]
+            logger.debug(f"页面中所有按钮文本：{', '.join(btn_texts)}")
+
+    time.sleep(1)
+    # 2. 清除输入框并填入查询关键词
+    target_query_input = page.locator(f'//input[@placeholder="请输入{target_part}名称"]')
+    target_query_button = page.get_by_role("button", name="搜索")
+    target_query_input.fill("")
+    target_query_input.fill(target_part_name)
+    target_query_button.click()
+    logger.info(f" 已执行{target_part}查询，查询关键词：{target_part_name}（完全匹配模式）")
+
+    logger.info("等待搜索结果加载...")
+    page.wait_for_load_state("networkidle", timeout=30000)
+
+    # 3. 逐页精确匹配目标名称（完全匹配td:nth-child(2)下的div内容），找到后不再翻页
+    target_name = target_part_name.strip()  # 去除关键词前后空格，避免空格干扰匹配
+    all_td2_contents = []
+    for page_number, row_number, current_tr in iter_table_rows(page, max_page_size):
+        target_div = current_tr.locator('td:nth-child(2) > div')
+        try:
+            target_div.wait_for(state="visible", timeout=2000)  # 等待当前行内容可见
+        except Exception:
+            logger.warning(f" 第 {page_number} 页第 {row_number} 个tr的目标div不可见，跳过检查")
+            continue
 
-        if matched_tr:
+        div_content = target_div.text_content().strip()
+        # 严格完全匹配（区分大小写、无额外字符）
+        if div_content == target_name:
+            logger.info(f" 找到完全匹配的 tr 元素（第 {page_number} 页第 {row_number} 个，内容：{div_content}）")
             time.sleep(2)  # 预留加载时间（可根据页面响应速度调整）
-            return matched_tr
-        else:
-            logger.info(f" 未找到与 {target_name} 完全匹配的元素")
-            # 收集所有结果用于调试（定位匹配失败原因）
-            all_td2_contents = []
-            for i in range(tr_count):
-                content = tr_elements.nth(i).locator('td:nth-child(2) > div').text_content().strip()
-                all_td2_contents.append(f"第 {i + 1} 个：{content}")
-            logger.debug(f"所有 tr 的 td[2] 内容：{', '.join(all_td2_contents)}")
-            return None
+            return row_number, current_tr
+        all_td2_contents.append(f"第 {page_number} 页第 {row_number} 个：{div_content}")
+
+    if all_td2_contents:
+        logger.info(f" 未找到与 {target_name} 完全匹配的元素")
+        logger.debug(f"所有 tr 的 td[2] 内容：{', '.join(all_td2_contents)}")
+    else:
+        logger.info(f" 未找到任何 tr 元素（查询关键词：{target_part_name}）")
+    return None
+
 
+def query_target_name_tr(page, target_part: str, target_part_name: str, max_page_size: bool = False):
+    """
+    根据名称查询，采用严格的文字完全匹配策略，允许tbody为None的情况
+    结果有多页时逐页查找，找到后停留在匹配行所在的页
+
+    参数:
+        max_page_size: 查找前先把每页条数切换为最大值
+
+    返回:
+        匹配的行元素，未找到返回None
+    """
+    try:
+        matched = _query_target_row(page, target_part, target_part_name, max_page_size)
+        return matched[1] if matched else None
     except Exception as e:
         # 捕获全局异常，记录详细堆栈信息（便于排查复杂问题）
         logger.error(f" 查询{target_part} {target_part_name} 时发生异常：{str(e)}", exc_info=True)
         return None
 
-def query_target_name_index(page, target_part:str, target_part_name: str):
-    """
-    根据楼宇名称查询，优化按钮定位逻辑，确保正确识别"自定义查询"按钮
-    采用严格的文字完全匹配策略，允许tbody为None的情况
-    查找成功时返回匹配行的位置（从1开始计数），失败返回None
+def query_target_name_index(page, target_part: str, target_part_name: str, max_page_size: bool = False):
     """
-    try:
-        # 1. 优化按钮定位逻辑：使用更可靠的策略查找"自定义查询"按钮
-        time.sleep(1)
-        custom_query_btn = page.get_by_role("button", name="自定义查询", exact=True)
+    根据名称查询，采用严格的文字完全匹配策略，允许tbody为None的情况
+    结果有多页时逐页查找，找到后停留在匹配行所在的页
 
-        # 检查按钮是否存在
-        btn_exists = custom_query_btn.count() > 0
-
-        if btn_exists:
-            custom_query_btn.click()
-            used_locator = "get_by_role(button, name='自定义查询')"
-        else:
-            # 检查"收起查询"按钮
-            collapse_query_btn = page.get_by_role("button", name="收起查询", exact=True)
-            collapse_query_btn_alt = page.locator(f"button:has-text('收起查询')")
-            collapse_exists = collapse_query_btn.count() > 0 or collapse_query_btn_alt.count() > 0
-
-            if not collapse_exists:
-                # 输出页面中所有按钮文本用于调试
-                all_buttons = page.locator("button")
-                btn_count = all_buttons.count()
-                btn_texts = []
-                for i in range(btn_count):
-                    text = all_buttons.nth(i).text_content().strip()
-                    if text:
-                        btn_texts.append(text)
-                logger.debug(f"页面中所有按钮文本：{', '.join(btn_texts)}")
-
-        time.sleep(1)
-        # 清除输入框并填入查询关键词
-        target_query_input = page.locator(f'//input[@placeholder="请输入{target_part}名称"]')
-        target_query_button = page.get_by_role("button", name="搜索")
-        target_query_input.fill("")
-        target_query_input.fill(target_part_name)
-        target_query_button.click()
-        logger.info(f" 已执行{target_part}查询，查询关键词：{target_part_name}（完全匹配模式）")
-
-        # 等待搜索结果加载完成
-        logger.info("等待搜索结果加载...")
-        page.wait_for_load_state("networkidle", timeout=30000)
-        empty_block = page.locator('//div[@class="el-table__empty-block"]')
-        # 检查无数据提示块是否存在且可见（避免隐藏元素干扰判断）
-        if empty_block.count() > 0 and empty_block.is_visible():
-            logger.info(f" 未找到任何 tr 元素（查询关键词：{target_part_name}，页面显示'暂无数据'）")
-            return None
-
-        # 3. 若无无数据提示，再执行原有tbody及tr元素的查询逻辑
-        tbody = page.locator('//tbody')
-
-        # 检查tbody是否存在
-        if tbody.count() == 0:
-            logger.info(f" 未找到tbody元素（查询关键词：{target_part_name}）")
-            return None
-
-        # 等待tbody可见（确保DOM已加载完成）
-        try:
-            tbody.wait_for(state="visible", timeout=5000)  # 5秒超时避免无限等待
-        except Exception as e:
-            logger.warning(f" tbody存在但不可见：{str(e)}")
-            return None
-
-        tr_elements = tbody.locator('tr')
-        tr_count = tr_elements.count()
-
-        if tr_count == 0:
-            logger.info(f" tbody 下未找到任何 tr 元素（查询关键词：{target_part_name}）")
-            return None
-        logger.info(f" tbody 下共找到 {tr_count} 个 tr 元素，开始精确匹配{target_part}名称")
-
-        # 4. 精确匹配目标名称（完全匹配td:nth-child(2)下的div内容）
-        matched_row = None  # 记录匹配到的行号（从1开始）
-        target_name = target_part_name.strip()  # 去除关键词前后空格，避免空格干扰匹配
-
-        for i in range(tr_count):
-            current_tr = tr_elements.nth(i)
-            # 定位目标列（第2列的div元素，与原逻辑保持一致）
-            target_div = current_tr.locator('td:nth-child(2) > div')
-            try:
-                target_div.wait_for(state="visible", timeout=2000)  # 等待当前行内容可见
-            except Exception:
-                logger.warning(f" 第 {i + 1} 个tr的目标div不可见，跳过检查")
-                continue
-
-            div_content = target_div.text_content().strip()  # 去除内容前后空格
-
-            # 严格完全匹配（区分大小写、无额外字符）
-            if div_content == target_name:
-                matched_row = i + 1  # 行号从1开始计数
-                logger.info(f" 找到完全匹配的 tr 元素（第 {matched_row} 个，内容：{div_content}）")
-                break
-
-        if matched_row:
-            time.sleep(2)  # 预留加载时间（可根据页面响应速度调整）
-            return matched_row  # 返回匹配到的行号
-        else:
-            logger.info(f" 未找到与 {target_name} 完全匹配的元素")
-            # 收集所有结果用于调试（定位匹配失败原因）
-            all_td2_contents = []
-            for i in range(tr_count):
-                content = tr_elements.nth(i).locator('td:nth-child(2) > div').text_content().strip()
-                all_td2_contents.append(f"第 {i + 1} 个：{content}")
-            logger.debug(f"所有 tr 的 td[2] 内容：{', '.join(all_td2_contents)}")
-            return None
+    参数:
+        max_page_size: 查找前先把每页条数切换为最大值
 
+    返回:
+        匹配行在当前页中的位置（从1开始计数），未找到返回None
+    """
+    try:
+        matched = _query_target_row(page, target_part, target_part_name, max_page_size)
+        return matched[0] if matched else None
     except Exception as e:
         # 捕获全局异常，记录详细堆栈信息（便于排查复杂问题）
         logger.error(f" 查询{target_part} {target_part_name} 时发生异常：{str(e)}", exc_info=True)
         return None
 
 def batch_target_operation(page, operation_index: int, operation: str,
-                           confirm_text: Union[str, List[str]], cancel_text: Union[str, List[str]], sure_operation):
+                           confirm_text: Union[str, List[str]], cancel_text: Union[str, List[str]], sure_operation,
+                           max_page_size: bool = False):
     """
     对表格中的所有行执行批量操作，无需搜索功能
-    遍历表格所有行并点击指定位置的操作按钮
+    每次操作后回到第一页，逐页查找第一个尚未处理的行并点击指定位置的操作按钮，
+    操作删除行或改变排序时也不会漏行、重复处理
     只有当成功操作数量等于表格总行数时，才判定为整体成功
 
     参数:
         page: 页面对象
         operation_index: 操作按钮所在的列索引（整型，从1开始计数）
         operation: 要执行的操作名称（按钮上的文本）
+        max_page_size: 遍历前先把每页条数切换为最大值
 
     返回:
         操作结果字典，包含：
         - overall_success: 布尔值，表示整体操作是否成功（成功数量等于总行数）
         - success_count: 成功操作的行数
         - fail_count: 失败操作的行数
-        - total_rows: 表格总行数
+        - total_rows: 处理过的行数（所有页，按第二列名称去重）
         - fail_details: 失败详情列表
     """
 
@@ -1606,48 +1614,29 @@ def batch_target_operation(page, operation_index: int, operation: str,
             logger.info("表格显示'暂无数据'，无法执行批量操作")
             return result
 
-        # 定位表格主体
-        tbody = page.locator('//tbody')
-
-        # 检查tbody是否存在
-        if tbody.count() == 0:
-            logger.info("未找到表格tbody元素，无法执行批量操作")
-            return result
-
-        # 等待tbody可见
-        try:
-            tbody.wait_for(state="visible", timeout=5000)
-        except Exception as e:
-            logger.warning(f"tbody存在但不可见：{str(e)}")
-            return result
-
-        # 获取所有行元素
-        tr_elements = tbody.locator('tr')
-        tr_count = tr_elements.count()
-        result["total_rows"] = tr_count  # 记录总行数
-
-        if tr_count == 0:
-            logger.info("表格中没有找到任何行元素，无需执行批量操作")
-            # 没有行需要操作时视为成功
-            result["overall_success"] = True
-            return result
-
-        logger.info(f"开始对表格中的 {tr_count} 行执行批量操作：{operation}")
+        logger.info(f"开始对表格中的所有行执行批量操作：{operation}")
+
+        # 操作可能删除行或改变排序，已翻过的页和后续页的行都会移动：
+        # 每次操作后回到第一页重新查找第一个尚未处理的行（按第二列名称识别）
+        handled = set()
+        if max_page_size:
+            set_max_page_size(page)
+        while True:
+            target = None
+            for page_number, row_index, current_tr in iter_table_rows(page):
+                name = current_tr.locator('td:nth-child(2) > div.cell').text_content().strip()
+                if name not in handled:
+                    target = (page_number, row_index, current_tr, name)
+                    break
+            if target is None:
+                break
 
-        # 遍历所有行并执行操作
-        for i in range(tr_count):
-            page.wait_for_load_state()
-            # 每次循环都重新获取行元素，避免DOM变化导致定位失效
-            current_tr = tbody.locator(f'tr:nth-child({i + 1})')
-            row_index = i + 1  # 行号从1开始
+            page_number, row_index, current_tr, room_name = target
+            row_identifier = room_name or f"第{page_number}页第{row_index}行"
+            handled.add(room_name)
+            result["total_rows"] += 1
 
             try:
-                # 获取当前行标识（第二列内容）用于日志记录和提示信息
-                row_identifier_locator = current_tr.locator('td:nth-child(2) > div.cell')
-                row_identifier = row_identifier_locator.text_content().strip() or f"第{row_index}行"
-                # 获取房间名称（第二列内容）
-                room_name = row_identifier  # 从表格结构看，第二列就是房间名称
-
                 logger.info(f"处理行: {row_identifier}")
 
                 # 定位操作按钮
@@ -1677,16 +1666,19 @@ def batch_target_operation(page, operation_index: int, operation: str,
                 result["success_count"] += 1
 
             except Exception as e:
-                # 记录失败信息
+                # 记录失败信息，继续处理下一行
                 fail_msg = f"{row_identifier} 的'{operation}'操作失败: {str(e)}"
                 logger.error(fail_msg)
                 logger.debug(f"行HTML: {current_tr.inner_html()}")
-
                 result["fail_count"] += 1
                 result["fail_details"].append(fail_msg)
 
-                # 失败后继续处理下一行
-                continue
+            page.wait_for_load_state()
+            _goto_first_table_page(page)
+
+        if result["total_rows"] == 0:
+            # 没有行需要操作时视为成功
+            logger.info("表格中没有找到任何行元素，无需执行批量操作")
 
         # 判定整体成功：成功数量等于总行数
         result["overall_success"] = (result["success_count"] == result["total_rows"])
@@ -1704,16 +1696,17 @@ def batch_target_operation(page, operation_index: int, operation: str,
         return result
 
 
-def check_table_column(page, target_column: int, target_value: str):
+def check_table_column(page, target_column: int, target_value: str, max_page_size: bool = False):
     """
-    遍历表格的指定列，检查是否存在目标值
-    采用严格的文字完全匹配策略，找到匹配项后立即返回，不再继续遍历
+    逐页遍历表格的指定列，检查是否存在目标值
+    采用严格的文字完全匹配策略，找到匹配项后立即返回，不再继续遍历和翻页
     允许tbody为None的情况
 
     参数:
         page: 页面对象
         target_column: 目标列索引（从1开始）
         target_value: 要查找的目标值
+        max_page_size: 查找前先把每页条数切换为最大值
 
     返回:
         找到的匹配行元素，如果未找到则返回None
@@ -1723,72 +1716,35 @@ def check_table_column(page, target_column: int, target_value: str):
         logger.info("等待页面加载完成...")
         page.wait_for_load_state("networkidle", timeout=30000)
 
-        # 检查无数据提示
-        empty_block = page.locator('//div[@class="el-table__empty-block"]')
-        if empty_block.count() > 0 and empty_block.is_visible():
-            logger.info(f"表格显示'暂无数据'，无法查找目标值：{target_value}")
-            return None
-
-        # 定位表格主体
-        tbody = page.locator('//tbody')
-
-        # 检查tbody是否存在
-        if tbody.count() == 0:
-            logger.info("未找到表格tbody元素")
-            return None
-
-        # 等待tbody可见
-        try:
-            tbody.wait_for(state="visible", timeout=5000)
-        except Exception as e:
-            logger.warning(f"tbody存在但不可见：{str(e)}")
-            return None
-
-        # 获取所有行元素
-        tr_elements = tbody.locator('tr')
-        tr_count = tr_elements.count()
-
-        if tr_count == 0:
-            logger.info("表格中没有找到任何行元素")
-            return None
-
-        logger.info(f"表格中共有 {tr_count} 行数据，开始检查第 {target_column} 列是否存在目标值：{target_value}")
-
-        # 遍历行，检查目标列
-        matched_tr = None
+        logger.info(f"开始检查表格第 {target_column} 列是否存在目标值：{target_value}")
         target_value_clean = target_value.strip()
+        all_contents = []
 
-        for i in range(tr_count):
-            current_tr = tr_elements.nth(i)
+        for page_number, row_number, current_tr in iter_table_rows(page, max_page_size):
             # 定位目标列的div元素
             target_div = current_tr.locator(f'td:nth-child({target_column}) > div')
 
             try:
                 target_div.wait_for(state="visible", timeout=2000)
             except Exception:
-                logger.warning(f"第 {i + 1} 行的目标列不可见，跳过检查")
+                logger.warning(f"第 {page_number} 页第 {row_number} 行的目标列不可见，跳过检查")
                 continue
 
             # 获取单元格内容并清理
             cell_content = target_div.text_content().strip()
 
-            # 严格完全匹配，找到后立即返回
+            # 严格完全匹配，找到后立即返回，不再继续检查后续行
             if cell_content == target_value_clean:
-                matched_tr = current_tr
-                logger.info(f"找到完全匹配的行（第 {i + 1} 行，内容：{cell_content}）")
-                # 找到匹配项后立即跳出循环，不再继续检查后续行
-                break
+                logger.info(f"找到完全匹配的行（第 {page_number} 页第 {row_number} 行，内容：{cell_content}）")
+                return current_tr
+            all_contents.append(f"第 {page_number} 页第 {row_number} 行：{cell_content}")
 
-        if not matched_tr:
+        if all_contents:
             logger.info(f"未找到与 {target_value_clean} 完全匹配的内容")
-            # 收集所有结果用于调试
-            all_contents = []
-            for i in range(tr_count):
-                content = tr_elements.nth(i).locator(f'td:nth-child({target_column}) > div').text_content().strip()
-                all_contents.append(f"第 {i + 1} 行：{content}")
             logger.debug(f"所有行的第 {target_column} 列内容：{', '.join(all_contents)}")
-
-        return matched_tr
+        else:
+            logger.info(f"表格中没有任何数据，无法查找目标值：{target_value}")
+        return None
 
     except Exception as e:
         logger.error(f"检查表格列时发生异常：{str(e)}", exc_info=True)
@@ -1842,6 +1798,15 @@ from playwright.sync_api import Page, TimeoutError
 import logging
 
 
+# 上传图片时的全屏“加载中”遮罩
+UPLOAD_LOADING_MASK_SELECTOR = (
+    '.el-loading-mask.is-fullscreen'  # 全屏遮罩类
+    '[style*="background-color: rgba(0, 0, 0, 0.7)"]'  # 背景色
+    '[style*="z-index: 2001"]'  # 层级
+    ':has(.el-loading-spinner:has-text("正在上传图片，请稍候..."))'  # 包含上传文本
+)
+
+
 def wait_for_loading_disappear(page: Page, timeout: int = 20000) -> bool:
     """
     修复版：同步等待上传加载遮罩消失（适配Element UI全屏遮罩）
@@ -1855,12 +1820,7 @@ def wait_for_loading_disappear(page: Page, timeout: int = 20000) -> bool:
         bool: 遮罩消失返回True，超时/异常返回False
     """
     # 1. 精确定位“加载中”的全屏遮罩（完全匹配你提供的DOM特征）
-    loading_mask = page.locator(
-        '.el-loading-mask.is-fullscreen'  # 全屏遮罩类
-        '[style*="background-color: rgba(0, 0, 0, 0.7)"]'  # 背景色
-        '[style*="z-index: 2001"]'  # 层级
-        ':has(.el-loading-spinner:has-text("正在上传图片，请稍候..."))'  # 包含上传文本
-    )
+    loading_mask = page.locator(UPLOAD_LOADING_MASK_SELECTOR)
 
     try:
         # 2. 先检测“加载中遮罩”是否出现（最多等3秒，避免错过短暂加载态）
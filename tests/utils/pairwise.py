@@ -0,0 +1,126 @@
+"""
+组合覆盖用例生成（pairwise / t-wise）
+
+给定每个字段的取值域，生成一组用例，使任意 t 个字段的任意取值组合至少在一条用例中出现。
+穷举 12 个设施单选 + 产权类型 + 户型数量需要数十万条用例，两两覆盖只需二十条左右。
+
+生成算法为确定性贪心（AETG 思路）：每条新用例从尚未覆盖的第一个组合出发，
+其余字段依次选择能覆盖最多未覆盖组合的取值，平局取取值域中靠前的值。
+相同输入总是得到相同顺序的相同结果，计算结果在进程内缓存。
+
+    domains = {"parking": ["有", "无"], "stove": ["无", "燃气灶", "电磁炉", "其他"], ...}
+    @pytest.mark.parametrize("case", pairwise_params(domains, base=COMMON_ROOM_PARAMS))
+"""
+from functools import lru_cache
+from itertools import combinations, product
+
+import pytest
+
+
+def _freeze(domains: dict) -> tuple:
+    return tuple((name, tuple(values)) for name, values in domains.items())
+
+
+@lru_cache(maxsize=32)
+def _covering_rows(frozen_domains: tuple, strength: int) -> tuple:
+    """返回覆盖数组，每行为各字段取值下标组成的元组，字段顺序与输入一致"""
+    sizes = [len(values) for _, values in frozen_domains]
+    count = len(sizes)
+    if count == 0:
+        return ()
+    strength = min(strength, count)
+
+    # 取值多的字段先确定，贪心效果更好；同样大小保持原顺序
+    order = sorted(range(count), key=lambda i: -sizes[i])
+    groups = list(combinations(range(count), strength))
+    uncovered = {group: set(product(*(range(sizes[i]) for i in group))) for group in groups}
+    # 字段 -> 包含该字段的组合组
+    groups_of = {i: [g for g in groups if i in g] for i in range(count)}
+    remaining = sum(len(v) for v in uncovered.values())
+
+    rows = []
+    while remaining:
+        # 以第一个未覆盖的组合作为新用例的起点，保证每轮至少覆盖一个新组合
+        seed_group = next(g for g in groups if uncovered[g])
+        seed_values = min(uncovered[seed_group])
+        row = [None] * count
+        for i, v in zip(seed_group, seed_values):
+            row[i] = v
+
+        for i in order:
+            if row[i] is not None:
+                continue
+            best_value, best_gain = 0, -1
+            for v in range(sizes[i]):
+                row[i] = v
+                gain = 0
+                for group in groups_of[i]:
+                    if all(row[j] is not None for j in group):
+                        if tuple(row[j] for j in group) in uncovered[group]:
+                            gain += 1
+                if gain > best_gain:
+                    best_value, best_gain = v, gain
+            row[i] = best_value
+
+        for group in groups:
+            combo = tuple(row[j] for j in group)
+            if combo in uncovered[group]:
+                uncovered[group].discard(combo)
+                remaining -= 1
+        rows.append(tuple(row))
+    return tuple(rows)
+
+
+def covering_array(domains: dict, strength: int = 2) -> list[dict]:
+    """
+    生成 t-wise 覆盖用例
+
+    :param domains: {字段: 取值列表}，取值列表的顺序影响生成结果但不影响覆盖性
+    :param strength: 覆盖强度，2 为两两覆盖
+    :return: 用例列表，每条为 {字段: 取值}
+    """
+    frozen = _freeze(domains)
+    return [
+        {name: values[index] for (name, values), index in zip(frozen, row)}
+        for row in _covering_rows(frozen, strength)
+    ]
+
+
+def pairwise_params(domains: dict, strength: int = 2, base: dict = None, id_prefix: str = "pairwise") -> list:
+    """
+    生成可直接用于 parametrize 的覆盖用例
+
+    :param domains: {字段: 取值列表}，只有一个取值的字段不参与组合，直接并入每条用例
+    :param strength: 覆盖强度
+    :param base: 公共参数，每条用例在其基础上覆盖组合字段
+    :param id_prefix: 用例 id 前缀，生成 "<前缀>_01" 形式的 id
+    :return: pytest.param 列表，每个参数为完整的字段字典
+    """
+    fixed = {name: values[0] for name, values in domains.items() if len(values) == 1}
+    varying = {name: values for name, values in domains.items() if len(values) > 1}
+    cases = covering_array(varying, strength)
+    width = len(str(len(cases)))
+    return [
+        pytest.param({**(base or {}), **fixed, **case}, id=f"{id_prefix}_{index:0{width}d}")
+        for index, case in enumerate(cases, start=1)
+    ]
+
+
+def schema_domains(schema, base: dict, overrides: dict = None) -> dict:
+    """
+    从表单描述推导取值域：有可选项的字段取全部可选项，其余字段取 base 中的值
+
+    :param schema: FormSchema
+    :param base: 公共参数，例如 COMMON_ROOM_PARAMS
+    :param overrides: 额外指定的取值域，优先级最高
+    """
+    overrides = overrides or {}
+    domains = {}
+    for spec in schema:
+        if spec.key in overrides:
+            domains[spec.key] = list(overrides[spec.key])
+        elif spec.options:
+            domains[spec.key] = list(spec.options)
+        elif spec.key in base:
+            domains[spec.key] = [base[spec.key]]
+    return domains
@@ -0,0 +1,262 @@
+"""
+前端性能指标采集
+
+页面对象的导航方法用 record_navigation 装饰后，每次导航结束时采集：
+    - Navigation Timing：TTFB、DOMContentLoaded、load（整页加载时）
+    - Resource Timing：本次导航期间加载的资源数量、传输字节数、最慢的资源
+    - Long Tasks：主线程超过 50ms 的任务数量与总时长
+    - LCP / FCP：最大内容绘制与首次内容绘制（整页加载时）
+
+Long Task 与 LCP 只能通过 PerformanceObserver 获取，需要先用 PERF_OBSERVER_SCRIPT 作为
+init script 注入（插件 tests.plugins.perf_metrics 为每个 BrowserContext 注入）。
+整页加载等待 load 事件后以 Navigation Timing 的 loadEventEnd 为耗时。单页应用内的菜单跳转
+不会产生新的 Navigation Timing，也不额外等待网络空闲：以导航开始到最后一个资源响应结束或
+长任务结束的时间为耗时（由 Resource Timing / Long Task 条目计算），只统计导航开始之后的资源与长任务。
+
+没有活动的 NavigationMetricsRecorder 时（例如在压测脚本中使用页面对象）装饰器不做任何事。
+"""
+import functools
+import inspect
+import json
+import os
+import statistics
+import threading
+import time
+
+from conf.config import (
+    PERF_METRICS_BASELINE_RUNS,
+    PERF_METRICS_HISTORY,
+    PERF_METRICS_REGRESSION_MIN_MS,
+    PERF_METRICS_REGRESSION_RATIO,
+    PERF_METRICS_SETTLE_TIMEOUT,
+)
+from conf.logging_config import logger
+
+PERF_OBSERVER_SCRIPT = """
+(() => {
+  if (window.__wyfPerf) return;
+  const state = window.__wyfPerf = {longTasks: [], lcp: null};
+  const observe = (type, handle) => {
+    try {
+      new PerformanceObserver(list => list.getEntries().forEach(handle)).observe({type, buffered: true});
+    } catch (e) { /* 浏览器不支持该类型 */ }
+  };
+  observe('longtask', e => state.longTasks.push([e.startTime, e.duration]));
+  observe('largest-contentful-paint', e => { state.lcp = e.startTime; });
+})();
+"""
+
+_COLLECT_SCRIPT = """
+(since) => {
+  const round = v => Math.round(v * 10) / 10;
+  const state = window.__wyfPerf || {longTasks: [], lcp: null};
+  const now = performance.now();
+  const result = {timeOrigin: performance.timeOrigin, url: location.href, now: round(now)};
+
+  const nav = performance.getEntriesByType('navigation')[0];
+  if (nav && since === 0) {
+    result.navigation = {
+      ttfb_ms: round(nav.responseStart),
+      dom_content_loaded_ms: round(nav.domContentLoadedEventEnd),
+      load_ms: round(nav.loadEventEnd),
+      transfer_bytes: nav.transferSize,
+    };
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    result.fcp_ms = fcp ? round(fcp.startTime) : null;
+    result.lcp_ms = state.lcp === null ? null : round(state.lcp);
+  }
+
+  const resources = performance.getEntriesByType('resource').filter(r => r.startTime >= since);
+  const slowest = resources.slice().sort((a, b) => b.duration - a.duration).slice(0, 5);
+  result.resources = {
+    count: resources.length,
+    transfer_bytes: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+    slowest: slowest.map(r => ({name: r.name, type: r.initiatorType, duration_ms: round(r.duration)})),
+  };
+
+  const tasks = state.longTasks.filter(t => t[0] >= since);
+  // 本次导航最后一次活动（资源响应结束、长任务结束）的时间，没有活动时为 null
+  const ends = resources.map(r => r.responseEnd).concat(tasks.map(t => t[0] + t[1]));
+  result.activity_end = ends.length ? round(Math.max(...ends)) : null;
+  result.long_tasks = {
+    count: tasks.length,
+    total_ms: round(tasks.reduce((sum, t) => sum + t[1], 0)),
+    max_ms: round(tasks.reduce((max, t) => Math.max(max, t[1]), 0)),
+  };
+  return result;
+}
+"""
+
+# 参与回归判断的指标
+_TRACKED_METRICS = ("duration_ms", "lcp_ms")
+
+_active = threading.local()
+
+
+def get_active_recorder():
+    return getattr(_active, "recorder", None)
+
+
+def set_active_recorder(recorder):
+    _active.recorder = recorder
+
+
+def _load_history(path: str) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+class NavigationBaseline:
+    """
+    由历史记录计算的基线：同一导航标签、同一网络拦截方案最近若干次的中位数
+
+    Args:
+        history: 历史记录列表，按时间顺序
+        runs: 参与计算的最近次数
+    """
+
+    def __init__(self, history: list[dict], runs: int = PERF_METRICS_BASELINE_RUNS):
+        values = {}
+        for record in history:
+            key = (record.get("label"), record.get("profile"))
+            for metric in _TRACKED_METRICS:
+                value = record.get(metric)
+                if value is not None:
+                    values.setdefault((key, metric), []).append(value)
+        self.medians = {k: statistics.median(v[-runs:]) for k, v in values.items()}
+
+    def check(self, record: dict) -> list[str]:
+        """返回明显慢于基线的指标说明，无回归时返回空列表"""
+        key = (record["label"], record.get("profile"))
+        regressions = []
+        for metric in _TRACKED_METRICS:
+            value = record.get(metric)
+            baseline = self.medians.get((key, metric))
+            if value is None or baseline is None:
+                continue
+            if value > baseline * PERF_METRICS_REGRESSION_RATIO and value - baseline > PERF_METRICS_REGRESSION_MIN_MS:
+                regressions.append(f"{record['label']} {metric} {value:.0f}ms，基线 {baseline:.0f}ms")
+        return regressions
+
+
+class NavigationMetricsRecorder:
+    """
+    一个用例内的导航指标记录
+
+    Args:
+        test_id: 用例 nodeid
+        profile: 当前用例使用的网络拦截方案，拦截图片时 LCP 等指标不可与未拦截时比较
+        baseline: NavigationBaseline
+        history_path: 历史记录文件（JSONL），None 表示不写历史
+    """
+
+    def __init__(self, test_id: str, profile: str = None, baseline: NavigationBaseline = None,
+                 history_path: str = PERF_METRICS_HISTORY):
+        self.test_id = test_id
+        self.profile = profile
+        self.baseline = baseline
+        self.history_path = history_path
+        self.records = []
+        self.regressions = []
+
+    def start(self, page) -> dict | None:
+        try:
+            return page.evaluate("() => ({timeOrigin: performance.timeOrigin, now: performance.now()})")
+        except Exception:
+            return None
+
+    def finish(self, page, label: str, started: dict | None, wall_started: float):
+        try:
+            # 文档没有变化时为单页内跳转，只统计导航开始之后的条目
+            same_document = started is not None and page.evaluate("performance.timeOrigin") == started["timeOrigin"]
+            since = started["now"] if same_document else 0
+            if not same_document:
+                # 整页加载需要 load 事件结束后 Navigation Timing 才完整
+                try:
+                    page.wait_for_load_state("load", timeout=PERF_METRICS_SETTLE_TIMEOUT)
+                except Exception:
+                    pass
+                page.evaluate(PERF_OBSERVER_SCRIPT)
+            metrics = page.evaluate(_COLLECT_SCRIPT, since)
+        except Exception as e:
+            logger.debug(f"采集导航指标失败 [{label}]: {e}")
+            return None
+
+        if same_document:
+            # 导航方法自身的固定等待不计入：以最后一次资源/长任务活动结束为准
+            activity_end = metrics.get("activity_end")
+            duration = (activity_end if activity_end is not None else metrics["now"]) - since
+        else:
+            duration = (metrics.get("navigation") or {}).get("load_ms") or (time.perf_counter() - wall_started) * 1000
+        record = {
+            "timestamp": time.time(),
+            "test": self.test_id,
+            "label": label,
+            "profile": self.profile,
+            "kind": "soft" if same_document else "hard",
+            "url": metrics["url"],
+            "duration_ms": round(duration, 1),
+            "lcp_ms": metrics.get("lcp_ms"),
+            "fcp_ms": metrics.get("fcp_ms"),
+            "navigation": metrics.get("navigation"),
+            "resources": metrics["resources"],
+            "long_tasks": metrics["long_tasks"],
+        }
+        self.records.append(record)
+        if self.baseline is not None:
+            for message in self.baseline.check(record):
+                logger.warning(f"⚠️ 页面渲染变慢: {message}")
+                self.regressions.append(message)
+        self._append_history(record)
+        return record
+
+    def _append_history(self, record: dict):
+        if not self.history_path:
+            return
+        os.makedirs(os.path.dirname(self.history_path), exist_ok=True)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        # 追加写单行，xdist 多进程并发写同一文件时不会交错
+        with open(self.history_path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def record_navigation(label: str):
+    """
+    导航方法装饰器，方法所属对象需有 page 属性
+
+    :param label: 导航标签，可引用方法参数，例如 "fd:{target_page_name}"
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            recorder = get_active_recorder()
+            if recorder is None:
+                return func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            name = label.format(**bound.arguments)
+            wall_started = time.perf_counter()
+            started = recorder.start(self.page)
+            result = func(self, *args, **kwargs)
+            recorder.finish(self.page, name, started, wall_started)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def load_baseline(path: str = PERF_METRICS_HISTORY) -> NavigationBaseline:
+    return NavigationBaseline(_load_history(path))
@@ -0,0 +1,189 @@
+"""
+性能采样统计
+
+按步骤记录每次操作的耗时与成败，汇总为分位数延迟、错误率与吞吐量：
+
+    stats = PerfStats()
+    with stats.measure("新增民宿", user="vu01"):
+        add_new_minsu_page.add_new_minsu(**minsu_fields)
+    stats.write_report(path)
+
+measure() 捕获步骤中的异常并记为失败后继续抛出；步骤方法以返回 False 表示失败时，
+调用 fail() 标记。记录是线程安全的，多个虚拟用户线程共享同一个 PerfStats。
+分位数采用最近秩法（nearest-rank），样本数较少时不做插值。
+"""
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from conf.config import PERF_PERCENTILES
+
+
+def percentile(sorted_values: list[float], p: float) -> float | None:
+    """最近秩法分位数，sorted_values 需已升序排列，为空时返回 None"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class StepSample:
+    """一次步骤执行的记录"""
+
+    __slots__ = ("step", "user", "started", "duration", "ok", "error")
+
+    def __init__(self, step: str, user: str, started: float, duration: float, ok: bool, error: str = None):
+        self.step = step
+        self.user = user
+        self.started = started
+        self.duration = duration
+        self.ok = ok
+        self.error = error
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _Measurement:
+    """measure() 产生的句柄，步骤内调用 fail() 将本次记录标记为失败"""
+
+    __slots__ = ("error",)
+
+    def __init__(self):
+        self.error = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def fail(self, reason: str = "步骤返回失败"):
+        self.error = reason
+
+
+class PerfStats:
+    """
+    线程安全的步骤耗时收集与汇总
+
+    Args:
+        percentiles: 报告中输出的分位数，默认 conf.config.PERF_PERCENTILES
+    """
+
+    def __init__(self, percentiles=PERF_PERCENTILES):
+        self.percentiles = tuple(percentiles)
+        self.samples: list[StepSample] = []
+        self._lock = threading.Lock()
+        self._step_order = []
+        self.started = time.time()
+        self.finished = None
+
+    def record(self, step: str, user: str, started: float, duration: float, ok: bool, error: str = None):
+        sample = StepSample(step, user, started, duration, ok, error)
+        with self._lock:
+            if step not in self._step_order:
+                self._step_order.append(step)
+            self.samples.append(sample)
+        return sample
+
+    @contextmanager
+    def measure(self, step: str, user: str = ""):
+        """计时执行一个步骤；异常记为失败后继续抛出"""
+        measurement = _Measurement()
+        started = time.time()
+        t0 = time.perf_counter()
+        try:
+            yield measurement
+        except BaseException as e:
+            measurement.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.record(step, user, started, time.perf_counter() - t0, measurement.error is None, measurement.error)
+
+    def finish(self):
+        self.finished = time.time()
+
+    # ------------------------------
+    # 汇总
+    # ------------------------------
+    def _summarize(self, samples: list[StepSample], wall_time: float) -> dict:
+        durations = sorted(s.duration for s in samples if s.ok)
+        errors = [s for s in samples if not s.ok]
+        summary = {
+            "count": len(samples),
+            "ok": len(durations),
+            "errors": len(errors),
+            "error_rate": round(len(errors) / len(samples), 4) if samples else 0.0,
+            "throughput_per_s": round(len(durations) / wall_time, 4) if wall_time > 0 else None,
+            "mean_s": round(sum(durations) / len(durations), 4) if durations else None,
+            "max_s": round(durations[-1], 4) if durations else None,
+        }
+        for p in self.percentiles:
+            value = percentile(durations, p)
+            summary[f"p{p:g}_s"] = round(value, 4) if value is not None else None
+        # 同类错误只保留前几条原因，避免报告过长
+        reasons = {}
+        for s in errors:
+            reasons[s.error] = reasons.get(s.error, 0) + 1
+        summary["error_reasons"] = dict(sorted(reasons.items(), key=lambda r: -r[1])[:5])
+        return summary
+
+    def summary(self) -> dict:
+        """按步骤汇总，步骤顺序为首次出现的顺序"""
+        with self._lock:
+            samples = list(self.samples)
+            steps = list(self._step_order)
+        wall_time = (self.finished or time.time()) - self.started
+        return {
+            "wall_time_s": round(wall_time, 3),
+            "steps": {
+                step: self._summarize([s for s in samples if s.step == step], wall_time)
+                for step in steps
+            },
+        }
+
+    def format_table(self) -> str:
+        """控制台输出用的汇总表"""
+        summary = self.summary()
+        columns = ["count", "errors", "error_rate", "throughput_per_s"] + [f"p{p:g}_s" for p in self.percentiles]
+        lines = ["步骤".ljust(12) + "".join(c.rjust(18) for c in columns)]
+        for step, values in summary["steps"].items():
+            cells = ["-" if values[c] is None else str(values[c]) for c in columns]
+            lines.append(step.ljust(12) + "".join(cell.rjust(18) for cell in cells))
+        lines.append(f"总耗时 {summary['wall_time_s']}s")
+        return "\n".join(lines)
+
+    def report(self, meta: dict = None) -> dict:
+        """运行参数、按步骤的汇总以及全部原始样本"""
+        report = {"meta": meta or {}, **self.summary()}
+        with self._lock:
+            report["samples"] = [s.to_dict() for s in self.samples]
+        return report
+
+    def write_report(self, path: str, meta: dict = None) -> dict:
+        """
+        写出 JSON 报告，内容见 report()
+
+        :param path: 报告文件路径，目录不存在时自动创建
+        :param meta: 运行参数等附加信息
+        """
+        report = self.report(meta)
+        write_json(path, report)
+        return report
+
+
+def write_json(path: str, data):
+    """原子写出 JSON 文件，目录不存在时自动创建"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
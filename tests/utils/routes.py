@@ -0,0 +1,92 @@
+"""
+页面直达路由
+
+菜单点击路径（登录 -> 首页 -> 房屋管理 -> 房间管理）中间夹着固定等待。已登录的会话可以直接
+打开 conf.config.PAGE_ROUTES 中登记的 SPA 地址，并以页面上的就绪标志（按钮）判断加载完成。
+页面对象的 open() 基于此实现；验证菜单跳转本身的用例仍应走点击路径。
+
+未确认路径（path 为 None）的页面在首次打开时从门户首页依次点击菜单，记录跳转后地址栏中的
+实际路径到 PAGE_ROUTE_CACHE，之后的打开（包括其他进程、后续会话）直接使用记录的路径。
+菜单项可以是 el-menu 的 menuitem（房东端），也可以是文字链接（公安端首页）。
+"""
+import json
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Page
+
+from conf.config import PAGE_ROUTE_CACHE, PAGE_ROUTES, ROUTE_READY_TIMEOUT
+from conf.logging_config import logger
+from tests.utils.perf_stats import write_json
+
+
+def _learned_paths() -> dict:
+    try:
+        with open(PAGE_ROUTE_CACHE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def route_path(name: str) -> str | None:
+    """逻辑页面的 SPA 路径：优先取配置，其次取菜单跳转记录，均没有时返回 None"""
+    if name not in PAGE_ROUTES:
+        raise ValueError(f"未登记的页面路由: {name}，可选: {', '.join(PAGE_ROUTES)}")
+    return PAGE_ROUTES[name]["path"] or _learned_paths().get(name)
+
+
+def route_url(name: str, base_url: str) -> str | None:
+    """
+    :param name: 逻辑页面，例如 "fd:房间管理"
+    :param base_url: 对应门户的地址，例如 fd_base_url
+    :return: 完整地址，路径尚未记录时返回 None
+    """
+    path = route_path(name)
+    return f"{base_url.rstrip('/')}{path}" if path else None
+
+
+def _wait_visible(page: Page, target, name: str, timeout: float):
+    """等待 target 出现；会话未登录被重定向到登录页时抛出 RuntimeError，而不是等到超时"""
+    login_form = page.get_by_role("button", name="登 录")
+    target.or_(login_form).first.wait_for(state="visible", timeout=timeout)
+    if not target.is_visible():
+        raise RuntimeError(f"打开 {name} 时被重定向到登录页，请先登录: {page.url}")
+
+
+def _menu_item(page: Page, text: str):
+    """菜单项：el-menu 的 menuitem 或文字完全一致的链接"""
+    return page.get_by_role("menuitem", name=text).or_(page.locator(f'//a[text()="{text}"]')).first
+
+
+def _wait_ready(page: Page, name: str, timeout: float):
+    _wait_visible(page, page.get_by_role("button", name=PAGE_ROUTES[name]["ready_button"]).first, name, timeout)
+
+
+def learn_route(page: Page, name: str, base_url: str, timeout: float = ROUTE_READY_TIMEOUT) -> str:
+    """从门户首页依次点击菜单打开逻辑页面，记录并返回跳转后的路径"""
+    page.goto(base_url)
+    menu = PAGE_ROUTES[name]["menu"]
+    _wait_visible(page, _menu_item(page, menu[0]), name, timeout)
+    for item in menu:
+        _menu_item(page, item).click()
+    _wait_ready(page, name, timeout)
+    path = urlsplit(page.url).path
+    learned = _learned_paths()
+    learned[name] = path
+    write_json(PAGE_ROUTE_CACHE, learned)
+    logger.info(f"已记录 {name} 的菜单跳转路径: {path}")
+    return path
+
+
+def open_route(page: Page, name: str, base_url: str, timeout: float = ROUTE_READY_TIMEOUT):
+    """
+    直接打开逻辑页面并等待就绪标志出现，路径尚未记录时经菜单打开一次并记录
+
+    会话未登录时门户会重定向到登录页，此时抛出 RuntimeError，而不是等到就绪超时。
+    """
+    url = route_url(name, base_url)
+    if url is None:
+        learn_route(page, name, base_url, timeout)
+        return
+    page.goto(url)
+    _wait_ready(page, name, timeout)
+    logger.info(f"已直达 {name}: {url}")
@@ -0,0 +1,112 @@
+"""
+场景构造：经界面完成的多步前置流程
+
+供 scenario_checkpoint.ensure 构造检查点，也供生命周期序列用例执行迁移操作：
+
+    restored = scenario_checkpoint.ensure(
+        MINSU_ONE_ROOM_CHECKPOINT,
+        lambda: build_minsu_with_room(browser, fd_base_url, fd_test_user),
+    )
+    minsu_name = next(iter(restored["names"].values()))
+
+房间名称与民宿名称相同：检查点 clone 时等于根名称的字段统一替换为新名称，
+各副本的房间名称因此互不重复，可以直接按民宿名称查询房间。
+"""
+import uuid
+
+from conf.config import (
+    BATHROOM_FILES,
+    BEDROOM_FILES,
+    COMMON_ROOM_PARAMS,
+    COMMON_minsu_PARAMS,
+    JPEG_FIRE_SAFETY_CERTIFICATE,
+    JPEG_PUBLIC_SECURITY_CERTIFICATE,
+    KITCHEN_FILES,
+    LIVING_ROOM_FILES,
+)
+from tests.pages.fd.add_new_minsu import AddNewMinsuPage
+from tests.pages.fd.filing_room_page import FilingRoomPage
+from tests.pages.fd.login_page import LoginPage
+from tests.pages.fd.minsu_management_page import MinsuManagementPage
+from tests.pages.ga.ga_filing_management_page import GAFilingManagementPage
+from tests.pages.ga.ga_login_page import GALoginPage
+
+# 已备案一个房间、尚未提交备案的民宿（房间状态为"正常"）
+MINSU_ONE_ROOM_CHECKPOINT = "minsu_one_room"
+# 已备案一个房间、备案状态为待确认的民宿
+MINSU_PENDING_ONE_ROOM_CHECKPOINT = "minsu_pending_one_room"
+
+
+def add_minsu(minsu_management_page: MinsuManagementPage, minsu_name: str):
+    """在民宿管理页面新增民宿，完成后回到民宿列表"""
+    page = minsu_management_page.page
+    minsu_management_page.go_to_add_minsu_page()
+    page.wait_for_load_state("load")
+    AddNewMinsuPage(page).add_new_minsu(**{**COMMON_minsu_PARAMS, "minsu_name": minsu_name})
+    page.wait_for_load_state("load")
+
+
+def file_one_room(minsu_management_page: MinsuManagementPage, minsu_name: str) -> bool:
+    """为民宿备案一个与民宿同名的房间，完成后回到民宿列表"""
+    page = minsu_management_page.page
+    minsu_management_page.query_minsu(minsu_name)
+    if not minsu_management_page.minsu_operation("备案房间", minsu_name):
+        return False
+    filing_room_page = FilingRoomPage(page)
+    filing_room_page.filing_room(test_fields="all",
+                                 property_certificate=JPEG_FIRE_SAFETY_CERTIFICATE,
+                                 fire_safety_certificate=JPEG_FIRE_SAFETY_CERTIFICATE,
+                                 public_security_registration_form=JPEG_PUBLIC_SECURITY_CERTIFICATE,
+                                 bedroom_files=BEDROOM_FILES,
+                                 living_room_files=LIVING_ROOM_FILES,
+                                 kitchen_files=KITCHEN_FILES,
+                                 bathroom_files=BATHROOM_FILES,
+                                 **{**COMMON_ROOM_PARAMS, "ms_name": minsu_name, "room_name": minsu_name})
+    filing_room_page.submit_form()
+    page.wait_for_load_state("load")
+    return True
+
+
+def confirm_filing_on_ga(browser, ga_base_url: str, ga_test_user: dict, minsu_name: str,
+                         confirming_person_name: str = "金庸") -> bool:
+    """在独立的 context 中登录公安端，确认民宿的备案"""
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        login_page = GALoginPage(page)
+        login_page.navigate(ga_base_url)
+        login_page.fill_credentials(ga_test_user["username"], ga_test_user["password"])
+        login_page.click_login_button()
+        page.wait_for_load_state("networkidle")
+
+        ga_filing_management_page = GAFilingManagementPage(page).open(ga_base_url)
+        return ga_filing_management_page.filing_operation("确认", confirming_person_name, minsu_name=minsu_name)
+    finally:
+        context.close()
+
+
+def build_minsu_with_room(browser, fd_base_url: str, fd_test_user: dict, submit: bool = False):
+    """
+    新增民宿并备案一个房间，submit 为 True 时再提交备案（民宿状态变为待确认）
+
+    Returns:
+        tuple: (民宿名称列表, 房东端登录态 storage_state)，即 scenario_checkpoint.ensure 的 build 返回值
+    """
+    minsu_name = f"检查点民宿_{uuid.uuid4().hex[:6]}"
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        login_page = LoginPage(page)
+        login_page.navigate(fd_base_url)
+        login_page.fill_credentials(fd_test_user["username"], fd_test_user["password"])
+        login_page.click_login_button()
+        page.wait_for_url("**/fangdonghome/home")
+
+        minsu_management_page = MinsuManagementPage(page).open(fd_base_url)
+        add_minsu(minsu_management_page, minsu_name)
+        assert file_one_room(minsu_management_page, minsu_name), f"构造检查点时备案房间失败: {minsu_name}"
+        if submit:
+            assert minsu_management_page.minsu_submit(minsu_name), f"构造检查点时提交备案失败: {minsu_name}"
+        return [minsu_name], context.storage_state()
+    finally:
+        context.close()
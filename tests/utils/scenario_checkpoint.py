@@ -0,0 +1,375 @@
+"""
+场景检查点：保存与恢复耗时前置状态
+
+"已备案一个房间、备案状态为待确认的民宿"这类前置场景需要经过登录、新增民宿、备案房间、提交等
+多步界面操作才能得到。检查点在会话内只构造一次，记录：
+    - us_wyfjgpt_fd / us_wyfjgpt_ga 中场景涉及的数据行（按 SCENARIO_CHECKPOINT_TABLES 的表关系收集）
+    - 浏览器 storage_state（登录态）
+
+后续用例通过 restore() 恢复：
+    clone   以新名称复制一份数据行（主键重新生成：自增主键由数据库分配，字符串主键生成新的随机值；
+            子表外键、冗余名称列与表配置中 unique_columns 列出的唯一业务列同步替换），
+            每个用例拿到互不影响的独立副本
+    reset   在一个事务内删除场景数据行后按检查点原样写回，把被用例修改过的原始数据还原
+
+检查点文件保存在 SCENARIO_CHECKPOINT_DIR/<名称>.json，带有会话标识，跨会话不复用。
+时间、Decimal、二进制等 JSON 无法直接表示的字段值带类型标记保存，读取时还原为原类型后再写回数据库。
+"""
+import base64
+import json
+import os
+import re
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+
+from conf.config import DB_CONFIG, DB_NAMES, SCENARIO_CHECKPOINT_DIR, SCENARIO_CHECKPOINT_TABLES
+from conf.logging_config import logger
+
+
+def _encode_value(value):
+    """json.dump 的 default：为 JSON 无法表示的字段值加类型标记"""
+    if isinstance(value, datetime):
+        return {"__type__": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"__type__": "date", "value": value.isoformat()}
+    if isinstance(value, dt_time):
+        return {"__type__": "time", "value": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"__type__": "timedelta", "value": value.total_seconds()}
+    if isinstance(value, Decimal):
+        return {"__type__": "decimal", "value": str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__type__": "bytes", "value": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, set):
+        # MySQL SET 列
+        return sorted(value)
+    raise TypeError(f"无法序列化的字段值: {type(value).__name__}")
+
+
+_DECODERS = {
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": dt_time.fromisoformat,
+    "timedelta": lambda v: timedelta(seconds=v),
+    "decimal": Decimal,
+    "bytes": base64.b64decode,
+}
+
+
+def _decode_value(obj: dict):
+    """json.load 的 object_hook：还原带类型标记的字段值"""
+    if set(obj) == {"__type__", "value"} and obj["__type__"] in _DECODERS:
+        return _DECODERS[obj["__type__"]](obj["value"])
+    return obj
+
+
+def _atomic_write_json(path: str, data):
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, default=_encode_value)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ScenarioCheckpointStore:
+    """
+    场景检查点的保存与恢复
+
+    Args:
+        checkpoint_dir: 检查点文件目录
+        session_id: 当前测试会话标识，只复用本会话保存的检查点
+        db_config: 数据库连接配置（不含库名）
+        db_names: 需要收集数据的库
+        tables: 表关系配置，父表在前，见 conf.config.SCENARIO_CHECKPOINT_TABLES
+    """
+
+    def __init__(self, checkpoint_dir: str = SCENARIO_CHECKPOINT_DIR, session_id: str = None,
+                 db_config: dict = DB_CONFIG, db_names=DB_NAMES, tables=SCENARIO_CHECKPOINT_TABLES):
+        self.checkpoint_dir = checkpoint_dir
+        self.session_id = session_id or uuid.uuid4().hex
+        self.db_config = db_config
+        self.db_names = list(db_names)
+        self.tables = tables
+        self._loaded = {}
+        self._clones = []
+        self._column_info = {}
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{name}.json")
+
+    def _connect(self, db_name: str):
+        import mysql.connector
+
+        return mysql.connector.connect(**self.db_config, database=db_name)
+
+    # ------------------------------
+    # 读取
+    # ------------------------------
+    def load(self, name: str) -> dict | None:
+        """读取本会话保存的检查点，不存在或属于其他会话时返回 None"""
+        if name in self._loaded:
+            return self._loaded[name]
+        path = self._path(name)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f, object_hook=_decode_value)
+        if checkpoint.get("session_id") != self.session_id:
+            return None
+        self._loaded[name] = checkpoint
+        return checkpoint
+
+    def exists(self, name: str) -> bool:
+        return self.load(name) is not None
+
+    # ------------------------------
+    # 保存
+    # ------------------------------
+    def _collect_rows(self, cursor, root_names: list[str]) -> dict:
+        """按表关系从根表名称出发收集所有相关行：{表名: [行字典, ...]}"""
+        rows = {}
+        keys = {}
+        for spec in self.tables:
+            table = spec["table"]
+            if "parent" in spec:
+                parent_keys = keys.get(spec["parent"], [])
+                if not parent_keys:
+                    rows[table] = []
+                    keys[table] = []
+                    continue
+                column, values = spec["parent_column"], parent_keys
+            else:
+                column, values = spec["name_column"], root_names
+            cursor.execute(
+                f"SELECT * FROM {table} WHERE {column} IN ({', '.join(['%s'] * len(values))})",
+                list(values),
+            )
+            rows[table] = cursor.fetchall()
+            keys[table] = [row[spec["key"]] for row in rows[table]]
+        return rows
+
+    def capture(self, name: str, root_names: list[str], storage_state: dict = None) -> dict:
+        """
+        保存场景检查点
+
+        :param name: 检查点名称
+        :param root_names: 根表（例如民宿表）中场景对象的名称
+        :param storage_state: 浏览器登录态，BrowserContext.storage_state() 的返回值
+        """
+        started = time.perf_counter()
+        databases = {}
+        for db_name in self.db_names:
+            connection = self._connect(db_name)
+            try:
+                cursor = connection.cursor(dictionary=True)
+                databases[db_name] = self._collect_rows(cursor, root_names)
+                cursor.close()
+            finally:
+                connection.close()
+
+        checkpoint = {
+            "name": name,
+            "session_id": self.session_id,
+            "created_at": time.time(),
+            "root_names": list(root_names),
+            "databases": databases,
+            "storage_state": storage_state,
+        }
+        _atomic_write_json(self._path(name), checkpoint)
+        # 重新读取一次，保证内存中的行与文件中（经 JSON 序列化后）的一致
+        self._loaded.pop(name, None)
+        checkpoint = self.load(name)
+        row_count = sum(len(r) for tables in databases.values() for r in tables.values())
+        logger.info(f"已保存场景检查点 [{name}]: {row_count} 行，用时 {time.perf_counter() - started:.2f}s")
+        return checkpoint
+
+    # ------------------------------
+    # 恢复
+    # ------------------------------
+    def restore(self, name: str, mode: str = "clone", suffix: str = None) -> dict:
+        """
+        恢复场景检查点
+
+        :param name: 检查点名称
+        :param mode: clone 以新名称复制一份；reset 原样还原检查点中的数据行
+        :param suffix: clone 时追加到名称后的后缀，默认随机生成
+        :return: {"names": {原名称: 恢复后名称}, "storage_state": 登录态}
+        """
+        checkpoint = self.load(name)
+        if checkpoint is None:
+            raise KeyError(f"本会话不存在场景检查点: {name}")
+        if mode not in ("clone", "reset"):
+            raise ValueError(f"不支持的恢复方式: {mode}，可选: clone / reset")
+
+        started = time.perf_counter()
+        if mode == "clone":
+            suffix = suffix or uuid.uuid4().hex[:6]
+            names = {root: f"{root}_{suffix}" for root in checkpoint["root_names"]}
+        else:
+            names = {root: root for root in checkpoint["root_names"]}
+
+        for db_name, tables in checkpoint["databases"].items():
+            connection = self._connect(db_name)
+            try:
+                connection.start_transaction()
+                cursor = connection.cursor()
+                if mode == "clone":
+                    self._clone_rows(cursor, tables, names)
+                else:
+                    self._reset_rows(cursor, tables)
+                connection.commit()
+                cursor.close()
+            except BaseException:
+                connection.rollback()
+                raise
+            finally:
+                connection.close()
+
+        if mode == "clone":
+            self._clones.append(list(names.values()))
+        logger.info(f"已恢复场景检查点 [{name}]（{mode}），用时 {(time.perf_counter() - started) * 1000:.0f}ms")
+        return {"names": names, "storage_state": checkpoint["storage_state"]}
+
+    @staticmethod
+    def _insert(cursor, table: str, row: dict):
+        columns = list(row)
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})",
+            [row[c] for c in columns],
+        )
+
+    def _columns(self, cursor, table: str) -> dict:
+        """表的列信息 {列名: (类型, 是否自增)}；两个库结构相同，按表名缓存"""
+        if table not in self._column_info:
+            cursor.execute(f"SHOW COLUMNS FROM {table}")
+            info = {}
+            for row in cursor.fetchall():
+                field, column_type, extra = (v.decode() if isinstance(v, bytes) else v for v in (row[0], row[1], row[5]))
+                info[field] = (column_type.lower(), "auto_increment" in (extra or ""))
+            self._column_info[table] = info
+        return self._column_info[table]
+
+    def _fresh_value(self, cursor, table: str, column: str, value=None):
+        """
+        为主键或唯一业务列生成新值
+
+        整数列取当前最大值 + 1（事务内加锁，避免并发复制取到同一个值）；
+        字符串列在原值后拼接随机串，超出列宽时截短原值，原值为空时整列使用随机串。
+        """
+        column_type = self._columns(cursor, table)[column][0]
+        if "int" in column_type:
+            cursor.execute(f"SELECT MAX({column}) FROM {table} FOR UPDATE")
+            return (cursor.fetchone()[0] or 0) + 1
+        prefix = "" if value is None else str(value)
+        token = uuid.uuid4().hex if value is None else uuid.uuid4().hex[:8]
+        width = re.search(r"char\((\d+)\)", column_type)
+        if width:
+            width = int(width.group(1))
+            return (prefix[:max(width - len(token), 0)] + token)[:width]
+        return prefix + token
+
+    def _clone_rows(self, cursor, tables: dict, names: dict):
+        """复制数据行：主键重新生成，子表外键指向新父行，等于原名称的字段替换为新名称，唯一业务列重新生成"""
+        new_keys = {}
+        for spec in self.tables:
+            table, key = spec["table"], spec["key"]
+            auto_increment = self._columns(cursor, table)[key][1]
+            mapping = new_keys.setdefault(table, {})
+            for row in tables.get(table, []):
+                clone = {
+                    column: names.get(value, value) if isinstance(value, str) else value
+                    for column, value in row.items()
+                    if column != key
+                }
+                for column in spec.get("unique_columns", []):
+                    if clone.get(column) is not None:
+                        clone[column] = self._fresh_value(cursor, table, column, clone[column])
+                if "parent" in spec:
+                    clone[spec["parent_column"]] = new_keys[spec["parent"]][row[spec["parent_column"]]]
+                if not auto_increment:
+                    clone[key] = self._fresh_value(cursor, table, key)
+                self._insert(cursor, table, clone)
+                mapping[row[key]] = cursor.lastrowid if auto_increment else clone[key]
+
+    def _reset_rows(self, cursor, tables: dict):
+        """事务内删除场景数据行（含检查点之后新增的子行）并按检查点写回"""
+        for spec in reversed(self.tables):
+            table, key = spec["table"], spec["key"]
+            if "parent" in spec:
+                parent_keys = [row[self._spec(spec["parent"])["key"]] for row in tables.get(spec["parent"], [])]
+                if parent_keys:
+                    cursor.execute(
+                        f"DELETE FROM {table} WHERE {spec['parent_column']} IN "
+                        f"({', '.join(['%s'] * len(parent_keys))})",
+                        parent_keys,
+                    )
+            row_keys = [row[key] for row in tables.get(table, [])]
+            if row_keys:
+                cursor.execute(
+                    f"DELETE FROM {table} WHERE {key} IN ({', '.join(['%s'] * len(row_keys))})", row_keys
+                )
+        for spec in self.tables:
+            for row in tables.get(spec["table"], []):
+                self._insert(cursor, spec["table"], row)
+
+    def _spec(self, table: str) -> dict:
+        return next(spec for spec in self.tables if spec["table"] == table)
+
+    # ------------------------------
+    # 清理
+    # ------------------------------
+    def drop_clones(self):
+        """删除本会话 clone 出来的数据行：沿表关系逐层收集主键，最深的子表先删"""
+        if not self._clones:
+            return
+        root = self.tables[0]
+        root_names = [n for names in self._clones for n in names]
+        placeholders = ", ".join(["%s"] * len(root_names))
+        for db_name in self.db_names:
+            try:
+                connection = self._connect(db_name)
+            except Exception as e:
+                logger.warning(f"无法连接数据库 {db_name}，跳过清理场景副本: {e}")
+                continue
+            try:
+                cursor = connection.cursor()
+                cursor.execute(
+                    f"SELECT {root['key']} FROM {root['table']} WHERE {root['name_column']} IN ({placeholders})",
+                    root_names,
+                )
+                keys = {root["table"]: [row[0] for row in cursor.fetchall()]}
+                # self.tables 父表在前，逐层按父表主键查出子表主键
+                for spec in self.tables[1:]:
+                    parent_keys = keys.get(spec["parent"], [])
+                    if not parent_keys:
+                        keys[spec["table"]] = []
+                        continue
+                    cursor.execute(
+                        f"SELECT {spec['key']} FROM {spec['table']} WHERE {spec['parent_column']} IN "
+                        f"({', '.join(['%s'] * len(parent_keys))})",
+                        parent_keys,
+                    )
+                    keys[spec["table"]] = [row[0] for row in cursor.fetchall()]
+                for spec in reversed(self.tables):
+                    table_keys = keys.get(spec["table"], [])
+                    if table_keys:
+                        cursor.execute(
+                            f"DELETE FROM {spec['table']} WHERE {spec['key']} IN "
+                            f"({', '.join(['%s'] * len(table_keys))})",
+                            table_keys,
+                        )
+                connection.commit()
+                cursor.close()
+            finally:
+                connection.close()
+        logger.info(f"已清理 {len(root_names)} 个场景副本")
+        self._clones.clear()
@@ -0,0 +1,207 @@
+"""
+指定字节大小的测试文件生成
+
+上传大小边界用例需要恰好 10 MiB、10 MiB + 1 字节等文件，仓库中不保存这类大文件，
+改为按需生成结构合法的 PNG / JPEG / PDF / BMP：
+    PNG   在 IEND 前插入私有辅助块 paDd
+    JPEG  在 APP0 后插入若干 COM 注释段
+    PDF   增加一个未被引用的填充流对象，xref 偏移同步计算
+    BMP   在文件头与像素数据之间留空，bfOffBits 指向像素数据
+
+填充内容全部为 0，写入时直接 seek 跳过（稀疏文件），生成 10 MiB 文件几乎不占磁盘与时间。
+生成结果按 (格式, 大小, 版本) 摘要命名缓存在临时目录，同一规格只生成一次。
+"""
+import hashlib
+import os
+import struct
+import tempfile
+import zlib
+
+from conf.config import SIZED_FILE_CACHE_DIR
+from conf.logging_config import logger
+
+# 生成规则变化时递增，使旧缓存失效
+_FACTORY_VERSION = 1
+_ZERO_BLOCK = bytes(1024 * 1024)
+
+SIZED_FILE_EXTENSIONS = {
+    "png": ".png",
+    "jpeg": ".jpeg",
+    "jpg": ".jpg",
+    "pdf": ".pdf",
+    "bmp": ".bmp",
+}
+
+
+def _zero_crc(crc: int, length: int) -> int:
+    """在已有 CRC 基础上继续累加 length 个 0 字节"""
+    zeros = memoryview(_ZERO_BLOCK)
+    while length > 0:
+        block = min(length, len(zeros))
+        crc = zlib.crc32(zeros[:block], crc)
+        length -= block
+    return crc
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+# 1x1 灰度 PNG
+_PNG_HEAD = (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0))
+        + _png_chunk(b"IDAT", zlib.compress(b"\x00\x80"))
+)
+_PNG_TAIL = _png_chunk(b"IEND", b"")
+
+# 8x8 灰度基线 JPEG：单符号哈夫曼表，DC 差值 0 + EOB
+_JPEG_SOI_APP0 = b"\xff\xd8" + b"\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+_JPEG_BODY = (
+        b"\xff\xdb\x00\x43\x00" + b"\x01" * 64
+        + b"\xff\xc0\x00\x0b\x08\x00\x08\x00\x08\x01\x01\x11\x00"
+        + b"\xff\xc4\x00\x14\x00" + b"\x01" + b"\x00" * 15 + b"\x00"
+        + b"\xff\xc4\x00\x14\x10" + b"\x01" + b"\x00" * 15 + b"\x00"
+        + b"\xff\xda\x00\x08\x01\x01\x00\x00\x3f\x00"
+        + b"\x3f"
+        + b"\xff\xd9"
+)
+# COM 段：2 字节标记 + 2 字节长度（含自身）+ 内容
+_JPEG_COM_OVERHEAD = 4
+_JPEG_COM_MAX = 0xFFFF + 2
+
+_BMP_HEADER_SIZE = 14 + 40
+_BMP_PIXELS = b"\xff\xff\xff\x00"  # 1x1 24 位白色像素，行补齐到 4 字节
+
+
+def _png_layout(size: int):
+    base = len(_PNG_HEAD) + len(_PNG_TAIL)
+    if size == base:
+        return [_PNG_HEAD, _PNG_TAIL]
+    pad = size - base - 12
+    if pad < 0:
+        raise ValueError(f"PNG 无法生成 {size} 字节（最小 {base}，或不少于 {base + 12}）")
+    crc = _zero_crc(zlib.crc32(b"paDd"), pad)
+    return [_PNG_HEAD, struct.pack(">I", pad) + b"paDd", pad, struct.pack(">I", crc), _PNG_TAIL]
+
+
+def _jpeg_layout(size: int):
+    base = len(_JPEG_SOI_APP0) + len(_JPEG_BODY)
+    remaining = size - base
+    if remaining == 0:
+        return [_JPEG_SOI_APP0, _JPEG_BODY]
+    if remaining < _JPEG_COM_OVERHEAD:
+        raise ValueError(f"JPEG 无法生成 {size} 字节（最小 {base}，或不少于 {base + _JPEG_COM_OVERHEAD}）")
+
+    # 将 remaining 拆成若干个 [4, 65537] 之间的 COM 段
+    segments = -(-remaining // _JPEG_COM_MAX)
+    share, extra = divmod(remaining, segments)
+    layout = [_JPEG_SOI_APP0]
+    for i in range(segments):
+        segment_size = share + (1 if i < extra else 0)
+        layout.append(b"\xff\xfe" + struct.pack(">H", segment_size - 2))
+        layout.append(segment_size - _JPEG_COM_OVERHEAD)
+    layout.append(_JPEG_BODY)
+    return layout
+
+
+def _pdf_parts(pad: int):
+    """返回填充长度为 pad 时的 (头部, 尾部) 字节"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 200] >>",
+    ]
+    head = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(head))
+        head += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    offsets.append(len(head))
+    head += b"4 0 obj\n<< /Length %d >>\nstream\n" % pad
+
+    tail_start = len(head) + pad
+    tail = b"\nendstream\nendobj\n"
+    xref_offset = tail_start + len(tail)
+    xref = b"xref\n0 5\n0000000000 65535 f \n" + b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    tail += xref + b"trailer\n<< /Size 5 /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % xref_offset
+    return head, tail
+
+
+def _pdf_layout(size: int):
+    head, tail = _pdf_parts(0)
+    if size < len(head) + len(tail):
+        raise ValueError(f"PDF 无法生成 {size} 字节（最小 {len(head) + len(tail)}）")
+    # 头尾长度随 pad 的位数微调，迭代到总长度恰好等于 size
+    pad = size - len(head) - len(tail)
+    for _ in range(10):
+        head, tail = _pdf_parts(pad)
+        diff = size - (len(head) + pad + len(tail))
+        if diff == 0:
+            return [head, pad, tail]
+        pad += diff
+    raise ValueError(f"PDF 无法生成 {size} 字节")
+
+
+def _bmp_layout(size: int):
+    base = _BMP_HEADER_SIZE + len(_BMP_PIXELS)
+    gap = size - base
+    if gap < 0:
+        raise ValueError(f"BMP 无法生成 {size} 字节（最小 {base}）")
+    offset = _BMP_HEADER_SIZE + gap
+    file_header = b"BM" + struct.pack("<IHHI", size, 0, 0, offset)
+    info_header = struct.pack("<IiiHHIIiiII", 40, 1, 1, 1, 24, 0, len(_BMP_PIXELS), 2835, 2835, 0, 0)
+    return [file_header + info_header, gap, _BMP_PIXELS]
+
+
+_LAYOUTS = {
+    "png": _png_layout,
+    "jpeg": _jpeg_layout,
+    "jpg": _jpeg_layout,
+    "pdf": _pdf_layout,
+    "bmp": _bmp_layout,
+}
+
+
+def _write_layout(path: str, layout: list):
+    """按布局写文件：bytes 直接写入，int 表示该长度的 0 填充（seek 跳过形成稀疏区域）"""
+    with open(path, "wb") as f:
+        for part in layout:
+            if isinstance(part, int):
+                f.seek(part, os.SEEK_CUR)
+            else:
+                f.write(part)
+        f.truncate()
+
+
+def sized_file(file_format: str, size: int, cache_dir: str = SIZED_FILE_CACHE_DIR) -> str:
+    """
+    获取指定格式、恰好 size 字节的合法文件路径，不存在时生成
+
+    :param file_format: png / jpeg / jpg / pdf / bmp
+    :param size: 文件字节数
+    :param cache_dir: 缓存目录
+    :return: 文件绝对路径
+    """
+    file_format = file_format.lower()
+    if file_format not in _LAYOUTS:
+        raise ValueError(f"不支持的文件格式: {file_format}，可选: {', '.join(_LAYOUTS)}")
+
+    key = hashlib.sha256(f"{file_format}:{size}:{_FACTORY_VERSION}".encode()).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"{key}-{size}{SIZED_FILE_EXTENSIONS[file_format]}")
+    if os.path.exists(path) and os.path.getsize(path) == size:
+        return path
+
+    layout = _LAYOUTS[file_format](size)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+    os.close(fd)
+    try:
+        _write_layout(tmp_path, layout)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    logger.info(f"已生成 {size} 字节的 {file_format} 文件: {path}")
+    return path
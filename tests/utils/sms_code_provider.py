@@ -0,0 +1,193 @@
+"""
+短信验证码获取方式
+
+注册流程点击"获取验证码"后需要拿到验证码填入表单，这里提供统一接口与三种实现：
+    ssh_tail     原有方式，点击后通过 SSH 实时 tail catalina.out 等待验证码
+    incremental  复用同一个 SSH/SFTP 连接，点击前记录日志文件末尾位置，之后只读取新增内容
+    stub         通过路由拦截发送验证码请求，直接返回成功与固定验证码，不依赖服务器
+
+stub 方式只替代发送环节，适合前端校验类用例；需要后端真实校验验证码的完整注册流程，
+应配合 HAR 回放或使用前两种方式。
+"""
+import json
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from conf.config import (
+    SMS_CODE_PROVIDER,
+    SMS_CODE_TIMEOUT,
+    SMS_LOG_PATH,
+    SMS_LOG_SSH,
+    SMS_SEND_CODE_URL_PATTERN,
+    SMS_STUB_CODE,
+)
+from conf.logging_config import logger
+from tests.utils.validator import connect_ssh, extract_code_from_line, extract_verification_code_live
+
+
+class VerificationCodeProvider(ABC):
+    """验证码获取方式基类"""
+
+    def prepare(self, page, phone_number: str) -> None:
+        """点击"获取验证码"之前调用，用于安装拦截或记录日志位置"""
+
+    @abstractmethod
+    def get_code(self, phone_number: str) -> str | None:
+        """点击"获取验证码"之后调用，返回该手机号收到的验证码"""
+
+    def close(self) -> None:
+        """释放连接等资源"""
+
+
+class SSHTailCodeProvider(VerificationCodeProvider):
+    """每次获取验证码时新建 SSH 连接并 tail -f 日志"""
+
+    def __init__(self, ssh_config: dict = None, log_path: str = SMS_LOG_PATH, timeout: int = SMS_CODE_TIMEOUT):
+        self.ssh_config = ssh_config or SMS_LOG_SSH
+        self.log_path = log_path
+        self.timeout = timeout
+
+    def get_code(self, phone_number: str) -> str | None:
+        return extract_verification_code_live(
+            self.ssh_config["hostname"],
+            self.ssh_config["username"],
+            self.ssh_config["password"],
+            self.ssh_config["port"],
+            self.log_path,
+            phone_number,
+            timeout=self.timeout,
+        )
+
+
+class IncrementalLogCodeProvider(VerificationCodeProvider):
+    """
+    增量读取日志获取验证码
+
+    SSH/SFTP 连接在实例内复用；prepare 时记录日志文件当前大小，
+    get_code 只读取该位置之后新增的内容，日志被切割（文件变小）时从头读取。
+    """
+
+    def __init__(
+            self,
+            ssh_config: dict = None,
+            log_path: str = SMS_LOG_PATH,
+            timeout: int = SMS_CODE_TIMEOUT,
+            poll_interval: float = 0.5,
+    ):
+        self.ssh_config = ssh_config or SMS_LOG_SSH
+        self.log_path = log_path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._ssh = None
+        self._sftp = None
+        self._offsets = {}
+        self._lock = threading.Lock()
+
+    def _get_sftp(self):
+        if self._sftp is None:
+            self._ssh = connect_ssh(**self.ssh_config)
+            if self._ssh is None:
+                raise ConnectionError(f"无法连接日志服务器 {self.ssh_config['hostname']}")
+            self._sftp = self._ssh.open_sftp()
+        return self._sftp
+
+    def prepare(self, page, phone_number: str) -> None:
+        with self._lock:
+            self._offsets[phone_number] = self._get_sftp().stat(self.log_path).st_size
+
+    def _read_from(self, offset: int) -> tuple[str, int]:
+        """读取 offset 之后的新增内容，返回 (内容, 新的 offset)"""
+        with self._lock:
+            sftp = self._get_sftp()
+            size = sftp.stat(self.log_path).st_size
+            if size < offset:
+                logger.info("检测到日志文件被切割，从头读取")
+                offset = 0
+            if size == offset:
+                return "", offset
+            with sftp.file(self.log_path, "rb") as remote_file:
+                remote_file.seek(offset)
+                data = remote_file.read(size - offset)
+        return data.decode("utf-8", errors="replace"), offset + len(data)
+
+    def get_code(self, phone_number: str) -> str | None:
+        offset = self._offsets.pop(phone_number, None)
+        if offset is None:
+            offset = self._get_sftp().stat(self.log_path).st_size
+
+        pending = ""
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            chunk, offset = self._read_from(offset)
+            if chunk:
+                lines = (pending + chunk).split("\n")
+                pending = lines.pop()
+                for line in lines:
+                    code = extract_code_from_line(line, phone_number)
+                    if code:
+                        logger.info(f"找到验证码: {code}")
+                        return code
+            time.sleep(self.poll_interval)
+
+        logger.warning(f"超时({self.timeout}秒)未找到手机号 {phone_number} 的验证码")
+        return None
+
+    def close(self) -> None:
+        if self._sftp is not None:
+            self._sftp.close()
+            self._sftp = None
+        if self._ssh is not None:
+            self._ssh.close()
+            self._ssh = None
+
+
+class StubCodeProvider(VerificationCodeProvider):
+    """拦截发送验证码请求，立即返回成功与固定验证码"""
+
+    def __init__(self, code: str = SMS_STUB_CODE, url_pattern: str = SMS_SEND_CODE_URL_PATTERN):
+        self.code = code
+        self.url_pattern = re.compile(url_pattern)
+
+    def _handle(self, route):
+        logger.info(f"已拦截发送验证码请求: {route.request.url}")
+        route.fulfill(
+            status=200,
+            content_type="application/json",
+            body=json.dumps({"code": 200, "msg": "验证码发送成功"}, ensure_ascii=False),
+        )
+
+    def prepare(self, page, phone_number: str) -> None:
+        # 每次都先移除再安装：实例在进程内复用，不记录已拦截的页面，
+        # 页面被回收或路由被清除（例如页面池归还）后仍能保证请求被拦截
+        page.unroute(self.url_pattern, self._handle)
+        page.route(self.url_pattern, self._handle)
+
+    def get_code(self, phone_number: str) -> str | None:
+        return self.code
+
+
+_PROVIDER_CLASSES = {
+    "ssh_tail": SSHTailCodeProvider,
+    "incremental": IncrementalLogCodeProvider,
+    "stub": StubCodeProvider,
+}
+
+# 同一进程内按名称复用实例，增量方式的 SSH 连接可在多个用例间共享
+_providers = {}
+
+
+def create_code_provider(name: str = None) -> VerificationCodeProvider:
+    """
+    获取验证码提供方式实例
+
+    :param name: ssh_tail / incremental / stub，默认取 conf.SMS_CODE_PROVIDER
+    :return: VerificationCodeProvider 实例
+    """
+    name = name or SMS_CODE_PROVIDER
+    if name not in _PROVIDER_CLASSES:
+        raise ValueError(f"不支持的验证码获取方式: {name}，可选: {', '.join(_PROVIDER_CLASSES)}")
+    if name not in _providers:
+        _providers[name] = _PROVIDER_CLASSES[name]()
+    return _providers[name]
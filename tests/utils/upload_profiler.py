@@ -0,0 +1,174 @@
+"""
+上传耗时分析
+
+对一个文件上传控件执行一次上传，把耗时拆分为四个阶段：
+
+    - input_set：set_input_files 返回（文件传入浏览器、触发 change 事件）
+    - request_start：从开始上传到浏览器发出上传请求（前端校验、压缩等处理）
+    - response：上传请求发出到响应接收完毕（请求体传输与服务端处理）
+    - mask：响应完毕到“正在上传图片”遮罩消失（前端回显、预览渲染）
+
+请求阶段取自浏览器记录的 Request Timing，不受 Python 侧事件分发延迟影响。
+同一控件按文件类型、大小多次上传后，curve() 给出每个控件的 大小-耗时 曲线（各阶段取中位数）：
+
+    profiler = UploadProfiler(page)
+    profiler.profile("消防合格证明", file_input, sized_file("png", 1024 * 1024), "png", 1024 * 1024)
+    profiler.write_report(path)
+"""
+import statistics
+import threading
+import time
+
+from playwright.sync_api import Locator, Page
+
+from conf.logging_config import logger
+from tests.utils.page_utils import UPLOAD_LOADING_MASK_SELECTOR
+from tests.utils.perf_stats import write_json
+
+STAGES = ("input_set_ms", "request_start_ms", "response_ms", "mask_ms", "total_ms")
+# 业务成功码，响应 JSON 中 code 不在其中时记为失败
+_SUCCESS_CODES = (0, 200)
+
+
+def _is_upload_request(request) -> bool:
+    if request.method != "POST":
+        return False
+    content_type = request.headers.get("content-type", "")
+    return "multipart/form-data" in content_type or "upload" in request.url.lower()
+
+
+class UploadSample:
+    """一次上传的各阶段耗时"""
+
+    __slots__ = ("endpoint", "file_format", "size", "started") + STAGES + ("status", "ok", "error")
+
+    def __init__(self, endpoint: str, file_format: str, size: int, started: float):
+        self.endpoint = endpoint
+        self.file_format = file_format
+        self.size = size
+        self.started = started
+        for stage in STAGES:
+            setattr(self, stage, None)
+        self.status = None
+        self.ok = False
+        self.error = None
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class UploadProfiler:
+    """
+    逐次上传并记录阶段耗时
+
+    Args:
+        page: 已打开表单页面的 Page
+        timeout: 等待上传响应与遮罩消失的最长时间（毫秒）
+    """
+
+    def __init__(self, page: Page, timeout: float = 60000):
+        self.page = page
+        self.timeout = timeout
+        self.samples: list[UploadSample] = []
+        self._lock = threading.Lock()
+
+    def profile(self, endpoint: str, file_input: Locator, file_path: str, file_format: str,
+                size: int) -> UploadSample:
+        """
+        通过 file_input 上传 file_path 并记录耗时，失败不抛出异常，记录在 sample.error 中
+
+        :param endpoint: 上传控件名称，例如 "消防合格证明"
+        :param file_input: 控件内的 input[type=file]
+        """
+        sample = UploadSample(endpoint, file_format, size, time.time())
+        begin = sample.started * 1000
+        t0 = time.perf_counter()
+        try:
+            with self.page.expect_response(lambda r: _is_upload_request(r.request), timeout=self.timeout) as info:
+                file_input.set_input_files(file_path)
+                sample.input_set_ms = round((time.perf_counter() - t0) * 1000, 1)
+            response = info.value
+            response.finished()
+            received = time.time() * 1000
+
+            timing = response.request.timing
+            request_start = timing["startTime"]
+            response_end = request_start + timing["responseEnd"] if timing["responseEnd"] >= 0 else received
+            sample.request_start_ms = round(max(request_start - begin, 0), 1)
+            sample.response_ms = round(response_end - request_start, 1)
+
+            self.page.locator(UPLOAD_LOADING_MASK_SELECTOR).wait_for(state="hidden", timeout=self.timeout)
+            finished = time.time() * 1000
+            sample.mask_ms = round(max(finished - response_end, 0), 1)
+            sample.total_ms = round(finished - begin, 1)
+
+            sample.status = response.status
+            sample.error = self._response_error(response)
+            sample.ok = sample.error is None
+        except Exception as e:
+            sample.error = f"{type(e).__name__}: {e}"
+        if not sample.ok:
+            logger.warning(f"上传失败 [{endpoint} {file_format} {size}B]: {sample.error}")
+        with self._lock:
+            self.samples.append(sample)
+        return sample
+
+    @staticmethod
+    def _response_error(response) -> str | None:
+        if response.status >= 400:
+            return f"HTTP {response.status}"
+        try:
+            payload = response.json()
+        except Exception:
+            return None
+        code = payload.get("code") if isinstance(payload, dict) else None
+        if code is not None and code not in _SUCCESS_CODES:
+            return f"业务码 {code}: {payload.get('msg')}"
+        return None
+
+    # ------------------------------
+    # 汇总
+    # ------------------------------
+    def curve(self) -> dict:
+        """{控件: {文件类型: [按大小升序的 {size_bytes, count, errors, 各阶段中位数}]}}"""
+        with self._lock:
+            samples = list(self.samples)
+        groups = {}
+        for s in samples:
+            groups.setdefault(s.endpoint, {}).setdefault(s.file_format, {}).setdefault(s.size, []).append(s)
+
+        curve = {}
+        for endpoint, formats in groups.items():
+            curve[endpoint] = {}
+            for file_format, sizes in formats.items():
+                points = []
+                for size in sorted(sizes):
+                    ok = [s for s in sizes[size] if s.ok]
+                    point = {"size_bytes": size, "count": len(sizes[size]), "errors": len(sizes[size]) - len(ok)}
+                    for stage in STAGES:
+                        values = [getattr(s, stage) for s in ok]
+                        point[stage] = round(statistics.median(values), 1) if values else None
+                    points.append(point)
+                curve[endpoint][file_format] = points
+        return curve
+
+    def format_table(self) -> str:
+        """控制台输出用的曲线表"""
+        lines = []
+        for endpoint, formats in self.curve().items():
+            lines.append(endpoint)
+            lines.append("  类型".ljust(8) + "大小(KB)".rjust(10) + "".join(s.rjust(18) for s in STAGES) + "errors".rjust(8))
+            for file_format, points in formats.items():
+                for p in points:
+                    cells = ["-" if p[s] is None else str(p[s]) for s in STAGES]
+                    lines.append(f"  {file_format}".ljust(8) + str(p["size_bytes"] // 1024).rjust(10)
+                                 + "".join(c.rjust(18) for c in cells) + str(p["errors"]).rjust(8))
+        return "\n".join(lines)
+
+    def write_report(self, path: str, meta: dict = None) -> dict:
+        """写出 JSON 报告：运行参数、大小-耗时曲线以及全部原始样本"""
+        with self._lock:
+            samples = [s.to_dict() for s in self.samples]
+        report = {"meta": meta or {}, "curve": self.curve(), "samples": samples}
+        write_json(path, report)
+        return report
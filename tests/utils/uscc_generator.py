@@ -0,0 +1,133 @@
+"""
+统一社会信用代码生成与校验（GB 32100-2015）
+
+18 位结构：
+    第1位      登记管理部门代码（9 工商、5 民政、1 机构编制、Y 其他）
+    第2位      机构类别代码
+    第3-8位    登记管理机关行政区划码
+    第9-17位   主体标识码（组织机构代码，第17位为 GB 11714 校验码）
+    第18位     校验码
+"""
+import random
+from functools import lru_cache
+
+from tests.utils.id_card_validator import ID_REGION_CODES
+
+# 代码字符集，下标即字符代表的数值（不含 I、O、S、V、Z）
+USCC_CHARSET = "0123456789ABCDEFGHJKLMNPQRTUWXY"
+_USCC_VALUES = {c: i for i, c in enumerate(USCC_CHARSET)}
+# 前17位权重：3^(i) mod 31
+USCC_WEIGHTS = [1, 3, 9, 27, 19, 26, 16, 17, 20, 29, 25, 13, 8, 24, 10, 30, 28]
+
+# 组织机构代码本体8位的权重与字符取值（字母按 A=10 ... Z=35）
+ORG_WEIGHTS = [3, 7, 9, 10, 5, 8, 4, 2]
+_ORG_VALUES = {c: (int(c) if c.isdigit() else ord(c) - ord("A") + 10) for c in USCC_CHARSET}
+
+# 登记管理部门代码 + 机构类别代码
+USCC_CATEGORIES = ["91", "92", "93", "51", "52", "53", "11", "12", "13", "Y1"]
+
+# 反例类型
+INVALID_USCC_KINDS = (
+    "wrong_check",      # 第18位校验码错误
+    "wrong_org_check",  # 组织机构代码校验码错误（第18位按错误本体重新计算）
+    "illegal_char",     # 含 I/O/S/V/Z 等非法字符
+    "lowercase",        # 字母小写
+    "too_short",        # 17位
+    "too_long",         # 19位
+)
+
+
+@lru_cache(maxsize=None)
+def _prefix_sum(prefix: str) -> int:
+    """前8位（部门、类别、区划码）的加权和"""
+    return sum(_USCC_VALUES[c] * w for c, w in zip(prefix, USCC_WEIGHTS[:8]))
+
+
+def org_check_code(org_body: str) -> str:
+    """组织机构代码（8位本体）的校验码"""
+    remainder = 11 - sum(_ORG_VALUES[c] * w for c, w in zip(org_body, ORG_WEIGHTS)) % 11
+    if remainder == 10:
+        return "X"
+    if remainder == 11:
+        return "0"
+    return str(remainder)
+
+
+def uscc_check_code(body: str) -> str:
+    """前17位对应的第18位校验码"""
+    total = _prefix_sum(body[:8]) + sum(_USCC_VALUES[c] * w for c, w in zip(body[8:], USCC_WEIGHTS[8:]))
+    return USCC_CHARSET[(31 - total % 31) % 31]
+
+
+def validate_uscc(code: str) -> bool:
+    """校验统一社会信用代码的长度、字符集、组织机构代码校验码与第18位校验码"""
+    if len(code) != 18 or any(c not in _USCC_VALUES for c in code):
+        return False
+    if org_check_code(code[8:16]) != code[16]:
+        return False
+    return uscc_check_code(code[:17]) == code[17]
+
+
+def iter_uscc(count: int, seed=None, region_codes=None, categories=None):
+    """
+    逐个生成结构合法、校验码正确的统一社会信用代码
+
+    :param count: 生成数量
+    :param seed: 随机种子，相同种子得到相同序列
+    :param region_codes: 行政区划码列表，默认与身份证生成共用 ID_REGION_CODES
+    :param categories: 部门+类别代码列表，默认 USCC_CATEGORIES
+    """
+    rng = random.Random(seed)
+    regions = region_codes or ID_REGION_CODES
+    categories = categories or USCC_CATEGORIES
+    charset = USCC_CHARSET
+    random_ = rng.random
+
+    for _ in range(count):
+        prefix = categories[int(random_() * len(categories))] + regions[int(random_() * len(regions))]
+        org_body = "".join(rng.choices(charset, k=8))
+        body = prefix + org_body + org_check_code(org_body)
+        yield body + uscc_check_code(body)
+
+
+def generate_uscc_batch(count: int, seed=None) -> list[str]:
+    """批量生成统一社会信用代码"""
+    return list(iter_uscc(count, seed))
+
+
+def generate_uscc(seed=None) -> str:
+    """生成一个统一社会信用代码"""
+    return next(iter_uscc(1, seed))
+
+
+def make_invalid_uscc(kind: str, seed=None) -> str:
+    """
+    生成指定类型的非法统一社会信用代码，用于反向用例
+
+    :param kind: INVALID_USCC_KINDS 中的一种
+    :param seed: 随机种子
+    """
+    rng = random.Random(seed)
+    valid = generate_uscc(rng.random())
+
+    if kind == "wrong_check":
+        wrong = [c for c in USCC_CHARSET if c != valid[17]]
+        return valid[:17] + rng.choice(wrong)
+    if kind == "wrong_org_check":
+        wrong = [c for c in "0123456789X" if c != valid[16]]
+        body = valid[:16] + rng.choice(wrong)
+        return body + uscc_check_code(body)
+    if kind == "illegal_char":
+        position = rng.randrange(8, 16)
+        return valid[:position] + rng.choice("IOSVZ") + valid[position + 1:]
+    if kind == "lowercase":
+        letters = [i for i, c in enumerate(valid) if c.isalpha()]
+        if not letters:
+            return make_invalid_uscc(kind, rng.random())
+        position = rng.choice(letters)
+        return valid[:position] + valid[position].lower() + valid[position + 1:]
+    if kind == "too_short":
+        return valid[:17]
+    if kind == "too_long":
+        return valid + rng.choice(USCC_CHARSET)
+    raise ValueError(f"不支持的非法代码类型: {kind}，可选: {', '.join(INVALID_USCC_KINDS)}")
@@ -1,38 +1,19 @@
 import logging
-
-import paramiko
 import re
 import time
 from datetime import datetime, date
 
-from faker import Faker
-
 from conf.logging_config import logger
+from tests.utils.id_card_validator import validate_id_card
+from tests.utils.uscc_generator import generate_uscc
 
 import random
 
-# 确保 fake 在全局作用域中定义
-fake = Faker("zh_CN")
-
-def validate_id_card(id_card):
-    """验证身份证号码是否合法"""
-    if len(id_card) != 18:
-        return False
-
-    # 前17位权重系数
-    weights = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
-    # 校验码映射
-    check_code = ['1', '0', 'X', '9', '8', '7', '6', '5', '4', '3', '2']
-
-    # 计算前17位加权和
-    total = sum(int(id_card[i]) * weights[i] for i in range(17))
-    mod = total % 11
-    expected_check = check_code[mod]
-
-    return id_card[-1].upper() == expected_check
-
 
 def connect_ssh(hostname, username, password, port=22):
+    # paramiko 导入较慢，只在实际需要 SSH 时导入
+    import paramiko
+
     try:
         ssh = paramiko.SSHClient()
         ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
@@ -252,16 +233,6 @@ def extract_verification_code_live(hostname, username, password, port, log_path,
         if ssh:
             ssh.close()
 
-def generate_uscc():
-    """生成18位社会统一信用代码（模拟）"""
-    # 注：真实的USCC有校验规则，这里仅生成格式相似的随机码
-    # 前17位为数字和字母（不包含I、O、Z、S、V）
-    chars = '0123456789ABCDEFGHJKLMNPQRTUWXY'
-    uscc_prefix = ''.join(fake.random_choices(chars, length=17))
-    # 第18位为校验码（简化处理，随机生成）
-    check_code = fake.random_choices(chars, length=1)[0]
-    return uscc_prefix + check_code
-
 def generate_random_phone_number():
     """
     生成符合中国大陆规则的随机电话号码